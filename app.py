@@ -1,81 +1,282 @@
+import time
+
+# Awal run; waktu impor di bawah ini dicatat oleh profiling (lihat diabviz/perf.py)
+SCRIPT_STARTED = time.perf_counter()
+
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import warnings
-import time
+
+from diabviz import bootstrap, config, figures, perf, sampling, texts
+from diabviz.bitmap import FILTER_LABELS
+from diabviz.cube import prevalence
+from diabviz.incremental import LiveDataset
+from diabviz.ingest import StreamAggregates, aggregate_frame
+from diabviz.loader import MEMORY_TARGET_BYTES_PER_ROW, file_stat
+from diabviz.render import CHART_PRESETS, FigureCache, render_png, table_nbytes, theme_key
+from diabviz.scatter import POINT_BUDGET, binned_figure, webgl_figure, young_rows
+from diabviz.warmup import Warmup
 
 # Mengabaikan FutureWarning dari Matplotlib dan Seaborn
 warnings.filterwarnings('ignore', category=FutureWarning)
 
-# --- Pengaturan Tema Seaborn Global untuk Tampilan Modern ---
-# Menggunakan tema 'darkgrid' atau 'whitegrid' dengan palet warna yang modern
-sns.set_theme(style="whitegrid", palette="viridis", font_scale=1.1) 
-# Atau palette="deep", "pastel", "flare", "magma"
-
 # Konfigurasi Halaman Streamlit
 st.set_page_config(layout="wide", page_title="Analisis Data Diabetes")
 
-# Fungsi untuk memuat data dengan caching
-@st.cache
-def load_data(file_path):
-    """Memuat dataset diabetes dan melakukan pra-pemrosesan."""
-    
-    with st.spinner('Memuat dan memproses data...'):
-        time.sleep(1) # Simulasi jeda loading
-        try:
-            df = pd.read_csv(file_path)
-            
-            # Pra-pemrosesan data
-            age_bins = [0, 18, 30, 45, 60, 75, 90]
-            age_labels = ['0-17', '18-29', '30-44', '45-59', '60-74', '75+']
-            df['age_group'] = pd.cut(df['age'], bins=age_bins, labels=age_labels, right=False)
-
-            race_columns = ['race:AfricanAmerican', 'race:Asian', 'race:Caucasian', 'race:Hispanic', 'race:Other']
-            df_race = df[race_columns + ['diabetes']].melt(id_vars='diabetes', var_name='race', value_name='is_race')
-            df_race = df_race[df_race['is_race'] == 1].copy()
-            df_race['race'] = df_race['race'].str.replace('race:', '')
-            
-            # Menambahkan kolom 'year' jika belum ada (untuk Studi Kasus 10)
-            # Ini hanya contoh, sesuaikan jika dataset Anda memiliki kolom tanggal/tahun yang sebenarnya
-            if 'year' not in df.columns:
-                df['year'] = pd.to_datetime('2022-01-01').year # Kolom dummy jika tidak ada info tahun
-            
-            return df, df_race
-        except FileNotFoundError:
-            st.error("File 'diabetes_dataset.csv' tidak ditemukan. Pastikan file berada di direktori yang sama.")
-            return pd.DataFrame(), pd.DataFrame()
-
-# Path file dataset (ganti jika perlu)
-FILE_PATH = 'diabetes_dataset.csv'
-df, df_race = load_data(FILE_PATH)
+# Profiling per bagian (opt-in, DIABVIZ_PROFILE=1 atau ?profile=1, lihat diabviz/perf.py)
+PROFILE_RUN = perf.begin_run(config.PROFILE or st.query_params.get('profile') == '1', SCRIPT_STARTED)
+
+# Path file dataset dan mode ingesti (lihat diabviz/config.py)
+FILE_PATH = config.FILE_PATH
+FILE_STAT = file_stat(FILE_PATH)
+STREAMING = config.use_streaming(FILE_STAT)
+
+# Dataset dan agregatnya dibagi oleh semua sesi di proses ini sebagai objek yang tidak diubah di tempat.
+# Baris/file batch baru diingesti secara inkremental oleh `refresh()` (lihat diabviz/incremental.py).
+@perf.counted(st.cache_resource(show_spinner='Memuat dan memproses data...'))
+def live_dataset(file_path, streaming):
+    """Memuat dataset (penuh di memori atau per chunk) beserta agregat halaman."""
+    return LiveDataset(file_path, config.BATCH_DIR, streaming, config.CHUNK_ROWS, config.SHARED_STORE)
+
+# Loader di bawah ini dikunci dengan versi bagian agregat yang dipakai (`live.version(...)`),
+# sehingga data baru hanya menghitung ulang hasil yang benar-benar terpengaruh.
+# Hasilnya juga resource bersama (tanpa salinan per sesi) dan hanya dibaca oleh halaman.
+# Profil dataset untuk sidebar, hanya dihitung ulang saat ada baris baru
+@perf.counted(st.cache_resource(show_spinner=False, max_entries=4))
+def load_profile(version):
+    """Tabel ringkasan, info kolom, dan nilai kosong (lihat diabviz/profile.py)."""
+    profile = live_dataset(FILE_PATH, STREAMING).aggregates.profile
+    return {
+        'describe': profile.describe(),
+        'column_info': profile.column_info(),
+        'nulls': profile.null_counts(),
+        'bytes_per_row': profile.bytes_per_row(),
+    }
+
+# Filter silang: agregat halaman untuk kombinasi filter yang baru dipakai disimpan (lihat diabviz/bitmap.py)
+@perf.counted(st.cache_resource(show_spinner='Menerapkan filter...', max_entries=16))
+def load_selection(version, filters):
+    """Agregat halaman untuk baris yang lolos `filters` ((kolom, nilai-nilai), ...), tanpa profil dan sampel pratinjau."""
+    selected = live_dataset(FILE_PATH, STREAMING).select(filters)
+    return aggregate_frame(selected, config.CHUNK_ROWS, sample_rows=0, profile=False)
+
+# Mode pratinjau: agregat aproksimasi dari sampel berstrata (lihat diabviz/sampling.py)
+@perf.counted(st.cache_resource(show_spinner=False, max_entries=4))
+def load_sample_design(version):
+    """Desain sampel berstrata (baris sampel, strata, dan bobot) untuk estimasi."""
+    return live_dataset(FILE_PATH, STREAMING).aggregates.sample.design()
+
+@perf.counted(st.cache_resource(show_spinner=False, max_entries=16))
+def load_preview(version, filters):
+    """Agregat pratinjau untuk baris sampel yang lolos `filters`, dengan jumlah diskalakan ke populasi."""
+    design = load_sample_design(version)
+    return StreamAggregates.from_sample(design, design.mask(filters))
+
+def page_aggregates(filters, preview=False):
+    """Agregat seluruh data, atau agregat baris yang lolos `filters` jika ada filter aktif."""
+    live = live_dataset(FILE_PATH, STREAMING)
+    if preview:
+        return load_preview(live.version('rows'), filters)
+    if not filters:
+        return live.aggregates
+    return load_selection(live.version('rows'), filters)
+
+# Interval bootstrap prevalensi, dihitung sekali per versi kubus dan filter (lihat diabviz/bootstrap.py)
+@perf.counted(st.cache_resource(show_spinner='Menghitung interval bootstrap...', max_entries=32))
+def load_prevalence_intervals(version, filters, by):
+    """Prevalensi diabetes (%) per kategori `by` dengan interval bootstrap 95%."""
+    return bootstrap.prevalence_intervals(page_aggregates(filters).cube, by)
+
+@perf.counted(st.cache_resource(show_spinner='Menghitung interval bootstrap...', max_entries=16))
+def load_comorbidity_intervals(version, filters):
+    """Persentase komorbiditas di antara penderita diabetes dengan interval bootstrap 95%."""
+    return bootstrap.comorbidity_intervals(page_aggregates(filters).cube, figures.COMORBIDITY_LABELS)
+
+# Data Studi Kasus 11: baris usia 0–30 dan ringkasan level-of-detail-nya
+@perf.counted(st.cache_resource(show_spinner=False, max_entries=16))
+def load_young_rows(version, filters):
+    """Baris berusia 0–30 tahun, hanya kolom yang dipakai bubble chart (tidak tersedia di mode streaming)."""
+    live = live_dataset(FILE_PATH, STREAMING)
+    return young_rows(live.select(filters) if filters else live.frame)
+
+@perf.counted(st.cache_resource(show_spinner=False, max_entries=16))
+def load_scatter_summary(version, filters):
+    """Jumlah baris, grid agregat usia x BMI, dan sampel terstratifikasi (lihat diabviz/scatter.py)."""
+    scatter = page_aggregates(filters).scatter
+    if not scatter.n_rows:
+        return 0, None, None
+    return scatter.n_rows, scatter.cells(), scatter.sample()
+
+def sidebar_filters(index):
+    """Widget filter di sidebar; mengembalikan filter aktif sebagai ((kolom, nilai-nilai), ...)."""
+    filters = []
+    with st.sidebar.expander("🔎 Filter Data", expanded=False):
+        st.caption("Filter berlaku untuk semua chart. Kosong = semua nilai.")
+        for col, label in FILTER_LABELS.items():
+            if col not in index.columns:
+                continue
+            flag = col in ('hypertension', 'heart_disease')
+            values = st.multiselect(label, index.values(col), key=f'filter_{col}',
+                                    format_func=(lambda v: 'Ya' if v else 'Tidak') if flag else str)
+            if values:
+                filters.append((col, tuple(values)))
+    return tuple(filters)
+
+DATA_READY = FILE_STAT is not None
+if DATA_READY:
+    with perf.section('load_data'):
+        live = live_dataset(FILE_PATH, STREAMING)
+        live.refresh()
+
+    # Satu seleksi untuk semua chart di run ini (filter tidak tersedia di mode streaming)
+    filters = sidebar_filters(live.index) if live.index is not None else ()
+    PREVIEW = live.aggregates.sample.n_rows > 0 and st.sidebar.toggle(
+        "⚡ Mode Pratinjau (Sampel)", key='preview',
+        help=f"Chart dihitung dari sampel berstrata ±{config.PREVIEW_ROWS:,} baris (diabetes x lokasi x kelompok usia); "
+             "jumlah diskalakan ke seluruh data dan angka bersifat perkiraan.",
+    )
+    # Output chart: ukuran gambar dan chart native untuk mengurangi byte yang dikirim setiap rerun
+    CHART_PRESET = st.sidebar.selectbox(
+        "🖼️ Kualitas Chart", list(CHART_PRESETS), index=list(CHART_PRESETS).index(config.CHART_PRESET),
+        key='chart_preset', help="Preset DPI/ukuran gambar chart; 'hemat' dan 'svg' paling ringan untuk koneksi lambat.",
+    )
+    NATIVE_CHARTS = st.sidebar.toggle(
+        "📊 Chart Interaktif Ringan", config.NATIVE_CHARTS, key='native_charts',
+        help="Chart batang dan garis sederhana digambar di browser dari tabel kecil, bukan dikirim sebagai gambar.",
+    )
+    payload_note = st.sidebar.empty()
+    with perf.section('filter'):
+        aggregates = page_aggregates(filters, PREVIEW)
+    if not aggregates.n_rows:
+        st.sidebar.warning("Tidak ada baris yang cocok dengan filter; filter diabaikan.")
+        filters = ()
+        aggregates = page_aggregates(filters, PREVIEW)
+    cube = aggregates.cube
+else:
+    st.error("File 'diabetes_dataset.csv' tidak ditemukan. Pastikan file berada di direktori yang sama.")
+
+# Cache PNG dipakai bersama oleh semua sesi di proses ini
+@st.cache_resource
+def figure_cache():
+    return FigureCache()
+
+# Pre-render paralel semua chart statis di proses worker (lihat diabviz/warmup.py)
+@st.cache_resource
+def figure_warmup():
+    return Warmup(figure_cache(), config.WARMUP_WORKERS) if config.WARMUP_WORKERS else None
+
+def chart_key(chart_id, **params):
+    """Kunci cache PNG; berubah hanya jika versi bagian agregat sumber chart, filter, atau parameter chart berubah."""
+    source, _ = figures.FIGURES[chart_id]
+    return live.version(source), filters, PREVIEW, chart_id, tuple(sorted(params.items())), theme_key(), CHART_PRESET
+
+def warm_up_charts():
+    """Menjadwalkan render semua chart yang belum ada di cache untuk versi data saat ini.
+
+    Hanya untuk tampilan default (tanpa filter, bukan pratinjau) yang dibagi semua sesi;
+    kombinasi filter digambar saat chart-nya ditampilkan.
+    """
+    warmup = figure_warmup()
+    if warmup is None or filters or PREVIEW:
+        return
+    for chart_id in figures.FIGURES:
+        if NATIVE_CHARTS and chart_id in figures.NATIVE:
+            continue
+        warmup.submit(chart_key(chart_id), lambda: figures.spec(chart_id, aggregates), CHART_PRESETS[CHART_PRESET])
+
+def show_chart(chart_id, **params):
+    """Menampilkan chart dari cache gambar; figure hanya digambar jika belum ada di cache maupun di warm-up.
+
+    Jika chart interaktif ringan aktif, chart yang punya versi native dikirim sebagai tabel kecil.
+    """
+    with perf.section(chart_id):
+        native = figures.native_spec(chart_id, aggregates, **params) if NATIVE_CHARTS else None
+        if native is not None:
+            kind, args = native
+            perf.count_payload(chart_id, table_nbytes(args['data']))
+            (st.line_chart if kind == 'line' else st.bar_chart)(**args)
+            return
+        key = chart_key(chart_id, **params)
+        output = CHART_PRESETS[CHART_PRESET]
+        warmup = figure_warmup()
+        image = warmup.wait(key) if warmup is not None else None
+        if image is None:
+            image = render_png(figure_cache(), key, lambda: figures.draw(chart_id, aggregates, **params), output=output)
+        perf.count_payload(chart_id, len(image))
+        if output['format'] == 'svg':
+            st.image(image.decode(), width='stretch')
+        else:
+            # Sudah selebar maksimum st.image (lihat diabviz/render.py), jadi dikirim tanpa encode ulang
+            st.image(image, width='stretch', output_format='PNG')
+
+def show_plotly(name, fig):
+    """st.plotly_chart; ukuran JSON figure dihitung sebagai payload hanya jika profiling aktif (serialisasi ulang mahal)."""
+    if PROFILE_RUN is not None:
+        perf.count_payload(name, len(fig.to_json()))
+    st.plotly_chart(fig, width='stretch')
+
+def show_intervals(build, caption):
+    """Tabel interval kepercayaan 95% dari sampel berstrata; hanya di mode pratinjau."""
+    if not PREVIEW:
+        return
+    design = load_sample_design(live.version('rows'))
+    with st.expander("Interval Kepercayaan 95% (Mode Pratinjau)"):
+        st.caption(caption)
+        st.dataframe(build(design, design.mask(filters)))
+
+if DATA_READY:
+    with perf.section('warm_up'):
+        warm_up_charts()
+
+# Memeriksa data baru secara berkala tanpa menunggu interaksi pengguna
+@st.fragment(run_every=config.REFRESH_SECONDS or None)
+def watch_dataset():
+    if live.refresh():
+        st.rerun(scope='app')
+
+# Registry studi kasus: judul -> fungsi render. Dispatch ada di akhir halaman.
+CASE_STUDIES = {}
+
+def case_study(title):
+    """Decorator untuk mendaftarkan fungsi render sebuah studi kasus."""
+    def register(render):
+        CASE_STUDIES[title] = render
+        return render
+    return register
 
 # --- Judul dan Animasi ---
 st.title("🚀 Visualisasi Data Diabetes Interaktif")
 
-if not df.empty:
-    st.balloons() # Animasi balon
-    
+if DATA_READY:
     st.markdown("Aplikasi ini menyajikan Eksplorasi Data Awal (EDA) dan Studi Kasus Visualisasi dari dataset diabetes.")
 
     # --- Sidebar untuk Informasi Data ---
-    with st.sidebar:
+    with st.sidebar, perf.section('sidebar'):
         st.header("Konfigurasi Data")
         
+        if STREAMING:
+            st.caption(f"Mode streaming: {live.aggregates.n_rows:,} baris dibaca per chunk tanpa dimuat utuh ke memori.")
+        if filters:
+            st.caption(f"Filter aktif: {aggregates.n_rows:,} dari {live.aggregates.n_rows:,} baris.")
+        if PREVIEW:
+            st.caption(f"Mode pratinjau: chart dari sampel {len(load_sample_design(live.version('rows')).rows):,} baris, "
+                       "jumlah diskalakan ke seluruh data (perkiraan).")
+        watch_dataset()
+
+        profile = load_profile(live.version('rows'))
+
         if st.checkbox("Tampilkan Dataframe Mentah (Head)", False):
             st.subheader("5 Baris Pertama Data")
-            st.dataframe(df.head())
+            st.dataframe(aggregates.head)
         
         st.subheader("Statistik Ringkasan")
-        st.dataframe(df.describe().T)
+        st.dataframe(profile['describe'])
         
         with st.expander("Informasi Kolom (df.info())"):
-            buffer = pd.io.common.StringIO()
-            df.info(buf=buffer)
-            st.text(buffer.getvalue())
+            st.dataframe(profile['column_info'])
+            st.caption(f"Memori: {profile['bytes_per_row']:.1f} byte/baris (target ≤ {MEMORY_TARGET_BYTES_PER_ROW}).")
         
         with st.expander("Nilai Hilang (Null Values)"):
-            st.dataframe(df.isnull().sum().rename("Missing Values"))
+            st.dataframe(profile['nulls'].rename("Missing Values"))
 
     # --- Penjelasan Dataset Sebelum EDA ---
     st.header("📘 Tentang Dataset")
@@ -119,7 +320,7 @@ if not df.empty:
     | 16 | `diabetes` | Integer (Binary) | Status diabetes (1 = Menderita diabetes, 0 = Tidak) |
     | 17 | `age_group` | Category | Kelompok usia (hasil kategorisasi dari kolom age) |
 
-    **Catatan**: Dataset ini tidak memiliki nilai yang hilang (missing values) pada seluruh kolom.
+    **Catatan**: Dataset ini tidak memiliki nilai yang hilang (missing values) pada seluruh kolom. Saat dimuat, lima kolom `race:*` digabung menjadi satu kolom kategorikal `race`.
 
     ---
     """)
@@ -127,517 +328,323 @@ if not df.empty:
     # --- Bagian Visualisasi EDA Awal ---
     st.header("🔍 Visualisasi Data Awal (EDA)")
     
-    col1, col2 = st.columns(2)
+    with perf.section('eda'):
+        col1, col2 = st.columns(2)
     
-    with col1:
-        st.subheader("Distribusi Usia ")
-        fig, ax = plt.subplots(figsize=(9, 6)) # Ukuran lebih besar
-        sns.histplot(data=df, x='age', kde=True, ax=ax, bins=20, color=sns.color_palette("viridis")[0])
-        ax.set_title('Distribusi Usia', fontsize=16)
-        ax.set_xlabel('Usia', fontsize=12)
-        ax.set_ylabel('Frekuensi', fontsize=12)
-        sns.despine(left=True, bottom=True) # Menghilangkan spines
-        plt.tight_layout()
-        st.pyplot(fig)
+        with col1:
+            st.subheader("Distribusi Usia ")
+            show_chart('eda_age')
         
-        st.subheader("Korelasi BMI dan Tingkat Glukosa Darah")
-        corr_data = df[['bmi', 'blood_glucose_level']].corr()
-        fig, ax = plt.subplots(figsize=(5, 4))
-        sns.heatmap(corr_data, annot=True, cmap='Blues', vmin=-1, vmax=1, ax=ax)
-        ax.set_title("Correlation: BMI vs Blood Glucose Level", fontsize=14)
-        st.pyplot(fig)
-
-    with col2:
-        st.subheader("Distribusi Jenis Kelamin ")
-        fig, ax = plt.subplots(figsize=(9, 6))
-        sns.countplot(data=df, x='gender', ax=ax, palette='viridis')
-        ax.set_title('Distribusi Jenis Kelamin', fontsize=16)
-        ax.set_xlabel('Jenis Kelamin', fontsize=12)
-        ax.set_ylabel('Jumlah', fontsize=12)
-        # Menambahkan label count di atas bar
-        for p in ax.patches:
-            ax.annotate(f'{int(p.get_height())}', (p.get_x() + p.get_width() / 2., p.get_height()),
-                        ha='center', va='center', fontsize=10, color='black', xytext=(0, 5),
-                        textcoords='offset points')
-        sns.despine(left=True, bottom=True)
-        plt.tight_layout()
-        st.pyplot(fig)
+            st.subheader("Korelasi BMI dan Tingkat Glukosa Darah")
+            # Subset kolom mana pun dihitung dari co-moment yang sudah ada (lihat diabviz/correlation.py)
+            corr_columns = st.multiselect("Kolom Korelasi", aggregates.moments.columns,
+                                          default=figures.CORR_DEFAULT, key='corr_columns')
+            if len(corr_columns) < 2:
+                st.info("Pilih minimal dua kolom untuk matriks korelasi.")
+            elif corr_columns == figures.CORR_DEFAULT:
+                show_chart('eda_corr')
+            else:
+                show_chart('eda_corr', columns=tuple(corr_columns))
+
+        with col2:
+            st.subheader("Distribusi Jenis Kelamin ")
+            show_chart('eda_gender')
         
-        st.subheader("Perbandingan Glukosa Darah berdasarkan Status Diabetes")
-        fig, ax = plt.subplots(figsize=(9, 6))
-        sns.boxplot(data=df, x='diabetes', y='blood_glucose_level', ax=ax, palette='viridis')
-        ax.set_title('Tingkat Glukosa Darah Berdasarkan Status Diabetes', fontsize=16)
-        ax.set_xlabel('Status Diabetes (0: Tidak, 1: Ya)', fontsize=12)
-        ax.set_ylabel('Tingkat Glukosa Darah', fontsize=12)
-        ax.set_xticklabels(['Tidak Diabetes', 'Diabetes'])
-        sns.despine(left=True, bottom=True)
-        plt.tight_layout()
-        st.pyplot(fig)
+            st.subheader("Perbandingan Glukosa Darah berdasarkan Status Diabetes")
+            show_chart('eda_glucose_box')
 
     # --- Bagian Study Case Visualizations & Penjelasan ---
     st.markdown("---")
     st.header("🔬 Studi Kasus dan Penjelasan Visualisasi")
     
-    tab_titles = [
-        "Kasus 1: Usia", "Kasus 2: J. Kelamin", "Kasus 3: Lokasi", "Kasus 4: Ras", 
-        "Kasus 5: Merokok", "Kasus 6: BMI", "Kasus 7: HbA1c", "Kasus 8: Glukosa vs Usia", 
-        "Kasus 9: Komorbiditas", "Kasus 10: Tren Tahunan", "Kasus 11: Kasus 11: Hubungan BMI, Usia, dan Gula Darah" 
-    ]
-    tabs = st.tabs(tab_titles)
-    
     # --- Study Case 1: Usia ---
-    with tabs[0]:
+    @case_study("Kasus 1: Usia")
+    def case_1_age():
         col_vis, col_text = st.columns([2, 1])
         with col_vis:
             st.subheader("Studi Kasus 1: Distribusi Kasus Diabetes di Berbagai Kelompok Usia")
-            fig, ax = plt.subplots(figsize=(10, 6))
-
-            # Filter dataframe untuk hanya menyertakan kasus diabetes (diabetes = 1)
-            df_diabetes = df[df['diabetes'] == 1]
-
-            # plot utama - hanya kasus diabetes
-            sns.histplot(
-                data=df_diabetes,
-                x='age', 
-                kde=True, 
-                ax=ax, 
-                bins=25, 
-                color='red', 
-                legend=False 
-            )
 
-            ax.set_title('Distribusi Usia Individu dengan Status Diabetes', fontsize=16)
-            ax.set_xlabel('Usia', fontsize=12)
-            ax.set_ylabel('Frekuensi', fontsize=12)
-
-            sns.despine(left=True, bottom=True)
-            plt.tight_layout()
-            st.pyplot(fig)
+            # Hanya kasus diabetes (diabetes = 1)
+            show_chart('case1_age')
 
         with col_text:
             st.subheader("Penjelasan")
-            st.markdown("""
-            Visualisasi menunjukkan konsentrasi tertinggi kasus diabetes berada pada kelompok usia yang lebih tua, mengonfirmasi kembali bahwa **usia lanjut adalah faktor risiko yang dominan** dalam dataset ini. Kurva kepadatan (KDE) yang tumpang tindih memberikan estimasi bentuk distribusi probabilitas usia untuk populasi penderita diabetes.
-            """)
+            st.markdown(texts.CASE_1)
     
     # --- Study Case 2: Gender ---
-    with tabs[1]:
+    @case_study("Kasus 2: J. Kelamin")
+    def case_2_gender():
         st.subheader("Studi Kasus 2: Hubungan Jenis Kelamin dengan Prevalensi Hipertensi dan Penyakit Jantung")
         col_hpt, col_hdt = st.columns(2)
         
         with col_hpt:
-            fig, ax = plt.subplots(figsize=(8, 5))
-            sns.countplot(data=df, x='gender', hue='hypertension', ax=ax, palette='viridis')
-            ax.set_title('Prevalensi Hipertensi berdasarkan Jenis Kelamin', fontsize=14)
-            ax.set_xlabel('Jenis Kelamin', fontsize=12)
-            ax.set_ylabel('Jumlah', fontsize=12)
-            for p in ax.patches:
-                ax.annotate(f'{int(p.get_height())}', (p.get_x() + p.get_width() / 2., p.get_height()),
-                            ha='center', va='center', fontsize=9, color='black', xytext=(0, 3),
-                            textcoords='offset points')
-            ax.legend(title='Hipertensi', labels=['Tidak', 'Ya'], loc='upper right')
-            sns.despine(left=True, bottom=True)
-            plt.tight_layout()
-            st.pyplot(fig)
+            show_chart('case2_hypertension')
             
         with col_hdt:
-            fig, ax = plt.subplots(figsize=(8, 5))
-            sns.countplot(data=df, x='gender', hue='heart_disease', ax=ax, palette='viridis')
-            ax.set_title('Prevalensi Penyakit Jantung berdasarkan Jenis Kelamin', fontsize=14)
-            ax.set_xlabel('Jenis Kelamin', fontsize=12)
-            ax.set_ylabel('Jumlah', fontsize=12)
-            for p in ax.patches:
-                ax.annotate(f'{int(p.get_height())}', (p.get_x() + p.get_width() / 2., p.get_height()),
-                            ha='center', va='center', fontsize=9, color='black', xytext=(0, 3),
-                            textcoords='offset points')
-            ax.legend(title='Penyakit Jantung', labels=['Tidak', 'Ya'], loc='upper right')
-            sns.despine(left=True, bottom=True)
-            plt.tight_layout()
-            st.pyplot(fig)
+            show_chart('case2_heart_disease')
             
         st.subheader("Penjelasan")
-        st.markdown("""
-        Visualisasi untuk Studi Kasus 2 yang menampilkan prevalensi hipertensi dan penyakit jantung berdasarkan gender menunjukkan bahwa dalam dataset ini, individu pria memiliki jumlah kasus hipertensi yang secara signifikan lebih tinggi dan juga jumlah kasus penyakit jantung yang lebih banyak dibandingkan dengan individu wanita; ini mengindikasikan adanya korelasi yang jelas antara gender pria dan peningkatan prevalensi kedua kondisi kesehatan ini dalam data yang diamati.
-        """)
+        st.markdown(texts.CASE_2)
 
-# --- Study Case 3: Lokasi ---
-    with tabs[2]:
+    # --- Study Case 3: Lokasi ---
+    @case_study("Kasus 3: Lokasi")
+    def case_3_location():
         col_vis, col_text = st.columns([2, 1])
         with col_vis:
             st.subheader("Studi Kasus 3: Pola Geografis dalam Distribusi Kasus Diabetes")
             
-            # Filter hanya pasien diabetes
-            df_diabetes_location = df[df['diabetes'] == 1]
-            
-            # Hitung jumlah kasus per lokasi dan sort
-            location_counts = df_diabetes_location['location'].value_counts().sort_values(ascending=True)
-            
-            # Buat color map - gradasi dari kuning ke merah
-            from matplotlib.colors import LinearSegmentedColormap
-            colors_gradient = ['#fff5e6', '#ffe0b3', '#ffcc80', '#ff9933', '#ff6600', '#cc0000']
-            n_bins = 100
-            cmap = LinearSegmentedColormap.from_list('yellow_red', colors_gradient, N=n_bins)
-            
-            # Normalisasi nilai untuk color mapping
-            norm_values = (location_counts.values - location_counts.values.min()) / (location_counts.values.max() - location_counts.values.min())
-            bar_colors = [cmap(val) for val in norm_values]
+            # Hitung jumlah kasus per lokasi (hanya pasien diabetes) dan sort
+            location_counts = figures.diabetic_location_counts(cube)
+            if location_counts.empty:
+                st.warning("Tidak ada penderita diabetes pada data yang difilter.")
+                return
             
-            fig, ax = plt.subplots(figsize=(14, 8))
-            bars = ax.barh(range(len(location_counts)), location_counts.values, color=bar_colors, edgecolor='black', linewidth=0.5)
-            
-            ax.set_yticks(range(len(location_counts)))
-            ax.set_yticklabels(location_counts.index, fontsize=9)
-            ax.set_xlabel('Jumlah Kasus Diabetes', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Lokasi', fontsize=12, fontweight='bold')
-            ax.set_title('Distribusi Kasus Diabetes berdasarkan Lokasi', fontsize=16, fontweight='bold', pad=20)
-            
-            # Tambahkan nilai di ujung bar
-            for i, (count, bar) in enumerate(zip(location_counts.values, bars)):
-                ax.text(count + 1, i, f'{count}', va='center', fontsize=8, fontweight='bold')
-            
-            # Tambahkan colorbar untuk referensi
-            sm = plt.cm.ScalarMappable(cmap=cmap, norm=plt.Normalize(vmin=location_counts.values.min(), vmax=location_counts.values.max()))
-            sm.set_array([])
-            cbar = plt.colorbar(sm, ax=ax, pad=0.02)
-            cbar.set_label('Intensitas Kasus', rotation=270, labelpad=20, fontsize=10)
-            
-            sns.despine(left=True, bottom=True)
-            plt.tight_layout()
-            st.pyplot(fig)
+            show_chart('case3_location')
         
         with col_text:
             st.subheader("Penjelasan")
-            max_location = location_counts.index[-1]
-            max_count = location_counts.values[-1]
-            min_location = location_counts.index[0]
-            min_count = location_counts.values[0]
-            
-            st.markdown(f"""
-            Visualisasi ini menunjukkan distribusi kasus diabetes di berbagai lokasi (negara bagian). Dari plot ini, jelas terlihat bahwa jumlah kasus diabetes sangat bervariasi di setiap lokasi, menunjukkan adanya pola geografis dalam prevalensi diabetes. Berdasarkan analisis data yang telah dilakukan, Delaware adalah lokasi dengan jumlah kasus diabetes terbanyak, yaitu sebanyak 200 kasus. Ini mengindikasikan bahwa prevalensi diabetes paling tinggi dalam dataset ini ditemukan di Delaware.
-            
-            Visualisasi ini menampilkan **hanya pasien yang menderita diabetes** di berbagai lokasi (negara bagian) dengan sistem gradasi warna:
-            
-            - 🟡 **Warna Kuning Muda**: Lokasi dengan kasus diabetes lebih sedikit
-            - 🟠 **Warna Oranye**: Lokasi dengan kasus diabetes sedang
-            - 🔴 **Warna Merah**: Lokasi dengan kasus diabetes paling banyak
-            
-            **Temuan Utama:**
-            - **{max_location}** memiliki kasus diabetes tertinggi dengan **{max_count} kasus** (bar paling merah)
-            - **{min_location}** memiliki kasus diabetes terendah dengan **{min_count} kasus** (bar paling kuning muda)
-            
-            """)
+            st.markdown(texts.case_3(location_counts))
+            show_intervals(sampling.location_count_intervals, "Perkiraan jumlah penderita diabetes per lokasi.")
 
     # --- Study Case 4: Ras ---
-    with tabs[3]:
+    @case_study("Kasus 4: Ras")
+    def case_4_race():
         col_vis, col_text = st.columns([2, 1])
         with col_vis:
             st.subheader("Studi Kasus 4: Korelasi Ras dengan Prevalensi Diabetes")
 
-            if not df_race.empty:
-                # Hitung jumlah kasus per ras dan status diabetes
-                race_counts = df_race.groupby(['race', 'diabetes']).size().reset_index(name='count')
-
-                # Pastikan urutan ras tetap konsisten
-                races = race_counts['race'].unique()
-
-                # Buat subplot untuk tiap ras
-                fig, axes = plt.subplots(
-                    nrows=2, ncols=3, figsize=(12, 8),
-                    subplot_kw=dict(aspect='equal')
-                )
-                axes = axes.flatten()
-
-                colors = sns.color_palette('viridis', n_colors=2)
-                labels = ['Tidak Diabetes', 'Diabetes']
-
-                for i, race in enumerate(races):
-                    data = race_counts[race_counts['race'] == race]
-                    values = data['count'].values
-
-                    if len(values) < 2:
-                        # Jika data tidak lengkap (misal hanya 1 kategori)
-                        values = [values[0], 0]
+            # Hitung jumlah kasus per ras dan status diabetes (kolom 0/1 selalu ada)
+            race_counts = figures.race_diabetes_counts(cube)
 
-                    axes[i].pie(
-                        values,
-                        labels=labels,
-                        autopct='%1.1f%%',
-                        startangle=90,
-                        colors=colors,
-                        textprops={'fontsize': 10}
-                    )
-                    axes[i].set_title(race, fontsize=12)
-
-                # Hapus subplot kosong kalau jumlah ras < jumlah subplot
-                for j in range(len(races), len(axes)):
-                    fig.delaxes(axes[j])
-
-                fig.suptitle('Proporsi Diabetes vs Tidak Diabetes per Ras', fontsize=16)
-                plt.tight_layout()
-                st.pyplot(fig)
+            if not race_counts.empty:
+                show_chart('case4_race')
 
             else:
                 st.warning("Data ras tidak tersedia atau kosong setelah pemrosesan.")
 
         with col_text:
             st.subheader("Penjelasan")
-            st.markdown("""
-            Visualisasi ini menampilkan diagram lingkaran (pie chart) untuk masing-masing ras,
-            membandingkan proporsi individu dengan diabetes dan tanpa diabetes.
-            Setiap lingkaran merepresentasikan satu kelompok ras:
-            - Warna biru mewakili individu tanpa diabetes  
-            - Warna hijau menunjukkan individu dengan diabetes  
-
-            Dari grafik terlihat bahwa proporsi penderita diabetes relatif kecil (<10%) di semua ras,
-            dengan prevalensi tertinggi pada AfricanAmerican (8.74%) dan terendah pada Other (8.21%).
-            Hal ini menunjukkan bahwa meskipun ada perbedaan antar ras, tingkat prevalensinya tetap cukup seragam.
-            """)
+            race_prev = prevalence(cube, 'race') * 100
+            # Mode pratinjau memakai interval dari desain sampel (show_intervals), bukan bootstrap
+            intervals = None if PREVIEW else load_prevalence_intervals(live.version('cube'), filters, 'race')
+            st.markdown(texts.case_4(race_prev, intervals))
+            show_intervals(sampling.race_prevalence_intervals, "Perkiraan prevalensi diabetes (%) per ras.")
+            if not PREVIEW:
+                with st.expander("Prevalensi Diabetes per Kelompok (Bootstrap)"):
+                    by = st.selectbox("Kelompokkan berdasarkan", list(bootstrap.GROUPINGS),
+                                      format_func=bootstrap.GROUPINGS.get, key='prevalence_by')
+                    st.dataframe(load_prevalence_intervals(live.version('cube'), filters, by))
+                    st.caption(f"Prevalensi diabetes (%) dengan interval persentil 95% dari "
+                               f"{config.BOOTSTRAP_RESAMPLES:,} resample bootstrap.")
 
 
 
     # --- Study Case 5: Merokok ---
-    with tabs[4]:
+    @case_study("Kasus 5: Merokok")
+    def case_5_smoking():
         col_vis, col_text = st.columns([2, 1])
         with col_vis:
             st.subheader("Studi Kasus 5: Hubungan Riwayat Merokok dan Diabetes")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            sns.countplot(data=df, x='smoking_history', hue='diabetes', ax=ax, palette='viridis')
-            ax.set_title('Distribusi Riwayat Merokok berdasarkan Status Diabetes', fontsize=16)
-            ax.set_xlabel('Riwayat Merokok', fontsize=12)
-            ax.set_ylabel('Jumlah Kasus', fontsize=12)
-            ax.set_xticklabels(ax.get_xticklabels(), rotation=45, ha='right', fontsize=10)
-            ax.legend(title='Diabetes', labels=['Tidak', 'Ya'], loc='upper right')
-            sns.despine(left=True, bottom=True)
-            plt.tight_layout()
-            st.pyplot(fig)
+            show_chart('case5_smoking')
         
         with col_text:
             st.subheader("Penjelasan")
-            st.markdown("""
-            Visualisasi menunjukkan distribusi riwayat merokok berdasarkan status diabetes. Mayoritas individu, baik penderita maupun non-penderita diabetes, berada pada kategori never dan No Info. Sementara itu, kategori current dan former memiliki jumlah jauh lebih sedikit. Secara keseluruhan, perbedaan antar kategori kecil, sehingga riwayat merokok tidak tampak berpengaruh signifikan terhadap kejadian diabetes.
-            """)
+            st.markdown(texts.CASE_5)
 
     # --- Study Case 6: BMI ---
-    with tabs[5]:
+    @case_study("Kasus 6: BMI")
+    def case_6_bmi():
         col_vis, col_text = st.columns([2, 1])
         with col_vis:
             st.subheader("Studi Kasus 6: Bagaimana BMI mempengaruhi kemungkinan menderita diabetes")
-            fig, ax = plt.subplots(figsize=(9, 6))
-            sns.boxplot(data=df, x='diabetes', y='bmi', ax=ax, palette='viridis')
-            ax.set_title('Distribusi BMI berdasarkan Status Diabetes', fontsize=16)
-            ax.set_xlabel('Status Diabetes (0: Tidak, 1: Ya)', fontsize=12)
-            ax.set_ylabel('BMI', fontsize=12)
-            ax.set_xticklabels(['Tidak Diabetes', 'Diabetes'])
-            sns.despine(left=True, bottom=True)
-            plt.tight_layout()
-            st.pyplot(fig)
+            show_chart('case6_bmi_box')
         
         with col_text:
             st.subheader("Penjelasan")
-            st.markdown("""
-            Visualisasi box plot terlihat bahwa individu dengan diabetes cenderung memiliki BMI lebih tinggi dibandingkan dengan individu yang tidak menderita diabetes. Median BMI pada kelompok penderita diabetes juga lebih besar, menunjukkan bahwa berat badan berlebih atau obesitas mungkin berhubungan dengan meningkatnya risiko diabetes. Selain itu, kedua kelompok memiliki beberapa outlier dengan nilai BMI sangat tinggi, namun pola umumnya tetap menunjukkan bahwa semakin tinggi BMI, semakin besar kemungkinan seseorang memiliki diabetes.
-            """)
+            st.markdown(texts.CASE_6)
 
     # --- Study Case 7: HbA1c ---
-    with tabs[6]:
+    @case_study("Kasus 7: HbA1c")
+    def case_7_hba1c():
         col_vis, col_text = st.columns([2, 1])
         with col_vis:
             st.subheader("Studi Kasus 7: Distribusi Tingkat HbA1c pada Individu dengan dan tanpa Diabetes")
-            fig, ax = plt.subplots(figsize=(9, 6))
-            sns.boxplot(data=df, x='diabetes', y='hbA1c_level', ax=ax, palette='viridis')
-            ax.set_title('Distribusi Tingkat HbA1c berdasarkan Status Diabetes', fontsize=16)
-            ax.set_xlabel('Status Diabetes (0: Tidak, 1: Ya)', fontsize=12)
-            ax.set_ylabel('Tingkat HbA1c', fontsize=12)
-            ax.set_xticklabels(['Tidak Diabetes', 'Diabetes'])
-            sns.despine(left=True, bottom=True)
-            plt.tight_layout()
-            st.pyplot(fig)
+            show_chart('case7_hba1c_box')
         
         with col_text:
             st.subheader("Penjelasan")
-            st.markdown("""
-            Visualisasi box plot tingkat HbA1c menunjukkan individu dengan diabetes memiliki nilai HbA1c yang secara signifikan lebih tinggi dibandingkan individu tanpa diabetes. Median HbA1c pada kelompok penderita diabetes berada di sekitar 6.5–7, sedangkan pada kelompok tanpa diabetes berada di bawah 6. Hal ini menunjukkan adanya perbedaan yang jelas antara kedua kelompok, di mana kenaikan kadar HbA1c berhubungan kuat dengan adanya diabetes.
-            """)
+            st.markdown(texts.CASE_7)
 
     # --- Study Case 8: Glukosa vs Usia ---
-    with tabs[7]:
+    @case_study("Kasus 8: Glukosa vs Usia")
+    def case_8_glucose_age():
         col_vis, col_text = st.columns([2, 1])
         with col_vis:
             st.subheader("Studi Kasus 8: Variasi Tingkat Glukosa Darah berdasarkan Kelompok Usia")
-            fig, ax = plt.subplots(figsize=(12, 6))
-            sns.boxplot(data=df, x='age_group', y='blood_glucose_level', ax=ax, palette='viridis')
-            ax.set_title('Distribusi Tingkat Glukosa Darah berdasarkan Kelompok Usia', fontsize=16)
-            ax.set_xlabel('Kelompok Usia', fontsize=12)
-            ax.set_ylabel('Tingkat Glukosa Darah', fontsize=12)
-            sns.despine(left=True, bottom=True)
-            plt.tight_layout()
-            st.pyplot(fig)
+            show_chart('case8_glucose_age_box')
         
         with col_text:
             st.subheader("Penjelasan")
-            st.markdown("""
-            Visualisasi box plot tingkat glukosa darah berdasarkan kelompok usia menunjukkan bahwa rata-rata kadar glukosa darah cenderung meningkat seiring bertambahnya usia, terutama mulai pada kelompok umur 60–74 tahun. Meskipun median kadar glukosa antar kelompok tidak berbeda terlalu jauh, kelompok usia yang lebih tua menunjukkan peningkatan nilai minimum dan median serta lebih banyak outlier dengan kadar glukosa tinggi. Hal ini mengindikasikan bahwa risiko kadar gula darah tinggi (hiperglikemia) lebih umum terjadi pada usia lanjut dibandingkan usia muda.
-            """)
+            st.markdown(texts.CASE_8)
 
     # --- Study Case 9: Komorbiditas ---
-    import numpy as np
-    with tabs[8]:
+    @case_study("Kasus 9: Komorbiditas")
+    def case_9_comorbidity():
         col_vis, col_text = st.columns([2, 1])
         
         with col_vis:
             st.subheader("Studi Kasus 9: Analisis Komorbiditas pada Penderita Diabetes")
 
-            # Filter hanya penderita diabetes
-            diab = df[df['diabetes'] == 1]
-
-            # Data untuk radial bar
-            labels = ['Hipertensi', 'Penyakit Jantung', 'Perokok Aktif']
-            sizes = [
-                diab['hypertension'].mean() * 100,
-                diab['heart_disease'].mean() * 100,
-                diab['smoking_history'].value_counts(normalize=True).get('current', 0) * 100
-            ]
-
-            # Setup polar chart
-            angles = np.linspace(0, 2 * np.pi, len(sizes), endpoint=False)
-            fig, ax = plt.subplots(subplot_kw={'polar': True}, figsize=(7, 6))
-            bars = ax.bar(
-                angles,
-                sizes,
-                width=0.8,
-                color=sns.color_palette("viridis", len(sizes)),
-                alpha=0.75,
-                edgecolor='black'
-            )
+            # Data untuk radial bar (hanya penderita diabetes)
+            sizes = figures.comorbidity_shares(cube)
 
-            # Label & styling
-            ax.set_xticks(angles)
-            ax.set_xticklabels(labels, fontsize=11)
-            ax.set_yticklabels([])
-            ax.set_title("Radial Bar Komorbiditas pada Penderita Diabetes", fontsize=15, pad=20)
-            ax.set_ylim(0, max(sizes) + 10)
-
-            # Tambahkan nilai persentase di atas bar
-            for angle, size in zip(angles, sizes):
-                ax.text(angle, size + 3, f"{size:.1f}%", ha='center', va='bottom', fontsize=10, fontweight='bold')
-
-            plt.tight_layout()
-            st.pyplot(fig)
+            show_chart('case9_comorbidity')
 
         with col_text:
             st.subheader("Penjelasan")
-            st.markdown("""
-            Visualisasi ini menggunakan *radial bar chart* untuk menggambarkan tiga komorbiditas utama pada individu penderita diabetes:
-
-            - *Hipertensi:* ~{:.1f}% dari penderita diabetes juga memiliki hipertensi  
-            - *Penyakit Jantung:* ~{:.1f}% memiliki penyakit jantung  
-            - *Perokok Aktif:* ~{:.1f}% memiliki riwayat merokok aktif  
-
-            Grafik ini menyoroti bagaimana ketiga faktor tersebut saling beririsan dengan kondisi diabetes. Terlihat bahwa hipertensi menjadi komorbiditas paling umum, diikuti oleh penyakit jantung, sedangkan proporsi perokok aktif relatif lebih kecil.
-            """.format(sizes[0], sizes[1], sizes[2]))
+            intervals = None if PREVIEW else load_comorbidity_intervals(live.version('cube'), filters)
+            st.markdown(texts.case_9(sizes, intervals))
+            show_intervals(lambda design, mask: sampling.comorbidity_intervals(design, mask, figures.COMORBIDITY_LABELS),
+                           "Perkiraan persentase di antara penderita diabetes.")
             
     # --- Study Case 10: Tren Tahunan ---
-    with tabs[9]:
+    @case_study("Kasus 10: Tren Tahunan")
+    def case_10_yearly_trend():
         st.subheader("Studi Kasus 10: Tren Rata-rata BMI dan Kadar HbA1c dari Tahun ke Tahun")
         
-        if 'year' in df.columns:
-            df_yearly_trends = df.groupby('year').agg({
-                'bmi': 'mean',
-                'hbA1c_level': 'mean'
-            }).reset_index()
+        if aggregates.yearly.years:
+            # Rentang tahun hanya membaca partisi tahun di rentang itu (lihat diabviz/partitions.py)
+            years = aggregates.yearly.years
+            params = {}
+            if len(years) > 1:
+                lo, hi = st.select_slider("Rentang Tahun", options=years, value=(years[0], years[-1]), key='case10_years')
+                if (lo, hi) != (years[0], years[-1]):
+                    params['years'] = (lo, hi)
 
             col_bmi, col_hba1c = st.columns(2)
             
             with col_bmi:
-                fig, ax = plt.subplots(figsize=(10, 5))
-                sns.lineplot(data=df_yearly_trends, x='year', y='bmi', marker='o', ax=ax, color=sns.color_palette("viridis")[0], linewidth=2.5)
-                ax.set_title('Tren Rata-rata BMI dari Tahun ke Tahun', fontsize=16)
-                ax.set_xlabel('Tahun', fontsize=12)
-                ax.set_ylabel('Rata-rata BMI', fontsize=12)
-                sns.despine(left=True, bottom=True)
-                plt.tight_layout()
-                st.pyplot(fig)
+                show_chart('case10_bmi_trend', **params)
                 
             with col_hba1c:
-                fig, ax = plt.subplots(figsize=(10, 5))
-                sns.lineplot(data=df_yearly_trends, x='year', y='hbA1c_level', marker='o', ax=ax, color=sns.color_palette("viridis")[1], linewidth=2.5)
-                ax.set_title('Tren Rata-rata HbA1c dari Tahun ke Tahun', fontsize=16)
-                ax.set_xlabel('Tahun', fontsize=12)
-                ax.set_ylabel('Rata-rata HbA1c Level', fontsize=12)
-                sns.despine(left=True, bottom=True)
-                plt.tight_layout()
-                st.pyplot(fig)
+                show_chart('case10_hba1c_trend', **params)
+
+            with st.expander("Ringkasan per Tahun"):
+                st.dataframe(aggregates.yearly.summary(params.get('years')))
                 
             st.subheader("Penjelasan")
-            st.markdown("""
-            Visualisasi line plot rata-rata BMI dan HbA1c dari tahun ke tahun menunjukkan tren rata-rata BMI dan HbA1c level dari tahun 2015 hingga 2022. Grafik pertama memperlihatkan bahwa rata-rata BMI cenderung fluktuatif, mengalami sedikit peningkatan hingga 2021 sebelum menurun tajam pada 2022. Sementara itu, grafik kedua menunjukkan bahwa rata-rata HbA1c level relatif stabil dari 2015 sampai 2019, kemudian menurun pada 2020–2021, dan meningkat cukup signifikan pada 2022. Secara keseluruhan, kedua grafik memberikan gambaran mengenai perubahan pola kesehatan (berdasarkan BMI dan kadar gula darah) dari waktu ke waktu.
-            """)
+            st.markdown(texts.CASE_10)
         else:
             st.warning("Kolom 'year' tidak ditemukan dalam dataset untuk analisis tren tahunan.")
-    with tabs[10]:
+
+    # --- Study Case 11: BMI, Usia, dan Gula Darah ---
+    @case_study("Kasus 11: Hubungan BMI, Usia, dan Gula Darah")
+    def case_11_bmi_age_glucose():
         st.subheader("Studi Kasus 11: Hubungan BMI, Usia, dan Gula Darah")
 
-        import plotly.express as px
-
-        # ---- Filter usia 0–30 tahun ----
-        df_filtered = df[(df["age"] >= 0) & (df["age"] <= 30)]
-
-        # ---- Bubble Chart tanpa sampling ----
-        fig = px.scatter(
-            df_filtered,
-            x="age",
-            y="bmi",
-            color="diabetes",
-            size="blood_glucose_level",
-            hover_data=["hbA1c_level"],
-            color_discrete_sequence=["#5dade2", "#fd7e14"],
-            labels={
-                'diabetes': 'Status Diabetes',
-                'age': 'Usia',
-                'bmi': 'BMI'
-            },
-            title="Bubble Chart: Hubungan Usia (0–30), BMI, dan Kadar Gula Darah (Full Dataset)"
-        )
+        n_points, cells, sample = load_scatter_summary(live.version('scatter'), filters)
+        if not n_points:
+            st.warning("Tidak ada individu berusia 0–30 tahun pada data yang difilter.")
+            return
 
-        # Penyesuaian ukuran bubble & style
-        fig.update_traces(
-            marker=dict(
-                sizeref=2. * df_filtered['blood_glucose_level'].max() / (80. ** 2),
-                sizemode='area',
-                opacity=0.65,
-                line=dict(width=1, color='DarkSlateGrey')
-            )
+        full_view = st.toggle(
+            "Tampilkan semua data tanpa sampling (lambat untuk data besar)", False, key='case11_full',
+            help=f"Secara bawaan chart memakai WebGL, dan di atas {POINT_BUDGET:,} titik beralih ke grid agregat + sampel."
         )
 
-        # Layout
-        fig.update_layout(
-            legend_title_text='Status Diabetes',
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=-0.2,
-                xanchor="center",
-                x=0.5
+        if full_view and STREAMING:
+            st.warning("Mode streaming tidak menyimpan baris mentah; chart memakai grid agregat + sampel.")
+
+        if full_view and not STREAMING:
+            import plotly.express as px
+
+            # ---- Filter usia 0–30 tahun ----
+            df_filtered = load_young_rows(live.version('scatter'), filters)
+
+            # ---- Bubble Chart tanpa sampling ----
+            fig = px.scatter(
+                df_filtered,
+                x="age",
+                y="bmi",
+                color="diabetes",
+                size="blood_glucose_level",
+                hover_data=["hbA1c_level"],
+                color_discrete_sequence=["#5dade2", "#fd7e14"],
+                labels={
+                    'diabetes': 'Status Diabetes',
+                    'age': 'Usia',
+                    'bmi': 'BMI'
+                },
+                title="Bubble Chart: Hubungan Usia (0–30), BMI, dan Kadar Gula Darah (Full Dataset)"
             )
-        )
-
-        # Tampilkan chart di Streamlit
-        st.plotly_chart(fig, use_container_width=True)
-
-        # Penjelasan
-        st.markdown("""
-        *Interpretasi:*
 
-        Visualisasi ini menampilkan hubungan antara usia, BMI, dan kadar gula darah pada individu berusia 0 hingga 30 tahun, menggunakan seluruh data dalam rentang usia tersebut.
-
-        1. Sumbu X menunjukkan usia.
+            # Penyesuaian ukuran bubble & style
+            fig.update_traces(
+                marker=dict(
+                    sizeref=2. * df_filtered['blood_glucose_level'].max() / (80. ** 2),
+                    sizemode='area',
+                    opacity=0.65,
+                    line=dict(width=1, color='DarkSlateGrey')
+                )
+            )
 
-        2. Sumbu Y menunjukkan BMI.
+            # Layout
+            fig.update_layout(
+                legend_title_text='Status Diabetes',
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=-0.2,
+                    xanchor="center",
+                    x=0.5
+                )
+            )
 
-        3. Ukuran lingkaran mewakili kadar gula darah (semakin besar, semakin tinggi kadar gula).
+            # Tampilkan chart di Streamlit
+            show_plotly('case11_scatter', fig)
 
-        4. Warna menunjukkan status diabetes, memisahkan individu yang diabetes dan non-diabetes.
+        elif n_points <= POINT_BUDGET and not STREAMING:
+            # ---- WebGL: semua titik, tetapi dirender di GPU ----
+            df_filtered = load_young_rows(live.version('scatter'), filters)
+            fig = webgl_figure(df_filtered, "Bubble Chart: Hubungan Usia (0–30), BMI, dan Kadar Gula Darah (WebGL)")
+            show_plotly('case11_scatter', fig)
+            st.caption(f"Menampilkan seluruh {len(df_filtered):,} titik dengan renderer WebGL.")
+        else:
+            # ---- Data besar: agregasi di server + sampel berstrata per status diabetes ----
+            fig = binned_figure(cells, sample, "Hubungan Usia (0–30), BMI, dan Rata-rata Gula Darah (Agregat + Sampel)")
+            show_plotly('case11_scatter', fig)
+            n_diabetic = int(round((cells['count'] * cells['diabetes_share']).sum()))
+            sampled_diabetic = int((sample['diabetes'] == 1).sum())
+            st.caption(
+                f"{n_points:,} titik diringkas menjadi {len(cells):,} sel usia x BMI "
+                f"(ukuran = jumlah titik, warna = rata-rata glukosa), ditambah sampel {len(sample):,} titik: "
+                f"{sampled_diabetic:,} dari {n_diabetic:,} penderita diabetes dan "
+                f"{len(sample) - sampled_diabetic:,} dari {n_points - n_diabetic:,} non-diabetes "
+                "(diambil dengan fraksi yang sama per tahun usia)."
+            )
 
-        Dari grafik ini, kita dapat mengamati pola kesehatan pada kelompok usia muda, termasuk kecenderungan bahwa individu dengan BMI lebih tinggi sering memiliki kadar gula darah yang lebih besar, yang bisa mengarah pada risiko diabetes lebih awal.
-            """)
-        
\ No newline at end of file
+        # Penjelasan sesuai yang digambar: semua titik, atau grid agregat + sampel
+        st.markdown(texts.case_11(binned=STREAMING or (not full_view and n_points > POINT_BUDGET)))
+
+    # Hanya studi kasus yang dipilih yang dihitung dan digambar
+    selected_case = st.radio("Pilih studi kasus", list(CASE_STUDIES), horizontal=True,
+                             key='case_study', label_visibility='collapsed')
+    with perf.section(f'case: {selected_case}'):
+        CASE_STUDIES[selected_case]()
+
+    payload_note.caption(f"Chart di run ini: {perf.payload_bytes() / 1024:,.0f} KB dikirim ke browser.")
+
+# --- Panel profiling (hanya jika profiling aktif) ---
+if PROFILE_RUN is not None:
+    perf.end_run(config.PROFILE_LOG)
+    with st.sidebar.expander("⏱️ Profiling Run Ini", expanded=False):
+        st.caption(f"Total: {sum(s['seconds'] for s in PROFILE_RUN.sections if s['depth'] == 0) * 1000:.0f} ms")
+        st.dataframe(PROFILE_RUN.table(), hide_index=True)
+        st.plotly_chart(perf.flame_figure(PROFILE_RUN), width='stretch')
+        st.subheader("Cache (seluruh proses)")
+        png_cache = figure_cache()
+        st.dataframe(perf.cache_table(), hide_index=True)
+        st.caption(f"Cache PNG: {len(png_cache)} chart, {png_cache.nbytes / 1024:.0f} KB.")
+        st.subheader("Payload Chart Run Ini")
+        st.dataframe([{'Chart': name, 'KB': round(n / 1024, 1)} for name, n in PROFILE_RUN.payload.most_common()],
+                     hide_index=True)
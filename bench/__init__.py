@@ -0,0 +1 @@
+"""Benchmark headless untuk app.py (lihat bench/run.py)."""
@@ -0,0 +1,169 @@
+"""Uji beban: banyak sesi bersamaan pada satu server Streamlit.
+
+Server `streamlit run app.py` dijalankan headless, lalu N koneksi websocket
+dibuka bersamaan dengan protokol yang sama seperti browser: kirim `BackMsg`
+rerun_script, tunggu `ForwardMsg` script_finished. Setiap sesi menjalankan
+beberapa rerun berturut-turut. Uji diulang beberapa gelombang; setelah setiap
+gelombang dicatat latensi rerun (p50/p95/maks) dan RSS proses server.
+
+Karena dataset dan agregat dibagi oleh semua sesi (lihat diabviz/incremental.py),
+RSS harus tetap datar antar gelombang dan p95 tidak boleh memburuk. Uji gagal
+(exit 1) jika RSS naik lebih dari `--max-rss-growth` MB antara gelombang
+pertama dan terakhir, jika p95 gelombang terakhir lebih dari
+`REGRESSION_FACTOR` x p95 gelombang pertama, atau jika p95 melebihi `--max-p95`.
+File media (PNG) tidak diunduh, jadi yang diukur adalah latensi server.
+
+Butuh paket `websockets` (lihat bench/requirements.txt):
+
+    pip install -r bench/requirements.txt
+    python -m bench.load --sessions 20 --reruns 5 --rows 100000
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import numpy as np
+
+from bench.generate import dataset
+from bench.run import APP_PATH, REGRESSION_FACTOR, REPO
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _rss(pid):
+    """RSS proses `pid` dalam byte (Linux)."""
+    with open(f'/proc/{pid}/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) * 1024
+    return None
+
+
+def start_server(data_path, port, timeout=120):
+    env = dict(os.environ, DIABVIZ_DATA=data_path)
+    env.setdefault('DIABVIZ_REFRESH_SECONDS', '0')
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', APP_PATH, '--server.headless', 'true',
+         '--server.port', str(port), '--browser.gatherUsageStats', 'false'],
+        cwd=REPO, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/_stcore/health', timeout=1):
+                return proc
+        except OSError:
+            if proc.poll() is not None:
+                raise RuntimeError('server Streamlit berhenti saat start')
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError('server Streamlit tidak siap')
+
+
+async def session(port, reruns, timeout):
+    """Satu sesi browser: `reruns` run berturut-turut; mengembalikan latensi tiap run (detik)."""
+    import websockets
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    latencies = []
+    url = f'ws://127.0.0.1:{port}/_stcore/stream'
+    async with websockets.connect(url, subprotocols=['streamlit'], max_size=None) as ws:
+        for _ in range(reruns):
+            msg = BackMsg()
+            msg.rerun_script.query_string = ''
+            start = time.perf_counter()
+            await ws.send(msg.SerializeToString())
+            while True:
+                reply = ForwardMsg()
+                reply.ParseFromString(await asyncio.wait_for(ws.recv(), timeout))
+                if reply.WhichOneof('type') == 'script_finished':
+                    break
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def wave(port, sessions, reruns, timeout):
+    results = await asyncio.gather(*(session(port, reruns, timeout) for _ in range(sessions)))
+    return [latency for latencies in results for latency in latencies]
+
+
+def summarize_wave(latencies, rss):
+    return {
+        'p50_seconds': float(np.percentile(latencies, 50)),
+        'p95_seconds': float(np.percentile(latencies, 95)),
+        'max_seconds': float(max(latencies)),
+        'rss_bytes': rss,
+    }
+
+
+def check(waves, max_rss_growth_mb, max_p95):
+    """Daftar pelanggaran batas RSS dan latensi."""
+    first, last = waves[0], waves[-1]
+    problems = []
+    growth = (last['rss_bytes'] - first['rss_bytes']) / 2**20
+    if growth > max_rss_growth_mb:
+        problems.append(f'RSS naik {growth:.0f} MB (batas {max_rss_growth_mb:.0f} MB)')
+    if last['p95_seconds'] > first['p95_seconds'] * REGRESSION_FACTOR:
+        problems.append(f"p95 memburuk {first['p95_seconds']:.2f}s -> {last['p95_seconds']:.2f}s")
+    if max_p95 is not None and last['p95_seconds'] > max_p95:
+        problems.append(f"p95 {last['p95_seconds']:.2f}s melebihi {max_p95:.2f}s")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=20)
+    parser.add_argument('--reruns', type=int, default=5)
+    parser.add_argument('--waves', type=int, default=3)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--data', default=None, help='CSV dataset (bawaan: dataset sintetis --rows baris)')
+    parser.add_argument('--data-dir', default=os.path.join(REPO, 'bench', 'data'))
+    parser.add_argument('--max-rss-growth', type=float, default=50, help='MB')
+    parser.add_argument('--max-p95', type=float, default=None, help='detik')
+    parser.add_argument('--timeout', type=float, default=600)
+    parser.add_argument('--out', default=None, help='file JSON hasil')
+    args = parser.parse_args()
+
+    data_path = args.data or dataset(args.rows, args.data_dir)
+    port = _free_port()
+    server = start_server(data_path, port)
+    try:
+        # Run pertama memuat data dan mengisi cache; tidak ikut dihitung
+        cold = asyncio.run(wave(port, 1, 1, args.timeout))[0]
+        print(f'cold run {cold:.2f}s, RSS {_rss(server.pid) / 2**20:.0f} MB')
+        waves = []
+        for i in range(args.waves):
+            latencies = asyncio.run(wave(port, args.sessions, args.reruns, args.timeout))
+            waves.append(summarize_wave(latencies, _rss(server.pid)))
+            w = waves[-1]
+            print(f"gelombang {i + 1}: {args.sessions} sesi x {args.reruns} rerun  p50 {w['p50_seconds']:.2f}s  "
+                  f"p95 {w['p95_seconds']:.2f}s  maks {w['max_seconds']:.2f}s  RSS {w['rss_bytes'] / 2**20:.0f} MB")
+    finally:
+        server.terminate()
+        server.wait()
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump({'data': data_path, 'sessions': args.sessions, 'reruns': args.reruns,
+                       'cold_seconds': cold, 'waves': waves}, f, indent=2)
+
+    problems = check(waves, args.max_rss_growth, args.max_p95)
+    for problem in problems:
+        print(f'GAGAL: {problem}')
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,252 @@
+"""Benchmark headless app.py dengan `AppTest` pada dataset sintetis.
+
+Untuk setiap ukuran dataset, CSV sintetis dibuat sekali (lihat bench/generate.py)
+lalu app dijalankan di subprocess terpisah agar peak RSS tiap ukuran tidak
+tercampur: run pertama (cold), rerun tanpa interaksi (warm), lalu setiap
+studi kasus dipilih bergantian. Untuk setiap run dicatat wall time, waktu per
+bagian (imports, load_data, sidebar, eda, case: ...; lihat diabviz/perf.py), dan
+ukuran payload yang dikirim ke browser. Untuk cold start juga dicatat waktu
+sejak subprocess dimulai sampai run pertama selesai (time-to-first-paint
+worker baru) dan library plotting berat yang sudah dimuat di proses app.
+Hasilnya disimpan sebagai JSON; `--baseline` membandingkan dengan hasil
+sebelumnya dan gagal jika ada bagian yang melambat. Benchmark juga gagal
+(exit 1) jika memori frame yang dimuat melebihi `MEMORY_TARGET_BYTES_PER_ROW`
+byte per baris (lihat diabviz/loader.py).
+
+    python -m bench.run --rows 100000 1000000 10000000 --out bench/results/latest.json
+    python -m bench.run --rows 100000 --baseline bench/results/latest.json
+    python -m bench.run --rows 100000 --chart-preset hemat --native-charts
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+# Secepat mungkin setelah interpreter mulai, untuk time-to-first-paint di subprocess worker
+PROCESS_STARTED = time.perf_counter()
+
+from datetime import datetime, timezone
+
+from bench.generate import dataset
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO, 'app.py')
+DEFAULT_ROWS = [100_000, 1_000_000, 10_000_000]
+# Bagian yang lebih lambat dari baseline dengan faktor ini dianggap regresi
+REGRESSION_FACTOR = 1.25
+# Bagian yang lebih cepat dari ini tidak dibandingkan (terlalu berisik)
+MIN_SECONDS = 0.05
+# Library yang seharusnya hanya dimuat saat chart yang membutuhkannya digambar
+HEAVY_MODULES = ['matplotlib', 'seaborn', 'plotly']
+
+
+def _nodes(node):
+    yield node
+    for child in getattr(node, 'children', {}).values():
+        yield from _nodes(child)
+
+
+# Ukuran file media per id, dicatat saat app menyimpan gambar (AppTest membuang storage setelah run)
+_MEDIA_SIZES = {}
+
+
+def _track_media():
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+
+    original = MemoryMediaFileStorage.load_and_get_id
+
+    def load_and_get_id(self, path_or_data, *args, **kwargs):
+        file_id = original(self, path_or_data, *args, **kwargs)
+        _MEDIA_SIZES[file_id] = len(self.get_file(file_id).content)
+        return file_id
+
+    MemoryMediaFileStorage.load_and_get_id = load_and_get_id
+
+
+def payload_bytes(at):
+    """Ukuran pesan elemen ditambah file media (PNG) yang dikirim ke browser pada run terakhir."""
+    total = 0
+    for node in _nodes(at._tree):
+        proto = getattr(node, 'proto', None)
+        if proto is None:
+            continue
+        total += proto.ByteSize()
+        if getattr(node, 'type', None) == 'image':
+            for img in proto.imgs:
+                file_id = img.url.rsplit('/', 1)[-1].split('.')[0]
+                total += _MEDIA_SIZES.get(file_id, 0)
+    return total
+
+
+def run_worker(data_path, timeout):
+    """Menjalankan app pada `data_path` di proses ini dan mengembalikan hasil pengukuran."""
+    os.environ['DIABVIZ_DATA'] = data_path
+    os.environ['DIABVIZ_PROFILE'] = '1'
+    os.environ.setdefault('DIABVIZ_REFRESH_SECONDS', '0')
+
+    from streamlit.testing.v1 import AppTest
+
+    from diabviz import perf
+
+    _track_media()
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    runs = []
+
+    def measure(label, action):
+        start = time.perf_counter()
+        action()
+        wall = time.perf_counter() - start
+        if at.exception:
+            raise RuntimeError(f'{label}: {at.exception[0].value}')
+        runs.append({
+            'label': label,
+            'wall_seconds': wall,
+            'sections': perf.LAST_RUN.as_dict(),
+            'payload_bytes': payload_bytes(at),
+        })
+
+    measure('cold', at.run)
+    startup = {
+        'first_paint_seconds': time.perf_counter() - PROCESS_STARTED,
+        'heavy_modules': [name for name in HEAVY_MODULES if name in sys.modules],
+    }
+    measure('warm', at.run)
+    for title in at.radio(key='case_study').options:
+        measure(title, lambda: at.radio(key='case_study').set_value(title).run())
+
+    result = {
+        'runs': runs,
+        'startup': startup,
+        'peak_rss_bytes': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+    }
+    if os.environ.get('DIABVIZ_INGEST') != 'stream':
+        from diabviz.loader import MEMORY_TARGET_BYTES_PER_ROW, bytes_per_row, load_frame
+
+        # Diukur setelah peak RSS agar frame tambahan ini tidak ikut terhitung
+        per_row = bytes_per_row(load_frame(data_path))
+        result['bytes_per_row'] = per_row
+        result['memory_target_ok'] = bool(per_row <= MEMORY_TARGET_BYTES_PER_ROW)
+    return result
+
+
+def bench_size(n_rows, data_dir, timeout, ingest, backend, chart_preset=None, native_charts=False):
+    data_path = dataset(n_rows, data_dir)
+    env = dict(os.environ)
+    if ingest:
+        env['DIABVIZ_INGEST'] = ingest
+    if backend:
+        env['DIABVIZ_BACKEND'] = backend
+    if chart_preset:
+        env['DIABVIZ_CHART_PRESET'] = chart_preset
+    if native_charts:
+        env['DIABVIZ_NATIVE_CHARTS'] = '1'
+    proc = subprocess.run(
+        [sys.executable, '-m', 'bench.run', '--worker', data_path, '--timeout', str(timeout)],
+        cwd=REPO, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode:
+        raise RuntimeError(f'benchmark {n_rows} baris gagal:\n{proc.stderr}')
+    return {'rows': n_rows, 'ingest': ingest or 'auto', 'backend': backend or 'pandas',
+            'chart_preset': chart_preset or 'tajam', 'native_charts': native_charts,
+            **json.loads(proc.stdout.splitlines()[-1])}
+
+
+def _section_times(result):
+    times = {}
+    for run in result['runs']:
+        for name, seconds in run['sections'].items():
+            times[(run['label'], name)] = seconds
+    return times
+
+
+def compare(results, baseline):
+    """Daftar bagian yang melambat lebih dari `REGRESSION_FACTOR` dibanding baseline."""
+    previous = {r['rows']: _section_times(r) for r in baseline['results']}
+    regressions = []
+    for result in results:
+        base = previous.get(result['rows'])
+        if base is None:
+            continue
+        for key, seconds in _section_times(result).items():
+            before = base.get(key)
+            if before and max(before, seconds) >= MIN_SECONDS and seconds > before * REGRESSION_FACTOR:
+                regressions.append((result['rows'], *key, before, seconds))
+    return regressions
+
+
+def summarize(result):
+    cold, warm = result['runs'][0], result['runs'][1]
+    cases = result['runs'][2:]
+    slowest = max(cases, key=lambda run: run['wall_seconds'])
+    startup = result['startup']
+    return (f"{result['rows']:>11,} baris  first paint {startup['first_paint_seconds']:.2f}s "
+            f"(impor {cold['sections'].get('imports', 0):.2f}s, dimuat: {', '.join(startup['heavy_modules']) or '-'})  "
+            f"cold {cold['wall_seconds']:.2f}s  warm {warm['wall_seconds']:.2f}s  "
+            f"kasus terlambat {slowest['wall_seconds']:.2f}s ({slowest['label']})  "
+            f"peak RSS {result['peak_rss_bytes'] / 2**20:.0f} MB  payload cold {cold['payload_bytes'] / 1024:.0f} KB  "
+            f"payload rata-rata per rerun {sum(run['payload_bytes'] for run in result['runs'][1:]) / max(len(result['runs']) - 1, 1) / 1024:.0f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS)
+    parser.add_argument('--data-dir', default=os.path.join(REPO, 'bench', 'data'))
+    parser.add_argument('--out', default=None, help='file JSON hasil (bawaan: bench/results/<waktu>.json)')
+    parser.add_argument('--baseline', default=None, help='file JSON hasil sebelumnya untuk dibandingkan')
+    parser.add_argument('--ingest', choices=['auto', 'memory', 'stream'], default=None)
+    parser.add_argument('--backend', choices=['pandas', 'duckdb', 'polars'], default=None,
+                        help='backend kueri (lihat diabviz/query.py)')
+    parser.add_argument('--chart-preset', choices=['tajam', 'standar', 'hemat', 'svg'], default=None,
+                        help='preset output chart (lihat diabviz/render.py)')
+    parser.add_argument('--native-charts', action='store_true', help='chart batang/garis sederhana sebagai chart native')
+    parser.add_argument('--timeout', type=float, default=1800)
+    parser.add_argument('--worker', default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.timeout)))
+        return
+
+    import streamlit
+
+    results = []
+    for n_rows in args.rows:
+        result = bench_size(n_rows, args.data_dir, args.timeout, args.ingest, args.backend,
+                            args.chart_preset, args.native_charts)
+        print(summarize(result))
+        results.append(result)
+
+    stamp = datetime.now(timezone.utc)
+    out = args.out or os.path.join(REPO, 'bench', 'results', stamp.strftime('%Y%m%dT%H%M%SZ') + '.json')
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    with open(out, 'w') as f:
+        json.dump({
+            'created': stamp.isoformat(),
+            'python': platform.python_version(),
+            'streamlit': streamlit.__version__,
+            'machine': platform.machine(),
+            'results': results,
+        }, f, indent=2)
+    print(f'hasil disimpan di {out}')
+
+    failed = False
+    for result in results:
+        if result.get('memory_target_ok') is False:
+            print(f"MEMORI {result['rows']:,} baris: {result['bytes_per_row']:.1f} byte/baris melebihi target")
+            failed = True
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f))
+        for rows, label, name, before, after in regressions:
+            print(f'REGRESI {rows:,} baris  {label} / {name}: {before:.3f}s -> {after:.3f}s')
+        failed = failed or bool(regressions)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1 @@
+"""Modul pendukung untuk aplikasi visualisasi data diabetes (app.py)."""
@@ -0,0 +1,183 @@
+"""Indeks bitmap per nilai kategori untuk filter silang di sidebar.
+
+Untuk setiap kolom filter dan setiap nilainya, indeks menyimpan bitmap
+(1 bit per baris, `np.packbits`) yang dihitung sekali saat data dimuat.
+Seleksi dibentuk dengan OR bitmap nilai yang dipilih dalam satu kolom lalu
+AND antar kolom, tanpa membandingkan ulang isi frame untuk setiap kombinasi
+filter. Baris baru cukup disambung ke ujung bitmap (`extend`).
+
+Setiap bitmap disimpan di buffer dengan kapasitas cadangan (tumbuh dua kali
+lipat saat penuh), jadi `extend` hanya menulis bit baris baru; biayanya
+sebanding dengan ukuran batch, bukan jumlah baris total.
+
+Indeks yang sudah terbit tidak pernah berubah dari sudut pandang pembacanya:
+`extend` mengembalikan indeks baru yang berbagi buffer dengan indeks lama dan
+hanya menulis bit di luar `n_rows` indeks lama (yang diabaikan oleh
+`select`), sehingga sesi lain yang sedang memakai indeks lama tetap konsisten.
+`extend` hanya boleh dipanggil pada indeks terbaru.
+
+Indeks bisa disimpan ke satu file biner di samping snapshot dataset
+(`shared_index`) lalu di-memory-map (read-only), sehingga beberapa proses
+server berbagi satu salinan bitmap lewat page cache.
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# Naikkan nilai ini setiap kali format file indeks berubah
+INDEX_VERSION = 1
+
+# Kolom yang bisa difilter -> label di sidebar
+FILTER_LABELS = {
+    'gender': 'Jenis Kelamin',
+    'location': 'Lokasi',
+    'age_group': 'Kelompok Usia',
+    'smoking_history': 'Riwayat Merokok',
+    'race': 'Ras',
+    'hypertension': 'Hipertensi',
+    'heart_disease': 'Penyakit Jantung',
+}
+
+
+def _codes(column):
+    """(nilai, kode per baris) untuk satu kolom; kode -1 berarti kosong."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.categories.tolist(), column.cat.codes.to_numpy()
+    codes, values = pd.factorize(column, sort=True)
+    return values.tolist(), codes
+
+
+def _append_bits(buffer, n_old, bits):
+    """Menulis `bits` (bool) setelah `n_old` bit pertama `buffer`; mengembalikan buffer tujuan.
+
+    Buffer baru (kapasitas dua kali lipat) hanya dibuat jika `buffer` kosong,
+    read-only (misalnya di-memory-map), atau tidak cukup besar.
+    """
+    used, size = (n_old + 7) // 8, (n_old + len(bits) + 7) // 8
+    if buffer is None or not buffer.flags.writeable or len(buffer) < size:
+        grown = np.zeros(max(size, 2 * used), np.uint8)
+        if buffer is not None:
+            grown[:used] = buffer[:used]
+        buffer = grown
+    start, rem = n_old // 8, n_old % 8
+    if rem:
+        # Byte terakhir masih terisi sebagian: isi sisanya dengan bit pertama batch baru
+        head, bits = bits[:8 - rem], bits[8 - rem:]
+        buffer[start] |= np.packbits(np.concatenate([np.zeros(rem, bool), head]))[0]
+        start += 1
+    buffer[start:start + (len(bits) + 7) // 8] = np.packbits(bits)
+    return buffer
+
+
+class BitmapIndex:
+    """Bitmap per (kolom, nilai) untuk `FILTER_LABELS`."""
+
+    def __init__(self, columns=None):
+        self.columns = list(columns or FILTER_LABELS)
+        self.n_rows = 0
+        self.bitmaps = {col: {} for col in self.columns}
+        # Buffer di balik setiap bitmap (bisa lebih panjang dari bitmap-nya), dipakai ulang oleh `extend`
+        self._buffers = {col: {} for col in self.columns}
+
+    @classmethod
+    def build(cls, frame):
+        return cls([col for col in FILTER_LABELS if col in frame.columns]).extend(frame)
+
+    @property
+    def nbytes(self):
+        return sum(bits.nbytes for bitmaps in self.bitmaps.values() for bits in bitmaps.values())
+
+    def values(self, column):
+        """Nilai yang pernah muncul di `column`, urut sesuai kategori."""
+        return list(self.bitmaps[column])
+
+    def extend(self, batch):
+        """Indeks baru dengan baris `batch` ditambahkan di akhir."""
+        index = BitmapIndex(self.columns)
+        index.n_rows = self.n_rows + len(batch)
+        for col in self.columns:
+            values, codes = _codes(batch[col])
+            position = {value: code for code, value in enumerate(values)}
+            buffers = dict(self._buffers[col])
+            for value in dict.fromkeys([*buffers, *values]):
+                code = position.get(value)
+                bits = codes == code if code is not None else np.zeros(len(batch), bool)
+                buffers[value] = _append_bits(buffers.get(value), self.n_rows, bits)
+                bitmap = buffers[value][:(index.n_rows + 7) // 8]
+                bitmap.flags.writeable = False
+                index.bitmaps[col][value] = bitmap
+            index._buffers[col] = buffers
+        return index
+
+    def save(self, path, key):
+        """Menulis semua bitmap ke `path` dan tata letaknya ke `path`.json (dengan kunci versi data `key`)."""
+        layout, offset = {}, 0
+        for col in self.columns:
+            layout[col] = []
+            for value, bits in self.bitmaps[col].items():
+                layout[col].append([value, offset, len(bits)])
+                offset += len(bits)
+        # Nama sementara per proses: beberapa worker bisa menulis indeks yang sama bersamaan
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            for col in self.columns:
+                for bits in self.bitmaps[col].values():
+                    f.write(bits.tobytes())
+        os.replace(tmp, path)
+        with open(tmp, 'w') as f:
+            json.dump({'version': INDEX_VERSION, 'key': key, 'n_rows': self.n_rows, 'columns': layout}, f)
+        os.replace(tmp, path + '.json')
+
+    @classmethod
+    def load(cls, path, key):
+        """Indeks yang di-memory-map dari `path`, atau None jika file tidak ada atau untuk data lain."""
+        try:
+            with open(path + '.json') as f:
+                meta = json.load(f)
+            if meta.get('version') != INDEX_VERSION or meta.get('key') != key:
+                return None
+            data = np.memmap(path, np.uint8, 'r')
+        except (OSError, ValueError):
+            return None
+        index = cls(meta['columns'])
+        index.n_rows = meta['n_rows']
+        for col, entries in meta['columns'].items():
+            index.bitmaps[col] = {value: data[offset:offset + size] for value, offset, size in entries}
+            index._buffers[col] = dict(index.bitmaps[col])
+        return index
+
+    def select(self, filters):
+        """Mask bool baris yang lolos `filters`: ((kolom, nilai-nilai yang dipilih), ...).
+
+        Nilai dalam satu kolom digabung dengan OR, antar kolom dengan AND.
+        """
+        mask = np.full((self.n_rows + 7) // 8, 0xFF, np.uint8)
+        for col, values in filters:
+            bitmaps = self.bitmaps[col]
+            column = np.zeros_like(mask)
+            for value in values:
+                if value in bitmaps:
+                    np.bitwise_or(column, bitmaps[value], out=column)
+            np.bitwise_and(mask, column, out=mask)
+        return np.unpackbits(mask, count=self.n_rows).astype(bool)
+
+
+def shared_index(frame, path, key):
+    """Indeks bitmap `frame` yang di-memory-map dari `path`; dibuat dan ditulis dulu jika belum ada.
+
+    `key` mengidentifikasi versi data (misal sidik jari dataset). Jika file
+    tidak bisa ditulis, indeks dibangun di memori proses ini saja.
+    """
+    index = BitmapIndex.load(path, key)
+    if index is not None and index.n_rows == len(frame):
+        return index
+    index = BitmapIndex.build(frame)
+    if not index.n_rows:
+        return index
+    try:
+        index.save(path, key)
+    except OSError:
+        return index
+    return BitmapIndex.load(path, key) or index
@@ -0,0 +1,151 @@
+"""Interval kepercayaan bootstrap untuk prevalensi per kelompok.
+
+Prevalensi (proporsi baris dengan `flag == value`) per kategori `by` dihitung
+dari kubus (lihat diabviz/cube.py), jadi tersedia juga di mode streaming dan
+mengikuti filter aktif. Kubus diuraikan menjadi satu kode per baris
+(kelompok x hasil 0/1); baris dengan kode yang sama bisa saling ditukar,
+sehingga resampling kode ini sama dengan resampling baris data asli.
+
+Resampling dijalankan per batch sebagai matriks indeks NumPy (resample x
+baris): satu `bincount` menghitung jumlah per (resample, kode) untuk seluruh
+batch tanpa loop Python per resample. Jika pekerjaannya besar, resample dibagi
+ke beberapa proses worker ('spawn', seperti diabviz/warmup.py); pool worker
+dibuat sekali per proses dan dipakai ulang, lalu ditutup saat proses keluar.
+Untuk data yang
+sangat besar (> `INDEX_ROWS_LIMIT` baris) matriks indeks diganti undian
+multinomial atas jumlah per kode, yang distribusinya sama persis.
+
+Interval adalah persentil 2,5% dan 97,5% dari prevalensi hasil resampling.
+Hasilnya di-cache oleh app.py per versi kubus dan filter.
+"""
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+from diabviz import config
+from diabviz.cube import marginal
+from diabviz.warmup import _bare_main
+
+# Pengelompokan yang bisa dipilih di halaman: kolom -> label
+GROUPINGS = {
+    'race': 'Ras', 'location': 'Lokasi', 'gender': 'Jenis Kelamin',
+    'smoking_history': 'Riwayat Merokok', 'age_group': 'Kelompok Usia',
+}
+# Komorbiditas di Studi Kasus 9 (urutan sama dengan `figures.COMORBIDITY_LABELS`): (kolom, nilai)
+COMORBIDITIES = [('hypertension', 1), ('heart_disease', 1), ('smoking_history', 'current')]
+
+# Jumlah sel matriks indeks per batch (int32, sekitar 16 MB)
+INDEX_BATCH_CELLS = 4_000_000
+# Di atas jumlah baris ini resample diundi dari distribusi multinomial, bukan matriks indeks
+INDEX_ROWS_LIMIT = 1_000_000
+# Pekerjaan (baris x resample) di bawah ini dijalankan di proses ini; membuat worker lebih mahal
+POOL_MIN_DRAWS = 50_000_000
+
+# Pool worker yang dipakai ulang, per jumlah worker
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def resample_counts(counts, n_resamples, seed):
+    """Jumlah per kode untuk `n_resamples` resample bootstrap dari baris dengan jumlah per kode `counts`."""
+    rng = np.random.default_rng(seed)
+    counts = np.asarray(counts, np.int64)
+    n, k = int(counts.sum()), len(counts)
+    if n > INDEX_ROWS_LIMIT:
+        return rng.multinomial(n, counts / n, size=n_resamples)
+    codes = np.repeat(np.arange(k, dtype=np.int32), counts)
+    batch = max(1, INDEX_BATCH_CELLS // max(n, 1))
+    result = np.empty((n_resamples, k), np.int64)
+    for start in range(0, n_resamples, batch):
+        size = min(batch, n_resamples - start)
+        index = rng.integers(0, n, size=(size, n), dtype=np.int32)
+        # Kode digeser per resample agar satu bincount menghasilkan matriks (resample x kode)
+        shifted = codes[index]
+        shifted += (np.arange(size, dtype=np.int32) * k)[:, None]
+        result[start:start + size] = np.bincount(shifted.ravel(), minlength=size * k).reshape(size, k)
+    return result
+
+
+def _pool(workers):
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'))
+        return pool
+
+
+@atexit.register
+def _shutdown_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        _pools.clear()
+
+
+def bootstrap_counts(counts, n_resamples=None, workers=None, seed=0):
+    """`resample_counts` yang dibagi ke `workers` proses jika pekerjaannya cukup besar."""
+    n_resamples = n_resamples or config.BOOTSTRAP_RESAMPLES
+    workers = config.BOOTSTRAP_WORKERS if workers is None else workers
+    if workers <= 1 or min(int(np.sum(counts)), INDEX_ROWS_LIMIT) * n_resamples < POOL_MIN_DRAWS:
+        return resample_counts(counts, n_resamples, seed)
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    sizes = np.diff(np.linspace(0, n_resamples, workers + 1).astype(int))
+    pool = _pool(workers)
+    futures = []
+    try:
+        # Worker baru dibuat saat submit jika belum ada worker yang menganggur
+        with _bare_main():
+            futures = [pool.submit(resample_counts, counts, int(size), s) for size, s in zip(sizes, seeds) if size]
+        return np.vstack([future.result() for future in futures])
+    except BrokenProcessPool:
+        # Worker mati: pool dibuat ulang di panggilan berikutnya
+        with _pools_lock:
+            if _pools.get(workers) is pool:
+                del _pools[workers]
+        raise
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _interval_table(estimate, samples, labels, name=None):
+    lower, upper = np.nanpercentile(samples, [2.5, 97.5], axis=0)
+    table = pd.DataFrame(
+        {'Estimasi': estimate, 'Batas Bawah (95%)': lower, 'Batas Atas (95%)': upper},
+        index=pd.Index(labels, name=name),
+    )
+    return (table * 100).round(2)
+
+
+def prevalence_intervals(cube, by=None, flag='diabetes', value=1, where=None, n_resamples=None, workers=None, seed=0):
+    """Prevalensi (%) `flag == value` per kategori `by` (satu baris 'Semua' jika None) beserta interval bootstrap 95%.
+
+    `where` adalah dict {dimensi: nilai} seperti di `cube.marginal`; nilai kosong tidak dihitung.
+    """
+    table = marginal(cube, [flag] if by is None else [by, flag], where)
+    groups = pd.Series('Semua', index=table.index) if by is None else table[by]
+    group_codes, labels = pd.factorize(groups, sort=True)
+    labels = np.asarray(labels)
+    if not len(labels):
+        return pd.DataFrame(columns=['Estimasi', 'Batas Bawah (95%)', 'Batas Atas (95%)'], index=pd.Index([], name=by))
+    codes = group_codes * 2 + (table[flag] == value).to_numpy(int)
+    counts = np.bincount(codes, weights=table['count'], minlength=2 * len(labels)).astype(np.int64)
+    samples = bootstrap_counts(counts, n_resamples, workers, seed).reshape(-1, len(labels), 2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rates = samples[..., 1] / samples.sum(axis=2)
+    estimate = counts[1::2] / (counts[0::2] + counts[1::2])
+    return _interval_table(estimate, rates, labels, by)
+
+
+def comorbidity_intervals(cube, labels, n_resamples=None, workers=None, seed=0):
+    """Persentase hipertensi, penyakit jantung, dan perokok aktif di antara penderita diabetes, dengan interval bootstrap 95%."""
+    rows = [
+        prevalence_intervals(cube, None, flag, value, {'diabetes': 1}, n_resamples, workers, seed).reindex(['Semua']).iloc[0]
+        for flag, value in COMORBIDITIES
+    ]
+    return pd.DataFrame(rows, index=pd.Index(labels))
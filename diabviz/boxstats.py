@@ -0,0 +1,158 @@
+"""Statistik box plot per grup, dihitung sekali lalu digambar dengan `Axes.bxp`.
+
+`box_stats` menghitung kuartil, whisker (1.5 IQR), jumlah outlier, dan sampel
+outlier berbatas secara tepat dan vektor dengan groupby-quantile, untuk data
+yang ada di memori. Karena outlier yang bernilai sama tergambar di titik yang
+sama, sampel diambil dari nilai outlier unik sehingga tampilannya tetap setara
+dengan menggambar semua outlier.
+
+`BoxSketch` adalah versi aproksimasi yang bisa di-update per chunk dan digabung
+(histogram nilai per grup dengan resolusi tetap), untuk mode streaming yang
+tidak menyimpan baris.
+"""
+import numpy as np
+import pandas as pd
+
+WHIS = 1.5
+MAX_FLIERS = 300
+
+
+def _sample_fliers(groups, values, n_groups, max_fliers, seed):
+    """Nilai outlier unik per grup, maksimal `max_fliers` per grup."""
+    fliers = pd.DataFrame({'g': groups, 'v': values}).drop_duplicates()
+    fliers = fliers.sample(frac=1, random_state=seed).groupby('g').head(max_fliers)
+    by_group = {g: np.sort(v.to_numpy()) for g, v in fliers.groupby('g')['v']}
+    return [by_group.get(i, np.empty(0)) for i in range(n_groups)]
+
+
+def box_stats(df, value, by, whis=WHIS, max_fliers=MAX_FLIERS, seed=0):
+    """Statistik box plot `value` per kategori `by`, sebagai list dict untuk `Axes.bxp`.
+
+    Selain kunci standar bxp, setiap dict berisi `n` (jumlah data) dan
+    `n_outliers` (jumlah outlier sebenarnya, bukan hanya yang disampel).
+    """
+    data = df[[by, value]].dropna()
+    grouped = data.groupby(by, observed=True)[value]
+    quartiles = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    q1, med, q3 = (quartiles[q].to_numpy(float) for q in (0.25, 0.5, 0.75))
+    lo, hi = q1 - whis * (q3 - q1), q3 + whis * (q3 - q1)
+
+    codes = grouped.ngroup().to_numpy()
+    values = data[value].to_numpy(float)
+    inside = (values >= lo[codes]) & (values <= hi[codes])
+
+    whiskers = pd.Series(np.where(inside, values, np.nan)).groupby(codes).agg(['min', 'max'])
+    n_groups = len(quartiles)
+    counts = np.bincount(codes, minlength=n_groups)
+    n_outliers = np.bincount(codes[~inside], minlength=n_groups)
+    means = np.bincount(codes, weights=values, minlength=n_groups) / counts
+    fliers = _sample_fliers(codes[~inside], values[~inside], n_groups, max_fliers, seed)
+
+    return [
+        {
+            'label': str(label), 'q1': q1[i], 'med': med[i], 'q3': q3[i], 'mean': means[i],
+            'whislo': whiskers['min'].iat[i], 'whishi': whiskers['max'].iat[i],
+            'fliers': fliers[i], 'n': int(counts[i]), 'n_outliers': int(n_outliers[i]),
+        }
+        for i, label in enumerate(quartiles.index)
+    ]
+
+
+def _add_counts(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return a.add(b, fill_value=0).astype('int64')
+
+
+def weighted_quantile(values, counts, q):
+    """Kuantil dengan interpolasi linear (seperti pandas) dari nilai unik terurut dan jumlahnya."""
+    cum = np.cumsum(counts)
+    pos = q * (cum[-1] - 1)
+    lower = values[np.searchsorted(cum, np.floor(pos) + 1)]
+    upper = values[np.searchsorted(cum, np.ceil(pos) + 1)]
+    return lower + (upper - lower) * (pos - np.floor(pos))
+
+
+def grid_counts(groups, bins, counts):
+    """Series jumlah dengan MultiIndex (group, bin), format yang dipakai `BoxSketch`."""
+    index = pd.MultiIndex.from_arrays([pd.Index(groups, dtype=object), np.asarray(bins, np.int64)], names=['group', 'bin'])
+    return pd.Series(np.asarray(counts, np.int64), index=index, name='count')
+
+
+def bin_counts(groups, values, resolution):
+    """Jumlah nilai per (group, bin), bin = nilai dibulatkan ke kelipatan `resolution`; nilai kosong diabaikan.
+
+    Grup dan bin digabung menjadi satu kunci int64, lalu dihitung dengan satu `np.unique`.
+    """
+    values = np.asarray(values, dtype=float)
+    codes, labels = pd.factorize(groups)
+    valid = ~np.isnan(values) & (codes >= 0)
+    codes, bins = codes[valid], np.round(values[valid] / resolution).astype(np.int64)
+    if not len(bins):
+        return grid_counts([], [], [])
+    low = bins.min()
+    span = int(bins.max() - low) + 1
+    keys, counts = np.unique(codes * span + (bins - low), return_counts=True)
+    return grid_counts(np.asarray(labels, dtype=object)[keys // span], keys % span + low, counts)
+
+
+class BoxSketch:
+    """Histogram nilai per grup yang bisa digabung, untuk statistik box plot aproksimasi.
+
+    Nilai dibulatkan ke kelipatan `resolution`; kuantil tepat untuk data yang
+    sudah berada pada grid tersebut (misalnya BMI dengan dua desimal).
+    """
+
+    def __init__(self, resolution=0.01):
+        self.resolution = resolution
+        self.counts = None
+
+    def update(self, groups, values):
+        return self.add(bin_counts(groups, values, self.resolution))
+
+    def add(self, counts):
+        """Menambahkan jumlah per (group, bin) yang sudah dihitung (lihat `bin_counts`)."""
+        self.counts = _add_counts(self.counts, counts)
+        return self
+
+    def merge(self, other):
+        merged = BoxSketch(self.resolution)
+        merged.counts = _add_counts(self.counts, other.counts)
+        return merged
+
+    def quantiles(self, qs):
+        """Kuantil `qs` per grup sebagai DataFrame (baris = grup, kolom = `qs`)."""
+        rows = {}
+        if self.counts is not None:
+            for label, hist in self.counts.groupby(level='group', sort=True):
+                hist = hist.droplevel('group').sort_index()
+                values = hist.index.to_numpy() * self.resolution
+                rows[label] = [weighted_quantile(values, hist.to_numpy(), q) for q in qs]
+        return pd.DataFrame.from_dict(rows, orient='index', columns=qs)
+
+    def stats(self, whis=WHIS, max_fliers=MAX_FLIERS, seed=0):
+        """Statistik box plot aproksimasi dengan format yang sama seperti `box_stats`."""
+        rng = np.random.default_rng(seed)
+        result = []
+        if self.counts is None:
+            return result
+        for label, hist in self.counts.groupby(level='group', sort=True):
+            hist = hist.droplevel('group').sort_index()
+            values = hist.index.to_numpy() * self.resolution
+            counts = hist.to_numpy()
+            q1, med, q3 = (weighted_quantile(values, counts, q) for q in (0.25, 0.5, 0.75))
+            lo, hi = q1 - whis * (q3 - q1), q3 + whis * (q3 - q1)
+            inside = (values >= lo) & (values <= hi)
+            fliers = values[~inside]
+            if len(fliers) > max_fliers:
+                fliers = np.sort(rng.choice(fliers, max_fliers, replace=False))
+            result.append({
+                'label': str(label), 'q1': q1, 'med': med, 'q3': q3,
+                'mean': (values * counts).sum() / counts.sum(),
+                'whislo': values[inside].min(), 'whishi': values[inside].max(),
+                'fliers': fliers, 'n': int(counts.sum()), 'n_outliers': int(counts[~inside].sum()),
+            })
+        return result
+
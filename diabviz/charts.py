@@ -0,0 +1,279 @@
+"""Fungsi pembuat figure Matplotlib untuk EDA dan studi kasus.
+
+Setiap fungsi menerima data yang sudah disiapkan dan mengembalikan Figure
+baru tanpa menampilkannya; penampilan dan caching diurus oleh diabviz/render.py.
+
+Modul ini memuat Matplotlib dan seaborn, jadi hanya diimpor saat sebuah chart
+benar-benar digambar (lihat `figures.draw`). Tema seaborn diterapkan sekali
+saat modul diimpor.
+"""
+import matplotlib.pyplot as plt
+import numpy as np
+import seaborn as sns
+from matplotlib.colors import LinearSegmentedColormap
+
+from diabviz.render import THEME
+
+
+def apply_theme():
+    """Menerapkan tema seaborn global yang dipakai semua chart."""
+    sns.set_theme(**THEME)
+
+
+apply_theme()
+
+# Label legenda untuk kolom flag 0/1
+YES_NO = {0: 'Tidak', 1: 'Ya'}
+
+
+def _flag_legend(ax, counts, hue, title):
+    # Satu label per nilai hue yang benar-benar ada (urutan sama dengan seaborn untuk hue numerik)
+    handles, _ = ax.get_legend_handles_labels()
+    levels = sorted(counts[hue].dropna().unique())
+    ax.legend(handles, [YES_NO.get(level, str(level)) for level in levels], title=title, loc='upper right')
+
+
+def _annotate_bars(ax, fontsize, offset):
+    # Menambahkan label count di atas bar
+    for p in ax.patches:
+        ax.annotate(f'{int(p.get_height())}', (p.get_x() + p.get_width() / 2., p.get_height()),
+                    ha='center', va='center', fontsize=fontsize, color='black', xytext=(0, offset),
+                    textcoords='offset points')
+
+
+# --- EDA ---
+
+def histogram_kde(density, ax, color):
+    """Menggambar histogram + KDE yang sudah dihitung (lihat diabviz/density.py) seperti sns.histplot(kde=True)."""
+    edges = density['edges']
+    ax.bar(edges[:-1], density['counts'], width=np.diff(edges), align='edge',
+           color=color, alpha=0.5, edgecolor='white', linewidth=0.5)
+    line, = ax.plot(density['x'], density['y'], color=color)
+    line.sticky_edges.y[:] = (0, np.inf)
+
+
+def age_distribution(density):
+    fig, ax = plt.subplots(figsize=(9, 6)) # Ukuran lebih besar
+    histogram_kde(density, ax, color=sns.color_palette("viridis")[0])
+    ax.set_title('Distribusi Usia', fontsize=16)
+    ax.set_xlabel('Usia', fontsize=12)
+    ax.set_ylabel('Frekuensi', fontsize=12)
+    sns.despine(left=True, bottom=True) # Menghilangkan spines
+    fig.tight_layout()
+    return fig
+
+
+def correlation_heatmap(corr_data, title):
+    # Ukuran mengikuti jumlah kolom; anotasi diperkecil untuk matriks besar
+    n = len(corr_data)
+    fig, ax = plt.subplots(figsize=(max(5, 0.9 * n + 2), max(4, 0.8 * n + 1)))
+    sns.heatmap(corr_data, annot=True, cmap='Blues', vmin=-1, vmax=1, ax=ax,
+                annot_kws={'fontsize': 10 if n <= 6 else 8})
+    ax.set_title(title, fontsize=14)
+    if n > 2:
+        fig.tight_layout()
+    return fig
+
+
+def gender_distribution(gender_counts):
+    fig, ax = plt.subplots(figsize=(9, 6))
+    sns.barplot(data=gender_counts, x='gender', y='count', hue='gender', ax=ax, palette='viridis', legend=False, errorbar=None)
+    ax.set_title('Distribusi Jenis Kelamin', fontsize=16)
+    ax.set_xlabel('Jenis Kelamin', fontsize=12)
+    ax.set_ylabel('Jumlah', fontsize=12)
+    _annotate_bars(ax, fontsize=10, offset=5)
+    sns.despine(left=True, bottom=True)
+    fig.tight_layout()
+    return fig
+
+
+def box_plot(stats, title, xlabel, ylabel, figsize=(9, 6), labels=None):
+    """Box plot dari statistik yang sudah dihitung (lihat diabviz/boxstats.py).
+
+    `labels` (opsional) memetakan `label` setiap box (nilai grup) ke teks yang ditampilkan.
+    """
+    if labels is not None:
+        stats = [dict(box, label=labels.get(box['label'], box['label'])) for box in stats]
+    fig, ax = plt.subplots(figsize=figsize)
+    line_color = '#3f3f3f'
+    artists = ax.bxp(
+        stats, patch_artist=True, widths=0.8,
+        boxprops=dict(edgecolor=line_color),
+        whiskerprops=dict(color=line_color),
+        capprops=dict(color=line_color),
+        medianprops=dict(color=line_color, linewidth=1.5),
+        flierprops=dict(marker='o', markersize=6, markerfacecolor='none', markeredgecolor=line_color),
+    )
+    # Saturasi 0.75 seperti bawaan sns.boxplot
+    for box, color in zip(artists['boxes'], sns.color_palette('viridis', len(stats))):
+        box.set_facecolor(sns.desaturate(color, 0.75))
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    sns.despine(left=True, bottom=True)
+    fig.tight_layout()
+    return fig
+
+
+def box_by_diabetes(stats, title, ylabel):
+    return box_plot(stats, title, 'Status Diabetes (0: Tidak, 1: Ya)', ylabel,
+                    labels={'0': 'Tidak Diabetes', '1': 'Diabetes'})
+
+
+# --- Studi Kasus ---
+
+def diabetic_age_distribution(density):
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # plot utama - hanya kasus diabetes
+    histogram_kde(density, ax, color='red')
+
+    ax.set_title('Distribusi Usia Individu dengan Status Diabetes', fontsize=16)
+    ax.set_xlabel('Usia', fontsize=12)
+    ax.set_ylabel('Frekuensi', fontsize=12)
+
+    sns.despine(left=True, bottom=True)
+    fig.tight_layout()
+    return fig
+
+
+def gender_flag_counts(counts, flag, title, legend_title):
+    fig, ax = plt.subplots(figsize=(8, 5))
+    sns.barplot(data=counts, x='gender', y='count', hue=flag, ax=ax, palette='viridis', errorbar=None)
+    ax.set_title(title, fontsize=14)
+    ax.set_xlabel('Jenis Kelamin', fontsize=12)
+    ax.set_ylabel('Jumlah', fontsize=12)
+    _annotate_bars(ax, fontsize=9, offset=3)
+    _flag_legend(ax, counts, flag, legend_title)
+    sns.despine(left=True, bottom=True)
+    fig.tight_layout()
+    return fig
+
+
+def location_cases(location_counts):
+    # Buat color map - gradasi dari kuning ke merah
+    colors_gradient = ['#fff5e6', '#ffe0b3', '#ffcc80', '#ff9933', '#ff6600', '#cc0000']
+    n_bins = 100
+    cmap = LinearSegmentedColormap.from_list('yellow_red', colors_gradient, N=n_bins)
+
+    # Normalisasi nilai untuk color mapping
+    norm_values = (location_counts.values - location_counts.values.min()) / (np.ptp(location_counts.values) or 1)
+    bar_colors = [cmap(val) for val in norm_values]
+
+    fig, ax = plt.subplots(figsize=(14, 8))
+    bars = ax.barh(range(len(location_counts)), location_counts.values, color=bar_colors, edgecolor='black', linewidth=0.5)
+
+    ax.set_yticks(range(len(location_counts)))
+    ax.set_yticklabels(location_counts.index, fontsize=9)
+    ax.set_xlabel('Jumlah Kasus Diabetes', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Lokasi', fontsize=12, fontweight='bold')
+    ax.set_title('Distribusi Kasus Diabetes berdasarkan Lokasi', fontsize=16, fontweight='bold', pad=20)
+
+    # Tambahkan nilai di ujung bar
+    for i, (count, bar) in enumerate(zip(location_counts.values, bars)):
+        ax.text(count + 1, i, f'{count}', va='center', fontsize=8, fontweight='bold')
+
+    # Tambahkan colorbar untuk referensi
+    sm = plt.cm.ScalarMappable(cmap=cmap, norm=plt.Normalize(vmin=location_counts.values.min(), vmax=location_counts.values.max()))
+    sm.set_array([])
+    cbar = fig.colorbar(sm, ax=ax, pad=0.02)
+    cbar.set_label('Intensitas Kasus', rotation=270, labelpad=20, fontsize=10)
+
+    sns.despine(left=True, bottom=True)
+    fig.tight_layout()
+    return fig
+
+
+def race_pies(race_counts):
+    # Pastikan urutan ras tetap konsisten
+    races = race_counts.index
+
+    # Buat subplot untuk tiap ras
+    fig, axes = plt.subplots(
+        nrows=2, ncols=3, figsize=(12, 8),
+        subplot_kw=dict(aspect='equal')
+    )
+    axes = axes.flatten()
+
+    colors = sns.color_palette('viridis', n_colors=2)
+    labels = ['Tidak Diabetes', 'Diabetes']
+
+    for i, race in enumerate(races):
+        values = race_counts.loc[race].values
+
+        axes[i].pie(
+            values,
+            labels=labels,
+            autopct='%1.1f%%',
+            startangle=90,
+            colors=colors,
+            textprops={'fontsize': 10}
+        )
+        axes[i].set_title(race, fontsize=12)
+
+    # Hapus subplot kosong kalau jumlah ras < jumlah subplot
+    for j in range(len(races), len(axes)):
+        fig.delaxes(axes[j])
+
+    fig.suptitle('Proporsi Diabetes vs Tidak Diabetes per Ras', fontsize=16)
+    fig.tight_layout()
+    return fig
+
+
+def smoking_by_diabetes(counts):
+    fig, ax = plt.subplots(figsize=(10, 6))
+    sns.barplot(data=counts, x='smoking_history', y='count', hue='diabetes',
+                ax=ax, palette='viridis', errorbar=None)
+    ax.set_title('Distribusi Riwayat Merokok berdasarkan Status Diabetes', fontsize=16)
+    ax.set_xlabel('Riwayat Merokok', fontsize=12)
+    ax.set_ylabel('Jumlah Kasus', fontsize=12)
+    ax.tick_params(axis='x', labelrotation=45)
+    plt.setp(ax.get_xticklabels(), ha='right', fontsize=10)
+    _flag_legend(ax, counts, 'diabetes', 'Diabetes')
+    sns.despine(left=True, bottom=True)
+    fig.tight_layout()
+    return fig
+
+
+def glucose_by_age_group(stats):
+    return box_plot(stats, 'Distribusi Tingkat Glukosa Darah berdasarkan Kelompok Usia',
+                    'Kelompok Usia', 'Tingkat Glukosa Darah', figsize=(12, 6))
+
+
+def comorbidity_radial(labels, sizes):
+    # Setup polar chart
+    angles = np.linspace(0, 2 * np.pi, len(sizes), endpoint=False)
+    fig, ax = plt.subplots(subplot_kw={'polar': True}, figsize=(7, 6))
+    ax.bar(
+        angles,
+        sizes,
+        width=0.8,
+        color=sns.color_palette("viridis", len(sizes)),
+        alpha=0.75,
+        edgecolor='black'
+    )
+
+    # Label & styling
+    ax.set_xticks(angles)
+    ax.set_xticklabels(labels, fontsize=11)
+    ax.set_yticklabels([])
+    ax.set_title("Radial Bar Komorbiditas pada Penderita Diabetes", fontsize=15, pad=20)
+    ax.set_ylim(0, max(sizes) + 10)
+
+    # Tambahkan nilai persentase di atas bar
+    for angle, size in zip(angles, sizes):
+        ax.text(angle, size + 3, f"{size:.1f}%", ha='center', va='bottom', fontsize=10, fontweight='bold')
+
+    fig.tight_layout()
+    return fig
+
+
+def yearly_trend(trends, column, title, ylabel, color_index):
+    fig, ax = plt.subplots(figsize=(10, 5))
+    sns.lineplot(data=trends, x='year', y=column, marker='o', ax=ax, color=sns.color_palette("viridis")[color_index], linewidth=2.5)
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel('Tahun', fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    sns.despine(left=True, bottom=True)
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,55 @@
+"""Konfigurasi aplikasi yang bisa diatur lewat environment variable."""
+import os
+
+# Path file dataset (ganti jika perlu)
+FILE_PATH = os.environ.get('DIABVIZ_DATA', 'diabetes_dataset.csv')
+
+# Mode ingesti: 'memory' (frame lengkap di RAM), 'stream' (per chunk, lihat diabviz/ingest.py),
+# atau 'auto' (stream jika file lebih besar dari STREAM_THRESHOLD_MB)
+INGEST_MODE = os.environ.get('DIABVIZ_INGEST', 'auto')
+STREAM_THRESHOLD_MB = float(os.environ.get('DIABVIZ_STREAM_THRESHOLD_MB', 1024))
+CHUNK_ROWS = int(os.environ.get('DIABVIZ_CHUNK_ROWS', 200_000))
+# Simpan indeks filter di samping snapshot dan memory-map dari sana, agar beberapa proses
+# server pada host yang sama berbagi satu salinan frame dan indeks (lihat diabviz/bitmap.py)
+SHARED_STORE = os.environ.get('DIABVIZ_SHARED_STORE', '1') not in ('', '0')
+
+# Ukuran sampel berstrata untuk mode pratinjau (lihat diabviz/sampling.py); 0 = tanpa mode pratinjau
+PREVIEW_ROWS = int(os.environ.get('DIABVIZ_PREVIEW_ROWS', 50_000))
+
+# Jumlah resample bootstrap untuk interval prevalensi dan jumlah proses worker-nya (lihat diabviz/bootstrap.py).
+# Pool worker tetap hidup selama proses server dan setiap worker memuat pandas, jadi bawaannya kecil.
+BOOTSTRAP_RESAMPLES = int(os.environ.get('DIABVIZ_BOOTSTRAP_RESAMPLES', 2000))
+BOOTSTRAP_WORKERS = int(os.environ.get('DIABVIZ_BOOTSTRAP_WORKERS', min(2, os.cpu_count() or 1)))
+
+# Backend agregasi: 'pandas', 'duckdb', atau 'polars' (dua terakhir opsional, lihat diabviz/query.py)
+QUERY_BACKEND = os.environ.get('DIABVIZ_BACKEND', 'pandas')
+# Jumlah thread untuk backend DuckDB/Polars
+QUERY_THREADS = int(os.environ.get('DIABVIZ_QUERY_THREADS', os.cpu_count() or 1))
+
+
+def use_streaming(stat):
+    """True jika dataset dengan `stat` (ukuran, mtime) harus dibaca per chunk."""
+    if INGEST_MODE == 'stream':
+        return True
+    if INGEST_MODE == 'memory' or stat is None:
+        return False
+    return stat[0] > STREAM_THRESHOLD_MB * 1024 * 1024
+
+# Direktori berisi file batch CSV tambahan (skema sama dengan FILE_PATH), opsional
+BATCH_DIR = os.environ.get('DIABVIZ_BATCH_DIR') or None
+# Interval (detik) pemeriksaan data baru di latar belakang; 0 = hanya saat halaman dijalankan ulang
+REFRESH_SECONDS = float(os.environ.get('DIABVIZ_REFRESH_SECONDS', 60))
+
+# Catat waktu per bagian halaman (lihat diabviz/perf.py)
+PROFILE = os.environ.get('DIABVIZ_PROFILE', '0') not in ('', '0')
+# File JSONL opsional untuk menyimpan catatan profiling setiap run
+PROFILE_LOG = os.environ.get('DIABVIZ_PROFILE_LOG') or None
+
+# Preset output chart statis: 'tajam' (200 DPI), 'standar', 'hemat', atau 'svg' (lihat diabviz/render.py)
+CHART_PRESET = os.environ.get('DIABVIZ_CHART_PRESET', 'tajam')
+# Chart batang/garis sederhana sebagai chart native (Vega-Lite) dari tabel kecil, bukan gambar
+NATIVE_CHARTS = os.environ.get('DIABVIZ_NATIVE_CHARTS', '0') not in ('', '0')
+
+# Jumlah proses worker untuk pre-render chart (lihat diabviz/warmup.py); 0 = tanpa warm-up.
+# Seperti pool bootstrap, worker tetap hidup (masing-masing memuat Matplotlib), jadi bawaannya kecil.
+WARMUP_WORKERS = int(os.environ.get('DIABVIZ_WARMUP_WORKERS', min(2, os.cpu_count() or 1)))
@@ -0,0 +1,79 @@
+"""Statistik co-moment yang bisa digabung, untuk korelasi tanpa menyimpan baris.
+
+Setiap chunk diringkas menjadi (n, rata-rata, matriks co-moment) dengan satu
+perkalian matriks, lalu ringkasan digabung dengan rumus Chan dkk. sehingga
+hasilnya sama dengan menghitung sekaligus atas seluruh data.
+
+Kolom yang diringkas adalah semua kolom numerik dan flag ditambah indikator
+0/1 per ras (`moment_frame`), sehingga heatmap bisa menampilkan subset kolom
+mana pun dari ringkasan yang sama tanpa memindai ulang baris.
+"""
+import numpy as np
+import pandas as pd
+
+from diabviz.loader import RACE_COLUMNS
+
+
+def moment_frame(chunk):
+    """Kolom numerik/flag `chunk` ditambah indikator `race:*` (semua 0 jika ras kosong)."""
+    numeric = chunk.select_dtypes('number')
+    if 'race' not in chunk.columns:
+        return numeric
+    flags = pd.get_dummies(chunk['race'], prefix='race', prefix_sep=':', dtype='int8')
+    return pd.concat([numeric, flags.reindex(columns=RACE_COLUMNS, fill_value=0)], axis=1)
+
+
+class CoMoments:
+    """Jumlah baris, rata-rata, dan matriks co-moment untuk sekumpulan kolom numerik."""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.n = 0
+        self.mean = np.zeros(k)
+        self.comoment = np.zeros((k, k))
+
+    @classmethod
+    def from_frame(cls, frame, columns):
+        """Ringkasan satu chunk; baris dengan nilai kosong pada salah satu kolom diabaikan."""
+        moments = cls(columns)
+        values = frame[moments.columns].to_numpy(dtype='float64')
+        values = values[~np.isnan(values).any(axis=1)]
+        moments.n = len(values)
+        if moments.n:
+            moments.mean = values.mean(axis=0)
+            centered = values - moments.mean
+            moments.comoment = centered.T @ centered
+        return moments
+
+    def update(self, frame):
+        merged = self.merge(CoMoments.from_frame(frame, self.columns))
+        self.n, self.mean, self.comoment = merged.n, merged.mean, merged.comoment
+        return self
+
+    def merge(self, other):
+        """Menggabungkan dua ringkasan (rumus paralel Chan)."""
+        merged = CoMoments(self.columns)
+        merged.n = self.n + other.n
+        if not merged.n:
+            return merged
+        delta = other.mean - self.mean
+        merged.mean = self.mean + delta * (other.n / merged.n)
+        merged.comoment = self.comoment + other.comoment + np.outer(delta, delta) * (self.n * other.n / merged.n)
+        return merged
+
+    def std(self):
+        """Simpangan baku sampel (ddof=1) per kolom."""
+        if self.n < 2:
+            return pd.Series(np.nan, index=self.columns)
+        return pd.Series(np.sqrt(np.diag(self.comoment) / (self.n - 1)), index=self.columns)
+
+    def corr(self, columns=None):
+        """Matriks korelasi Pearson untuk `columns` (bawaan: semua kolom)."""
+        columns = self.columns if columns is None else list(columns)
+        idx = [self.columns.index(col) for col in columns]
+        sub = self.comoment[np.ix_(idx, idx)]
+        scale = np.sqrt(np.diag(sub))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr = sub / np.outer(scale, scale)
+        return pd.DataFrame(corr, index=columns, columns=columns)
@@ -0,0 +1,71 @@
+"""Kubus agregat jumlah (count cube) untuk visualisasi kategorikal.
+
+Kubus berisi jumlah baris untuk setiap kombinasi dimensi kategorikal yang
+muncul di data. Semua countplot, value_counts, dan prevalensi di halaman
+dihitung dari tabel kecil ini, bukan dengan memindai ulang seluruh dataset.
+"""
+import pandas as pd
+
+from diabviz import query
+
+CUBE_DIMS = [
+    'gender', 'age_group', 'location', 'race', 'smoking_history',
+    'hypertension', 'heart_disease', 'diabetes',
+]
+
+
+def build_cube(df):
+    """Menghitung jumlah baris untuk setiap kombinasi `CUBE_DIMS` yang ada di data (lewat backend kueri)."""
+    return query.backend().counts(df, CUBE_DIMS)
+
+
+def merge_cubes(a, b):
+    """Menjumlahkan dua kubus (misalnya dari dua chunk data)."""
+    if a is None or a.empty:
+        return b
+    cube = pd.concat([a, b], ignore_index=True)
+    cube = cube.groupby(CUBE_DIMS, observed=True, dropna=False, sort=False)['count'].sum().reset_index()
+    for dim in ('gender', 'age_group', 'location', 'race', 'smoking_history'):
+        cube[dim] = cube[dim].astype('category')
+    return cube
+
+
+def _select(cube, where):
+    if not where:
+        return cube
+    mask = pd.Series(True, index=cube.index)
+    for dim, value in where.items():
+        mask &= cube[dim] == value
+    return cube[mask]
+
+
+def marginal(cube, by, where=None):
+    """Menjumlahkan kubus ke dimensi `by`, opsional setelah memfilter dengan `where`.
+
+    `where` adalah dict {dimensi: nilai}. Kategori tanpa data tidak ikut ditampilkan.
+    """
+    sub = _select(cube, where)
+    return sub.groupby(by, observed=True)['count'].sum().reset_index()
+
+
+def crosstab(cube, row, col, where=None):
+    """Tabel silang jumlah `row` x `col` (nilai kosong diisi 0)."""
+    counts = marginal(cube, [row, col], where).set_index([row, col])['count']
+    return counts.unstack(col, fill_value=0)
+
+
+def prevalence(cube, by, flag='diabetes', where=None):
+    """Proporsi baris dengan `flag == 1` untuk setiap kategori `by`."""
+    table = crosstab(cube, by, flag, where)
+    positives = table[1] if 1 in table.columns else 0
+    return positives / table.sum(axis=1)
+
+
+def share(cube, column, value, where=None):
+    """Proporsi baris dengan `column == value` di dalam subset `where`."""
+    sub = _select(cube, where)
+    sub = sub[sub[column].notna()]
+    total = sub['count'].sum()
+    if not total:
+        return 0.0
+    return sub.loc[sub[column] == value, 'count'].sum() / total
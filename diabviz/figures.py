@@ -0,0 +1,249 @@
+"""Daftar semua chart statis (Matplotlib) di halaman beserta data sumbernya.
+
+Setiap chart didaftarkan dengan id, bagian agregat sumbernya (lihat
+`StreamAggregates.versions`), dan builder yang menerima `StreamAggregates`
+lalu mengembalikan (nama fungsi chart, argumen); builder boleh menerima
+parameter tampilan opsional sebagai keyword (misalnya rentang tahun). Fungsi chart berada di
+diabviz/charts.py dan argumennya data kecil hasil agregasi, sehingga pasangan
+ini bisa digambar langsung maupun dikirim ke proses lain (lihat
+diabviz/warmup.py). Builder hanya menyebut nama fungsi, jadi Matplotlib baru
+diimpor saat chart benar-benar digambar.
+
+Chart batang dan garis sederhana juga punya versi native (`NATIVE`): builder
+yang mengembalikan tabel kecil untuk st.bar_chart/st.line_chart (Vega-Lite,
+digambar di browser), jauh lebih kecil daripada gambar PNG.
+"""
+from diabviz.cube import crosstab, marginal, share
+from diabviz.density import histogram_kde
+
+# id chart -> (bagian agregat sumber, builder)
+FIGURES = {}
+
+
+def figure(chart_id, source='cube'):
+    """Decorator untuk mendaftarkan builder sebuah chart."""
+    def register(build):
+        FIGURES[chart_id] = (source, build)
+        return build
+    return register
+
+
+def spec(chart_id, aggregates, **params):
+    """(nama fungsi chart, argumen) untuk `chart_id` dari `aggregates`."""
+    _, build = FIGURES[chart_id]
+    return build(aggregates, **params)
+
+
+def draw(chart_id, aggregates, **params):
+    """Membuat Figure untuk `chart_id`."""
+    from diabviz import charts
+
+    name, args = spec(chart_id, aggregates, **params)
+    return getattr(charts, name)(*args)
+
+
+# id chart -> builder versi native: (agregat, **params) -> dict argumen chart native (lihat `native_spec`)
+NATIVE = {}
+
+
+def native(chart_id):
+    """Decorator untuk mendaftarkan versi native (Vega-Lite) sebuah chart."""
+    def register(build):
+        NATIVE[chart_id] = build
+        return build
+    return register
+
+
+def native_spec(chart_id, aggregates, **params):
+    """('bar' | 'line', argumen st.bar_chart/st.line_chart) untuk `chart_id`; None jika tidak punya versi native."""
+    build = NATIVE.get(chart_id)
+    return None if build is None else build(aggregates, **params)
+
+
+YES_NO = {0: 'Tidak', 1: 'Ya'}
+
+
+def _wide_counts(counts, index, column):
+    """Tabel jumlah berindeks `index` dengan satu kolom per nilai `column` (0/1 -> Tidak/Ya)."""
+    table = counts.pivot_table(index=index, columns=column, values='count', aggfunc='sum', observed=True, fill_value=0)
+    table.index = table.index.astype(str)
+    table.columns = [YES_NO.get(value, str(value)) for value in table.columns]
+    return table
+
+
+# --- Data turunan yang juga dipakai teks penjelasan di app.py ---
+
+def diabetic_location_counts(cube):
+    """Jumlah penderita diabetes per lokasi, urut naik."""
+    counts = marginal(cube, ['location'], where={'diabetes': 1}).set_index('location')['count']
+    return counts.sort_values(ascending=True)
+
+
+def race_diabetes_counts(cube):
+    """Jumlah per ras x status diabetes (kolom 0/1 selalu ada)."""
+    return crosstab(cube, 'race', 'diabetes').reindex(columns=[0, 1], fill_value=0)
+
+
+COMORBIDITY_LABELS = ['Hipertensi', 'Penyakit Jantung', 'Perokok Aktif']
+
+
+def comorbidity_shares(cube):
+    """Persentase hipertensi, penyakit jantung, dan perokok aktif di antara penderita diabetes."""
+    diab = {'diabetes': 1}
+    return [
+        share(cube, 'hypertension', 1, where=diab) * 100,
+        share(cube, 'heart_disease', 1, where=diab) * 100,
+        share(cube, 'smoking_history', 'current', where=diab) * 100,
+    ]
+
+
+# --- EDA ---
+
+@figure('eda_age', 'age_all')
+def _eda_age(agg):
+    return 'age_distribution', (histogram_kde(agg.age_all, 20),)
+
+
+CORR_DEFAULT = ['bmi', 'blood_glucose_level']
+
+
+@figure('eda_corr', 'moments')
+def _eda_corr(agg, columns=None):
+    if columns is None:
+        return 'correlation_heatmap', (agg.moments.corr(CORR_DEFAULT), "Correlation: BMI vs Blood Glucose Level")
+    return 'correlation_heatmap', (agg.moments.corr(columns), "Matriks Korelasi")
+
+
+@figure('eda_gender')
+def _eda_gender(agg):
+    return 'gender_distribution', (marginal(agg.cube, ['gender']),)
+
+
+@native('eda_gender')
+def _eda_gender_native(agg):
+    counts = marginal(agg.cube, ['gender']).set_index('gender')['count']
+    counts.index = counts.index.astype(str)
+    return 'bar', dict(data=counts.rename('Jumlah'), x_label='Jenis Kelamin', y_label='Jumlah')
+
+
+@figure('eda_glucose_box', ('blood_glucose_level', 'diabetes'))
+def _eda_glucose_box(agg):
+    return 'box_by_diabetes', (
+        agg.box_stats(('blood_glucose_level', 'diabetes')),
+        'Tingkat Glukosa Darah Berdasarkan Status Diabetes', 'Tingkat Glukosa Darah',
+    )
+
+
+# --- Studi kasus ---
+
+@figure('case1_age', 'age_diabetic')
+def _case1_age(agg):
+    return 'diabetic_age_distribution', (histogram_kde(agg.age_diabetic, 25),)
+
+
+@figure('case2_hypertension')
+def _case2_hypertension(agg):
+    return 'gender_flag_counts', (
+        marginal(agg.cube, ['gender', 'hypertension']), 'hypertension',
+        'Prevalensi Hipertensi berdasarkan Jenis Kelamin', 'Hipertensi',
+    )
+
+
+@figure('case2_heart_disease')
+def _case2_heart_disease(agg):
+    return 'gender_flag_counts', (
+        marginal(agg.cube, ['gender', 'heart_disease']), 'heart_disease',
+        'Prevalensi Penyakit Jantung berdasarkan Jenis Kelamin', 'Penyakit Jantung',
+    )
+
+
+@native('case2_hypertension')
+def _case2_hypertension_native(agg):
+    table = _wide_counts(marginal(agg.cube, ['gender', 'hypertension']), 'gender', 'hypertension')
+    return 'bar', dict(data=table, x_label='Jenis Kelamin', y_label='Jumlah', stack=False)
+
+
+@native('case2_heart_disease')
+def _case2_heart_disease_native(agg):
+    table = _wide_counts(marginal(agg.cube, ['gender', 'heart_disease']), 'gender', 'heart_disease')
+    return 'bar', dict(data=table, x_label='Jenis Kelamin', y_label='Jumlah', stack=False)
+
+
+@figure('case3_location')
+def _case3_location(agg):
+    return 'location_cases', (diabetic_location_counts(agg.cube),)
+
+
+@native('case3_location')
+def _case3_location_native(agg):
+    counts = diabetic_location_counts(agg.cube).rename('Jumlah Kasus Diabetes')
+    counts.index = counts.index.astype(str)
+    return 'bar', dict(data=counts, x_label='Lokasi', y_label='Jumlah Kasus Diabetes',
+                       horizontal=True, sort='-Jumlah Kasus Diabetes')
+
+
+@figure('case4_race')
+def _case4_race(agg):
+    return 'race_pies', (race_diabetes_counts(agg.cube),)
+
+
+@figure('case5_smoking')
+def _case5_smoking(agg):
+    return 'smoking_by_diabetes', (marginal(agg.cube, ['smoking_history', 'diabetes']),)
+
+
+@native('case5_smoking')
+def _case5_smoking_native(agg):
+    table = _wide_counts(marginal(agg.cube, ['smoking_history', 'diabetes']), 'smoking_history', 'diabetes')
+    return 'bar', dict(data=table, x_label='Riwayat Merokok', y_label='Jumlah Kasus', stack=False)
+
+
+@figure('case6_bmi_box', ('bmi', 'diabetes'))
+def _case6_bmi_box(agg):
+    return 'box_by_diabetes', (
+        agg.box_stats(('bmi', 'diabetes')), 'Distribusi BMI berdasarkan Status Diabetes', 'BMI',
+    )
+
+
+@figure('case7_hba1c_box', ('hbA1c_level', 'diabetes'))
+def _case7_hba1c_box(agg):
+    return 'box_by_diabetes', (
+        agg.box_stats(('hbA1c_level', 'diabetes')),
+        'Distribusi Tingkat HbA1c berdasarkan Status Diabetes', 'Tingkat HbA1c',
+    )
+
+
+@figure('case8_glucose_age_box', ('blood_glucose_level', 'age_group'))
+def _case8_glucose_age_box(agg):
+    return 'glucose_by_age_group', (agg.box_stats(('blood_glucose_level', 'age_group')),)
+
+
+@figure('case9_comorbidity')
+def _case9_comorbidity(agg):
+    return 'comorbidity_radial', (COMORBIDITY_LABELS, comorbidity_shares(agg.cube))
+
+
+@figure('case10_bmi_trend', 'yearly')
+def _case10_bmi_trend(agg, years=None):
+    return 'yearly_trend', (
+        agg.yearly.trends(years), 'bmi', 'Tren Rata-rata BMI dari Tahun ke Tahun', 'Rata-rata BMI', 0,
+    )
+
+
+@figure('case10_hba1c_trend', 'yearly')
+def _case10_hba1c_trend(agg, years=None):
+    return 'yearly_trend', (
+        agg.yearly.trends(years), 'hbA1c_level', 'Tren Rata-rata HbA1c dari Tahun ke Tahun', 'Rata-rata HbA1c Level', 1,
+    )
+
+
+@native('case10_bmi_trend')
+def _case10_bmi_trend_native(agg, years=None):
+    trends = agg.yearly.trends(years).set_index('year')['bmi'].rename('Rata-rata BMI')
+    return 'line', dict(data=trends, x_label='Tahun', y_label='Rata-rata BMI')
+
+
+@native('case10_hba1c_trend')
+def _case10_hba1c_trend_native(agg, years=None):
+    trends = agg.yearly.trends(years).set_index('year')['hbA1c_level'].rename('Rata-rata HbA1c Level')
+    return 'line', dict(data=trends, x_label='Tahun', y_label='Rata-rata HbA1c Level')
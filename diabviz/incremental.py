@@ -0,0 +1,210 @@
+"""Refresh inkremental saat baris atau file batch baru ditambahkan ke dataset.
+
+`LiveDataset` menyimpan posisi byte terakhir yang sudah dibaca dari CSV dan
+daftar file batch yang sudah diingesti. Saat `refresh()`:
+- jika CSV hanya bertambah di akhir, hanya byte baru yang di-parse, per blok
+  `BLOCK_BYTES` agar memori sementaranya terbatas;
+- file `*.csv` baru di direktori batch dibaca utuh (file batch dianggap tidak
+  berubah setelah ditulis; tulis ke nama sementara lalu rename);
+- batch dipra-proses sendiri (kolom turunan hanya untuk baris baru),
+  diringkas ke `StreamAggregates` tersendiri, lalu digabung dengan
+  `StreamAggregates.merge`.
+
+Baris disimpan sebagai daftar potongan frame: snapshot awal (di-memory-map,
+lihat diabviz/loader.py) lalu satu potongan per batch. Potongan baru hanya
+ditambahkan ke ujung daftar, dan bitmap indeks filter tumbuh dengan kapasitas
+cadangan (lihat `BitmapIndex.extend`), sehingga refresh tidak menyalin baris
+lama dan snapshot tetap dibagi tanpa salinan. Seleksi filter mengambil baris
+dari setiap potongan; frame utuh (`frame`) baru disambung saat diminta dan
+di-cache sampai ada batch berikutnya.
+
+Daftar potongan, indeks, dan agregat yang sudah terbit tidak pernah diubah di
+tempat: refresh membuat objek baru lalu mengganti referensinya. Sesi yang
+sedang berjalan tetap memakai snapshot lama yang konsisten, tanpa salinan per
+sesi (turunan frame aman karena pandas memakai copy-on-write).
+
+Biaya refresh sebanding dengan ukuran batch. Jika CSV ditulis ulang (ukuran
+mengecil atau awal/akhir data lama berubah), dataset dimuat ulang penuh.
+"""
+import hashlib
+import io
+import os
+import threading
+
+import pandas as pd
+
+from diabviz.bitmap import BitmapIndex, shared_index
+from diabviz.ingest import DEFAULT_CHUNK_ROWS, aggregate_frame, ingest_csv
+from diabviz.loader import (
+    CSV_DTYPES, dataset_fingerprint, file_stat, index_path, load_frame, preprocess, read_csv_typed,
+)
+
+# Jumlah byte di awal dan akhir data lama yang dicek untuk mendeteksi penulisan ulang
+MARKER_BYTES = 4096
+# Ukuran blok byte baru yang di-parse sekaligus (sekitar 200 ribu baris dataset ini)
+BLOCK_BYTES = 16 * 2**20
+
+
+def _marker(file_path, offset):
+    """Hash dari `MARKER_BYTES` pertama dan terakhir sebelum `offset`."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        h.update(f.read(min(offset, MARKER_BYTES)))
+        f.seek(max(offset - MARKER_BYTES, 0))
+        h.update(f.read(min(offset, MARKER_BYTES)))
+    return h.hexdigest()
+
+
+def read_appended(file_path, offset, columns, block_bytes=BLOCK_BYTES):
+    """Mem-parse baris lengkap setelah byte `offset` per blok `block_bytes`; menghasilkan (frame, offset baru) per blok.
+
+    Baris terakhir yang belum diakhiri newline (masih ditulis) dibiarkan untuk refresh berikutnya.
+    """
+    with open(file_path, 'rb') as f:
+        f.seek(offset)
+        rest = b''
+        while block := f.read(block_bytes):
+            data = rest + block
+            end = data.rfind(b'\n') + 1
+            rest = data[end:]
+            if not end:
+                continue
+            batch = pd.read_csv(io.BytesIO(data[:end]), header=None, names=columns, dtype=CSV_DTYPES)
+            offset += end
+            yield preprocess(batch), offset
+
+
+def concat_frames(frames):
+    """Menyambung `frames` (kolom sama) dengan tetap mempertahankan kolom kategorikal."""
+    if len(frames) == 1:
+        return frames[0]
+    columns = frames[0].columns
+    frames = [frame[columns].copy(deep=False) for frame in frames]
+    for col in columns:
+        if isinstance(frames[0][col].dtype, pd.CategoricalDtype):
+            # Kategori lama lebih dulu, lalu kategori yang baru muncul di batch berikutnya
+            categories = frames[0][col].cat.categories
+            for frame in frames[1:]:
+                categories = categories.append(frame[col].cat.categories.difference(categories, sort=False))
+            dtype = pd.CategoricalDtype(categories)
+            for frame in frames:
+                frame[col] = frame[col].astype(dtype)
+    return pd.concat(frames, ignore_index=True)
+
+
+class LiveDataset:
+    """Dataset (CSV utama + file batch opsional) beserta agregatnya, bisa di-refresh secara inkremental.
+
+    Di mode memori `parts` berisi potongan frame (snapshot lalu batch), `frame`
+    semua baris, dan `index` indeks bitmap untuk filter (lihat
+    diabviz/bitmap.py); di mode streaming ketiganya kosong/None dan hanya
+    agregat yang disimpan. Aman dipakai bersama oleh banyak sesi. Dengan
+    `shared=True` indeks disimpan di samping snapshot dan di-memory-map, sehingga
+    frame maupun indeks dibagi dengan proses server lain.
+    """
+
+    def __init__(self, file_path, batch_dir=None, streaming=False, chunk_rows=DEFAULT_CHUNK_ROWS, shared=False):
+        self.file_path = file_path
+        self.batch_dir = batch_dir
+        self.streaming = streaming
+        self.chunk_rows = chunk_rows
+        self.shared = shared
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        stat = file_stat(self.file_path)
+        if stat is None:
+            raise FileNotFoundError(self.file_path)
+        self.fingerprint = dataset_fingerprint(self.file_path, stat)
+        self.columns = list(pd.read_csv(self.file_path, nrows=0).columns)
+        self._combined = None
+        if self.streaming:
+            self.parts, self.index = (), None
+            self.aggregates = ingest_csv(self.file_path, self.chunk_rows)
+        else:
+            frame = load_frame(self.file_path)
+            self.parts = (frame,)
+            if self.shared:
+                self.index = shared_index(frame, index_path(self.file_path), self.fingerprint)
+            else:
+                self.index = BitmapIndex.build(frame)
+            self.aggregates = aggregate_frame(frame, self.chunk_rows)
+        self.offset = stat[0]
+        self._marker = _marker(self.file_path, self.offset)
+        self.batch_files = set()
+        self._ingest_batch_files()
+
+    def version(self, part):
+        """Kunci cache untuk satu bagian agregat (lihat `StreamAggregates.versions`)."""
+        return self.fingerprint, self.aggregates.versions[part]
+
+    @property
+    def frame(self):
+        """Semua baris sebagai satu frame (None di mode streaming); disambung sekali per versi potongan."""
+        parts = self.parts
+        if not parts:
+            return None
+        combined = self._combined
+        if combined is None or combined[0] is not parts:
+            combined = (parts, concat_frames(list(parts)))
+            self._combined = combined
+        return combined[1]
+
+    def select(self, filters):
+        """Baris yang lolos `filters` (lihat `BitmapIndex.select`); hanya di mode memori."""
+        # Indeks dibaca lebih dulu: potongan tidak pernah lebih sedikit dari baris di indeks yang sudah terbit
+        index = self.index
+        parts = self.parts
+        mask = index.select(filters)
+        selected, start = [], 0
+        for part in parts:
+            stop = min(start + len(part), index.n_rows)
+            if stop <= start:
+                break
+            selected.append(part.iloc[:stop - start][mask[start:stop]])
+            start = stop
+        return concat_frames(selected)
+
+    def _add(self, batch):
+        if batch is None or batch.empty:
+            return 0
+        if self.parts:
+            self.parts = (*self.parts, batch[self.parts[0].columns])
+            self.index = self.index.extend(batch)
+        self.aggregates = self.aggregates.merge(aggregate_frame(batch, self.chunk_rows))
+        return len(batch)
+
+    def _ingest_batch_files(self):
+        if not self.batch_dir or not os.path.isdir(self.batch_dir):
+            return 0
+        added = 0
+        for name in sorted(os.listdir(self.batch_dir)):
+            if not name.endswith('.csv') or name in self.batch_files:
+                continue
+            path = os.path.join(self.batch_dir, name)
+            if self.streaming:
+                for chunk in pd.read_csv(path, dtype=CSV_DTYPES, chunksize=self.chunk_rows):
+                    added += self._add(preprocess(chunk))
+            else:
+                added += self._add(read_csv_typed(path))
+            self.batch_files.add(name)
+        return added
+
+    def refresh(self):
+        """Mengingesti data baru, jika ada. Mengembalikan jumlah baris baru (-1 jika dimuat ulang penuh)."""
+        with self._lock:
+            stat = file_stat(self.file_path)
+            if stat is None:
+                # File sementara tidak ada (misal sedang diganti): tetap pakai data terakhir
+                return 0
+            if stat[0] < self.offset or _marker(self.file_path, self.offset) != self._marker:
+                self._load()
+                return -1
+
+            added = 0
+            if stat[0] > self.offset:
+                for batch, self.offset in read_appended(self.file_path, self.offset, self.columns):
+                    added += self._add(batch)
+                self._marker = _marker(self.file_path, self.offset)
+            return added + self._ingest_batch_files()
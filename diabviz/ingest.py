@@ -0,0 +1,183 @@
+"""Ingesti CSV per chunk (out-of-core) untuk dataset yang lebih besar dari RAM.
+
+CSV dibaca dengan `read_csv(chunksize=...)`. Setiap chunk dipra-proses lalu
+langsung diringkas ke agregat yang bisa digabung (kubus jumlah, histogram
+usia, sketsa box plot, co-moment, partisi per tahun, sampel bubble chart,
+profil dataset untuk sidebar).
+Frame lengkap tidak pernah dibentuk, sehingga memori puncak dibatasi oleh
+ukuran chunk dan ukuran agregat.
+
+Agregasi berkelompok (kubus, partisi per tahun, histogram box plot) dan
+pembacaan CSV dijalankan oleh backend kueri yang dipilih di config
+(pandas, DuckDB, atau Polars; lihat diabviz/query.py).
+
+Setiap bagian agregat punya nomor versi yang naik hanya jika chunk baru
+benar-benar mengubahnya, sehingga chart yang datanya tidak berubah tetap
+diambil dari cache saat data baru ditambahkan (lihat diabviz/incremental.py).
+"""
+from collections import Counter
+
+import pandas as pd
+
+from diabviz import config, query
+from diabviz.boxstats import BoxSketch, box_stats
+from diabviz.correlation import CoMoments, moment_frame
+from diabviz.cube import CUBE_DIMS, build_cube, merge_cubes
+from diabviz.density import ValueHistogram
+from diabviz.loader import preprocess
+from diabviz.partitions import YearPartitions
+from diabviz.profile import DatasetProfile
+from diabviz.sampling import StratifiedSample
+from diabviz.scatter import ScatterAccumulator
+
+DEFAULT_CHUNK_ROWS = 200_000
+HEAD_ROWS = 5
+
+# Box plot yang ditampilkan halaman: (kolom nilai, kolom grup)
+BOX_PLOTS = [
+    ('blood_glucose_level', 'diabetes'),
+    ('bmi', 'diabetes'),
+    ('hbA1c_level', 'diabetes'),
+    ('blood_glucose_level', 'age_group'),
+]
+BOX_RESOLUTION = 0.01
+TREND_COLUMNS = ['bmi', 'hbA1c_level']
+
+
+class StreamAggregates:
+    """Semua ringkasan yang dibutuhkan halaman, di-update per chunk tanpa menyalin baris.
+
+    Jika `sample_rows` > 0 (bawaan: `config.PREVIEW_ROWS`), sampel berstrata
+    untuk mode pratinjau juga dikumpulkan (lihat diabviz/sampling.py). Dengan
+    `profile=False` profil dataset (hanya dipakai sidebar untuk seluruh data)
+    tidak dihitung dan `profile` bernilai None.
+
+    Di mode memori `frames` menunjuk potongan frame sumbernya (tanpa salinan),
+    sehingga box plot dihitung tepat dari baris (`box_stats`); di mode
+    streaming `frames` bernilai None dan box plot diambil dari `BoxSketch`.
+    """
+
+    def __init__(self, sample_rows=None, profile=True):
+        self.n_rows = 0
+        self.head = None
+        self.cube = None
+        self.age_all = ValueHistogram(0, 100)
+        self.age_diabetic = ValueHistogram(0, 100)
+        self.box = {key: BoxSketch(BOX_RESOLUTION) for key in BOX_PLOTS}
+        self.moments = None
+        self.profile = DatasetProfile() if profile else None
+        self.yearly = YearPartitions(TREND_COLUMNS)
+        self.scatter = ScatterAccumulator()
+        self.sample = StratifiedSample(config.PREVIEW_ROWS if sample_rows is None else sample_rows)
+        self.versions = Counter()
+        self.frames = None
+        self._exact_box = {}
+
+    def box_stats(self, key):
+        """Statistik box plot untuk `key` (kolom nilai, kolom grup) dari `BOX_PLOTS`: tepat jika baris tersedia."""
+        if self.frames is None:
+            return self.box[key].stats()
+        if key not in self._exact_box:
+            value, by = key
+            rows = pd.concat([frame[[by, value]] for frame in self.frames], ignore_index=True)
+            self._exact_box[key] = box_stats(rows, value, by)
+        return self._exact_box[key]
+
+    def update(self, chunk):
+        """Menambahkan satu chunk yang sudah dipra-proses (lihat `loader.preprocess`)."""
+        numeric = moment_frame(chunk)
+        if self.head is None:
+            self.head = chunk.head(HEAD_ROWS)
+            self.moments = CoMoments(numeric.columns)
+
+        self.n_rows += len(chunk)
+        backend = query.backend()
+        self.cube = merge_cubes(self.cube, build_cube(chunk))
+        self.age_all.update(chunk['age'])
+        self.age_diabetic.update(chunk.loc[chunk['diabetes'] == 1, 'age'])
+        for (value, by), sketch in self.box.items():
+            sketch.add(backend.bin_counts(chunk, value, by, sketch.resolution))
+        self.moments.update(numeric)
+        if self.profile is not None:
+            self.profile.update(chunk)
+        self.yearly = self.yearly.merge(YearPartitions.from_frame(chunk, TREND_COLUMNS))
+        n_young = self.scatter.n_rows
+        self.scatter.update(chunk)
+        self.sample.update(chunk)
+        self._bump(chunk, self.scatter.n_rows != n_young)
+        return self
+
+    def _bump(self, chunk, scatter_changed):
+        """Menaikkan versi bagian agregat yang berubah karena `chunk`."""
+        if chunk.empty:
+            return
+        parts = ['rows', 'cube', 'age_all', 'moments', 'yearly', *self.box]
+        if (chunk['diabetes'] == 1).any():
+            parts.append('age_diabetic')
+        if scatter_changed:
+            parts.append('scatter')
+        self.versions.update(parts)
+
+    def merge(self, other):
+        """Menggabungkan agregat dari dua bagian data (urutan: self lalu other)."""
+        if other.head is None:
+            return self
+        if self.head is None:
+            return other
+        merged = StreamAggregates()
+        merged.n_rows = self.n_rows + other.n_rows
+        merged.head = self.head
+        merged.cube = merge_cubes(self.cube, other.cube)
+        merged.age_all = self.age_all.merge(other.age_all)
+        merged.age_diabetic = self.age_diabetic.merge(other.age_diabetic)
+        merged.box = {key: sketch.merge(other.box[key]) for key, sketch in self.box.items()}
+        merged.moments = self.moments.merge(other.moments)
+        merged.profile = self.profile.merge(other.profile) if self.profile is not None else None
+        merged.yearly = self.yearly.merge(other.yearly)
+        merged.scatter = self.scatter.merge(other.scatter)
+        merged.sample = self.sample.merge(other.sample)
+        merged.versions = self.versions + other.versions
+        if self.frames is not None and other.frames is not None:
+            merged.frames = self.frames + other.frames
+        return merged
+
+    @classmethod
+    def from_sample(cls, design, mask):
+        """Agregat pratinjau dari baris sampel `mask` (lihat `SampleDesign`).
+
+        Jumlah (kubus, histogram usia, jumlah baris) diskalakan dengan bobot
+        sampel; statistik lain (box plot, korelasi, tren, bubble chart)
+        dihitung langsung dari sampel.
+        """
+        rows, weights = design.rows[mask], design.weights[mask]
+        aggregates = cls(sample_rows=0, profile=False)
+        if rows.empty:
+            return aggregates
+        aggregates.update(rows)
+        aggregates.n_rows = int(round(weights.sum()))
+        cube = rows[CUBE_DIMS].assign(count=weights).groupby(CUBE_DIMS, observed=True, dropna=False, sort=False)['count'].sum()
+        aggregates.cube = cube.round().astype('int64').reset_index()
+        aggregates.age_all = ValueHistogram(0, 100).update(rows['age'], weights)
+        diabetic = (rows['diabetes'] == 1).to_numpy()
+        aggregates.age_diabetic = ValueHistogram(0, 100).update(rows.loc[diabetic, 'age'], weights[diabetic])
+        return aggregates
+
+
+def aggregate_frame(frame, chunk_rows=DEFAULT_CHUNK_ROWS, sample_rows=None, profile=True):
+    """`StreamAggregates` dari frame yang sudah dipra-proses, diringkas per irisan `chunk_rows` baris.
+
+    Sama seperti `ingest_csv`, memori sementara agregasi dibatasi ukuran irisan, bukan ukuran frame.
+    """
+    aggregates = StreamAggregates(sample_rows, profile)
+    for start in range(0, len(frame), chunk_rows):
+        aggregates.update(frame.iloc[start:start + chunk_rows])
+    aggregates.frames = (frame,)
+    return aggregates
+
+
+def ingest_csv(file_path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Membaca CSV per chunk (lewat backend kueri) dan mengembalikan `StreamAggregates`-nya."""
+    aggregates = StreamAggregates()
+    for chunk in query.backend().batches(file_path, chunk_rows):
+        aggregates.update(preprocess(chunk))
+    return aggregates
@@ -0,0 +1,74 @@
+"""Partisi per tahun untuk tren tahunan (Studi Kasus 10).
+
+Data diringkas per tahun: setiap tahun adalah satu partisi berisi banyaknya
+nilai (count), jumlah (sum), dan jumlah kuadrat (sumsq) untuk setiap metrik.
+Rata-rata dan simpangan baku per tahun dihitung dari ringkasan ini tanpa
+membaca baris, dan pemilihan rentang tahun hanya membaca partisi di rentang
+itu.
+
+Partisi tidak pernah diubah di tempat. `merge` hanya menjumlahkan partisi
+tahun yang muncul di data baru; partisi tahun lain dipakai ulang apa adanya,
+sehingga file batch untuk tahun baru tidak memproses ulang tahun sebelumnya.
+"""
+import numpy as np
+import pandas as pd
+
+from diabviz import query
+
+
+class YearPartitions:
+    """Ringkasan (count, sum, sumsq) per tahun untuk `columns`."""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        # tahun -> array read-only berukuran (len(GROUP_STATS), len(columns))
+        self.parts = {}
+
+    @classmethod
+    def from_frame(cls, frame, columns):
+        partitions = cls(columns)
+        table = query.backend().group_sums(frame, 'year', partitions.columns)
+        for year, row in table.iterrows():
+            part = row.to_numpy(float).reshape(len(partitions.columns), len(query.GROUP_STATS)).T.copy()
+            part.flags.writeable = False
+            partitions.parts[int(year)] = part
+        return partitions
+
+    def merge(self, other):
+        merged = YearPartitions(self.columns)
+        merged.parts = dict(self.parts)
+        for year, part in other.parts.items():
+            if year in merged.parts:
+                part = merged.parts[year] + part
+                part.flags.writeable = False
+            merged.parts[year] = part
+        return merged
+
+    @property
+    def years(self):
+        return sorted(self.parts)
+
+    def select(self, years=None):
+        """Tahun-tahun di rentang `years` (lo, hi) inklusif; semua tahun jika None."""
+        if years is None:
+            return self.years
+        lo, hi = years
+        return [year for year in self.years if lo <= year <= hi]
+
+    def summary(self, years=None):
+        """DataFrame per tahun: n, rata-rata, dan simpangan baku (ddof=1) setiap metrik."""
+        selected = self.select(years)
+        stats = np.array([self.parts[year] for year in selected]).reshape(len(selected), len(query.GROUP_STATS), -1)
+        count, total, sumsq = (stats[:, i] for i in range(len(query.GROUP_STATS)))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = total / count
+            std = np.sqrt(np.maximum(sumsq - total * mean, 0) / (count - 1))
+        frames = {'n': count.astype('int64'), 'mean': mean, 'std': std}
+        table = pd.concat({stat: pd.DataFrame(values, columns=self.columns) for stat, values in frames.items()}, axis=1)
+        table.index = pd.Index(selected, name='year')
+        return table.swaplevel(axis=1)[[(col, stat) for col in self.columns for stat in frames]]
+
+    def trends(self, years=None):
+        """Rata-rata per tahun dengan format yang sama seperti groupby('year').mean().reset_index()."""
+        summary = self.summary(years)
+        return pd.DataFrame({col: summary[(col, 'mean')] for col in self.columns}).reset_index()
@@ -0,0 +1,258 @@
+"""Pencatatan waktu dan memori per bagian halaman (opt-in).
+
+Profiling aktif dengan `DIABVIZ_PROFILE=1` atau query param `?profile=1`.
+`begin_run()` dipanggil di awal setiap run skrip; setelah itu setiap blok
+`with section(name):` dicatat ke `RunRecord` milik run tersebut: durasi,
+selisih memori yang dialokasikan Python (tracemalloc), dan selisih RSS proses.
+tracemalloc hanya aktif selama ada run yang diprofil (dihitung per run;
+run yang tidak sampai `end_run`, misalnya terhenti di tengah, dilepas di
+`begin_run` berikutnya), karena melambatkan semua alokasi di proses.
+Run yang sedang berjalan disimpan per thread (setiap sesi Streamlit
+menjalankan skrip di thread-nya sendiri). Jika profiling nonaktif, `section`
+tidak mencatat apa pun.
+
+Hit/miss cache dihitung selalu (murah) untuk seluruh proses, dan juga per run
+jika profiling aktif. Ukuran chart yang dikirim ke browser (gambar, tabel chart
+native) dihitung per run, juga selalu (`count_payload`, `payload_bytes`). Catatan memori adalah angka proses, jadi bisa ikut
+terpengaruh sesi lain yang berjalan bersamaan.
+"""
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+_local = threading.local()
+_lock = threading.Lock()
+
+# Run terakhir di proses ini (dibaca oleh benchmark, lihat bench/run.py)
+LAST_RUN = None
+
+# Jumlah hit/miss cache per nama cache sejak proses dimulai: {(nama, 'hit'|'miss'): n}
+CACHE_STATS = Counter()
+
+# Run yang sedang diprofil (dan menahan tracemalloc tetap aktif), serta apakah tracemalloc dinyalakan modul ini
+_traced_runs = set()
+_owns_tracing = False
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def current_rss():
+    """RSS proses saat ini dalam byte, atau None jika tidak tersedia (non-Linux)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class RunRecord:
+    """Daftar bagian yang dijalankan dalam satu run, dengan durasi, memori, dan kedalaman nesting."""
+
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        self.sections = []
+        self.cache = Counter()
+        self.payload = Counter()
+        self.depth = 0
+        self.thread = threading.current_thread()
+
+    def as_dict(self):
+        return {s['name']: s['seconds'] for s in self.sections}
+
+    def table(self):
+        """Baris tabel timing (nama diindentasi sesuai nesting), urut sesuai eksekusi."""
+        return [
+            {
+                'Bagian': ' ' * s['depth'] + s['name'],
+                'Waktu (ms)': round(s['seconds'] * 1000, 1),
+                'Alokasi (KB)': round(s['alloc_bytes'] / 1024, 1) if s['alloc_bytes'] is not None else None,
+                'RSS (KB)': round(s['rss_bytes'] / 1024, 1) if s['rss_bytes'] is not None else None,
+            }
+            for s in self.sections
+        ]
+
+    def log_record(self):
+        return {
+            'time': time.time(),
+            'total_seconds': time.perf_counter() - self.started,
+            'sections': self.sections,
+            'cache': {f'{name}:{kind}': n for (name, kind), n in self.cache.items()},
+            'payload': dict(self.payload),
+        }
+
+
+def begin_run(enabled, started=None):
+    """Memulai pencatatan untuk run ini; mengembalikan `RunRecord` atau None jika nonaktif.
+
+    Jika `started` (nilai `time.perf_counter()` di baris pertama skrip) diisi,
+    waktu sejak itu dicatat sebagai bagian 'imports'. Di run pertama proses
+    baru, angka ini adalah biaya impor modul app.
+    """
+    global LAST_RUN
+    with _lock:
+        # Run yang berhenti sebelum `end_run`: run sebelumnya di thread ini dan run di thread yang sudah selesai
+        for stale in [r for r in _traced_runs if r.thread is threading.current_thread() or not r.thread.is_alive()]:
+            _release(stale)
+    _local.run = RunRecord(started) if enabled else None
+    _local.payload = _local.run.payload if enabled else Counter()
+    if enabled:
+        LAST_RUN = _local.run
+        if started is not None:
+            _local.run.sections.append({
+                'name': 'imports', 'depth': 0, 'start': 0.0, 'seconds': time.perf_counter() - started,
+                'alloc_bytes': None, 'rss_bytes': None,
+            })
+        _trace(_local.run)
+    return _local.run
+
+
+def _trace(run):
+    """Menahan tracemalloc aktif selama `run` belum dilepas."""
+    global _owns_tracing
+    with _lock:
+        if not _traced_runs and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _owns_tracing = True
+        _traced_runs.add(run)
+
+
+def _release(run):
+    """Melepas `run`; tracemalloc dimatikan jika tidak ada lagi run yang diprofil (panggil dengan `_lock`)."""
+    global _owns_tracing
+    _traced_runs.discard(run)
+    if not _traced_runs and _owns_tracing:
+        tracemalloc.stop()
+        _owns_tracing = False
+
+
+def end_run(log_path=None):
+    """Menutup run; jika `log_path` diisi, catatan run ditambahkan sebagai satu baris JSON."""
+    run = getattr(_local, 'run', None)
+    if run is None:
+        return run
+    with _lock:
+        _release(run)
+    if not log_path:
+        return run
+    line = json.dumps(run.log_record())
+    with _lock, open(log_path, 'a') as f:
+        f.write(line + '\n')
+    return run
+
+
+@contextmanager
+def section(name):
+    """Mencatat durasi dan selisih memori blok sebagai bagian `name` dari run yang sedang berjalan."""
+    run = getattr(_local, 'run', None)
+    if run is None:
+        yield
+        return
+    record = {
+        'name': name, 'depth': run.depth, 'start': time.perf_counter() - run.started,
+        'seconds': None, 'alloc_bytes': None, 'rss_bytes': None,
+    }
+    run.sections.append(record)
+    run.depth += 1
+    traced = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+    rss = current_rss()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record['seconds'] = time.perf_counter() - start
+        if traced is not None and tracemalloc.is_tracing():
+            record['alloc_bytes'] = tracemalloc.get_traced_memory()[0] - traced
+        if rss is not None:
+            record['rss_bytes'] = current_rss() - rss
+        run.depth -= 1
+
+
+def count_cache(name, hit):
+    """Mencatat satu hit atau miss untuk cache `name`."""
+    key = (name, 'hit' if hit else 'miss')
+    with _lock:
+        CACHE_STATS[key] += 1
+    run = getattr(_local, 'run', None)
+    if run is not None:
+        run.cache[key] += 1
+
+
+def count_payload(name, nbytes):
+    """Mencatat `nbytes` byte yang dikirim ke browser untuk chart `name` di run ini."""
+    payload = getattr(_local, 'payload', None)
+    if payload is not None:
+        payload[name] += nbytes
+
+
+def payload_bytes():
+    """Total byte chart yang dikirim ke browser sejauh ini di run ini."""
+    return sum(getattr(_local, 'payload', {}).values())
+
+
+def counted(cache_decorator):
+    """Membungkus `st.cache_data(...)`/`st.cache_resource(...)` agar hit/miss-nya dihitung.
+
+    Badan fungsi hanya dijalankan saat miss, jadi miss dihitung di dalam dan
+    panggilan di luar; hit adalah selisihnya.
+    """
+    def wrap(func):
+        ran = threading.local()
+
+        @functools.wraps(func)
+        def body(*args, **kwargs):
+            ran.miss = True
+            return func(*args, **kwargs)
+
+        cached = cache_decorator(body)
+
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            ran.miss = False
+            result = cached(*args, **kwargs)
+            count_cache(func.__name__, hit=not ran.miss)
+            return result
+
+        call.clear = cached.clear
+        return call
+    return wrap
+
+
+def cache_table():
+    """Baris tabel hit/miss per cache untuk seluruh proses."""
+    names = sorted({name for name, _ in CACHE_STATS})
+    rows = []
+    for name in names:
+        hits, misses = CACHE_STATS[(name, 'hit')], CACHE_STATS[(name, 'miss')]
+        rows.append({'Cache': name, 'Hit': hits, 'Miss': misses, 'Hit rate': hits / max(hits + misses, 1)})
+    return rows
+
+
+def flame_figure(run):
+    """Breakdown gaya flame graph: satu bar per bagian, posisi = waktu mulai, baris = kedalaman."""
+    import plotly.graph_objects as go
+
+    sections = [s for s in run.sections if s['seconds'] is not None]
+    fig = go.Figure(go.Bar(
+        x=[s['seconds'] * 1000 for s in sections],
+        base=[s['start'] * 1000 for s in sections],
+        y=[s['depth'] for s in sections],
+        orientation='h',
+        text=[s['name'] for s in sections],
+        textposition='inside',
+        insidetextanchor='start',
+        hovertemplate='%{text}<br>%{x:.1f} ms<extra></extra>',
+        marker=dict(color=[s['seconds'] for s in sections], colorscale='Viridis'),
+    ))
+    fig.update_layout(
+        height=80 + 40 * (max((s['depth'] for s in sections), default=0) + 1),
+        margin=dict(l=10, r=10, t=10, b=30),
+        xaxis_title='ms sejak awal run',
+        yaxis=dict(autorange='reversed', showticklabels=False),
+        bargap=0.05,
+    )
+    return fig
@@ -0,0 +1,132 @@
+"""Profil dataset untuk sidebar: statistik ringkasan, tipe, nilai kosong, dan memori.
+
+Setiap chunk diringkas dalam satu lintasan vektor atas matriks kolom numerik
+(jumlah, rata-rata, M2, minimum, maksimum, histogram nilai) ditambah jumlah
+nilai kosong dan memori per kolom. Ringkasan bisa digabung, jadi profil
+dibangun sekali saat data dimuat dan di-update saat batch baru masuk.
+Kuantil diambil dari histogram nilai (`BoxSketch` dengan kolom sebagai grup),
+tepat untuk data yang sudah berada pada grid `RESOLUTION`. Histogram dihitung
+per kolom dari kunci bin int64, dan chunk besar diringkas per irisan
+`config.CHUNK_ROWS` baris agar matriks sementaranya tetap kecil.
+"""
+import numpy as np
+import pandas as pd
+
+from diabviz import config
+from diabviz.boxstats import BoxSketch, grid_counts
+
+QUANTILES = [0.25, 0.5, 0.75]
+RESOLUTION = 0.01
+
+
+class DatasetProfile:
+    """Statistik seperti `df.describe()`, `df.info()`, dan `df.isnull().sum()` yang bisa di-update per chunk."""
+
+    def __init__(self, resolution=RESOLUTION):
+        self.n_rows = 0
+        self.dtypes = None
+        self.columns = None
+        self.count = None
+        self.mean = None
+        self.m2 = None
+        self.minimum = None
+        self.maximum = None
+        self.nulls = None
+        self.memory = None
+        self.sketch = BoxSketch(resolution)
+
+    def update(self, chunk):
+        """Menambahkan satu chunk (semua chunk harus memiliki kolom yang sama)."""
+        for start in range(0, max(len(chunk), 1), config.CHUNK_ROWS):
+            self._update(chunk.iloc[start:start + config.CHUNK_ROWS])
+        return self
+
+    def _update(self, chunk):
+        numeric = chunk.select_dtypes('number')
+        if self.dtypes is None:
+            self.dtypes = chunk.dtypes
+            self.columns = list(numeric.columns)
+            k = len(self.columns)
+            self.count, self.mean, self.m2 = np.zeros(k), np.zeros(k), np.zeros(k)
+            self.minimum, self.maximum = np.full(k, np.inf), np.full(k, -np.inf)
+            self.nulls = pd.Series(0, index=chunk.columns, dtype='int64')
+            self.memory = pd.Series(0, index=chunk.columns, dtype='int64')
+
+        values = numeric[self.columns].to_numpy(dtype='float64')
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(valid, values, 0).sum(axis=0) / count
+            m2 = (np.where(valid, values - mean, 0) ** 2).sum(axis=0)
+        self._merge_moments(count, np.nan_to_num(mean), m2)
+        self.minimum = np.fmin(self.minimum, np.where(valid, values, np.inf).min(axis=0, initial=np.inf))
+        self.maximum = np.fmax(self.maximum, np.where(valid, values, -np.inf).max(axis=0, initial=-np.inf))
+
+        resolution = self.sketch.resolution
+        counts = []
+        for i in range(len(self.columns)):
+            bins = np.round(values[valid[:, i], i] / resolution).astype(np.int64)
+            keys, n = np.unique(bins, return_counts=True)
+            counts.append(grid_counts(np.full(len(keys), i), keys, n))
+        if counts:
+            self.sketch.add(pd.concat(counts))
+
+        self.n_rows += len(chunk)
+        self.nulls += chunk.isna().sum()
+        self.memory += chunk.memory_usage(index=False, deep=True)
+
+    def _merge_moments(self, count, mean, m2):
+        # Rumus paralel Chan per kolom (lihat diabviz/correlation.py)
+        total = self.count + count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean - self.mean
+            self.mean = np.where(total > 0, self.mean + delta * count / total, 0)
+            self.m2 = self.m2 + m2 + np.where(total > 0, delta ** 2 * self.count * count / total, 0)
+        self.count = total
+
+    def merge(self, other):
+        """Menggabungkan dua profil dengan kolom yang sama."""
+        if other.dtypes is None:
+            return self
+        if self.dtypes is None:
+            return other
+        merged = DatasetProfile(self.sketch.resolution)
+        merged.dtypes, merged.columns = self.dtypes, self.columns
+        merged.count, merged.mean, merged.m2 = self.count, self.mean, self.m2
+        merged._merge_moments(other.count, other.mean, other.m2)
+        merged.minimum = np.fmin(self.minimum, other.minimum)
+        merged.maximum = np.fmax(self.maximum, other.maximum)
+        merged.sketch = self.sketch.merge(other.sketch)
+        merged.n_rows = self.n_rows + other.n_rows
+        merged.nulls = self.nulls + other.nulls
+        merged.memory = self.memory + other.memory
+        return merged
+
+    def describe(self):
+        """Tabel seperti `df.describe().T` untuk kolom numerik."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.sqrt(self.m2 / (self.count - 1))
+        quantiles = self.sketch.quantiles(QUANTILES).reindex(range(len(self.columns)))
+        table = pd.DataFrame({
+            'count': self.count,
+            'mean': np.where(self.count > 0, self.mean, np.nan),
+            'std': std,
+            'min': np.where(self.count > 0, self.minimum, np.nan),
+            **{f'{q:.0%}': quantiles[q].to_numpy() for q in QUANTILES},
+            'max': np.where(self.count > 0, self.maximum, np.nan),
+        }, index=self.columns)
+        return table
+
+    def column_info(self):
+        """Tipe data, jumlah nilai tidak kosong, dan memori per kolom (pengganti `df.info()`)."""
+        return pd.DataFrame({
+            'Non-Null Count': self.n_rows - self.nulls,
+            'Dtype': self.dtypes.astype(str),
+            'Memori (byte)': self.memory,
+        })
+
+    def null_counts(self):
+        return self.nulls.copy()
+
+    def bytes_per_row(self):
+        return self.memory.sum() / max(self.n_rows, 1)
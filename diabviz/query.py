@@ -0,0 +1,197 @@
+"""Backend kueri untuk agregasi berkelompok yang dibutuhkan halaman.
+
+`StreamAggregates` (diabviz/ingest.py) meringkas setiap chunk data menjadi
+agregat yang bisa digabung. Bagian yang berupa agregasi berkelompok
+dijalankan lewat backend:
+- `counts`: jumlah baris per kombinasi kategori (kubus, lihat diabviz/cube.py);
+- `group_sums`: banyaknya nilai, jumlah, dan jumlah kuadrat per grup
+  (partisi per tahun, lihat diabviz/partitions.py);
+- `bin_counts`: jumlah nilai per (grup, bin) untuk kuantil box plot
+  (lihat `BoxSketch`);
+- `batches`: membaca file CSV per chunk untuk mode streaming.
+
+Backend dipilih dengan `DIABVIZ_BACKEND` (lihat diabviz/config.py):
+- 'pandas' (bawaan, tanpa dependensi tambahan);
+- 'duckdb' atau 'polars' (opsional, `pip install duckdb` / `pip install polars`):
+  membaca CSV per batch dengan reader-nya sendiri dan menjalankan agregasi
+  secara multi-thread dengan `DIABVIZ_QUERY_THREADS` thread.
+Semua backend mengembalikan hasil dengan format yang sama seperti backend
+pandas, sehingga agregat dari backend berbeda bisa digabung.
+
+Batasan: agregasi tidak didorong ke pembacaan file. Setiap batch diubah dulu
+menjadi frame pandas dan dipra-proses (`loader.preprocess`), lalu setiap
+agregasi dijalankan terpisah atas frame itu; DuckDB/Polars hanya mempercepat
+pembacaan CSV dan group-by per chunk, bukan memindai file sekali untuk
+semua agregat.
+"""
+import functools
+import os
+
+import pandas as pd
+
+from diabviz import config
+from diabviz.boxstats import bin_counts
+from diabviz.loader import CSV_DTYPES
+
+
+# Statistik per grup dari `group_sums`, cukup untuk rata-rata dan variansi yang bisa digabung
+GROUP_STATS = ('count', 'sum', 'sumsq')
+
+
+def _restore_dtypes(result, frame, columns):
+    """Menyamakan tipe kolom grup hasil backend dengan tipe kolom di `frame` (kategori, int8, ...)."""
+    for col in columns:
+        result[col] = result[col].astype(frame[col].dtype)
+    return result
+
+
+def _sums_table(result, by, columns):
+    """DataFrame berindeks `by` dengan kolom (kolom, statistik), format yang sama dengan `PandasBackend.group_sums`."""
+    table = result.set_index(by)
+    table.columns = pd.MultiIndex.from_tuples([tuple(col.split('|')) for col in table.columns])
+    return table[[(col, stat) for col in columns for stat in GROUP_STATS]].astype('float64').sort_index()
+
+
+class PandasBackend:
+    """Agregasi dengan pandas, satu thread."""
+
+    name = 'pandas'
+
+    def batches(self, file_path, chunk_rows):
+        """Chunk CSV bertipe (`CSV_DTYPES`), belum dipra-proses."""
+        yield from pd.read_csv(file_path, dtype=CSV_DTYPES, chunksize=chunk_rows)
+
+    def counts(self, frame, by):
+        """Jumlah baris per kombinasi `by` yang ada di data (termasuk nilai kosong), kolom 'count'."""
+        counts = frame[by].groupby(by, observed=True, dropna=False, sort=False).size()
+        return counts.rename('count').reset_index()
+
+    def group_sums(self, frame, by, columns):
+        """Banyaknya nilai tidak kosong, jumlah, dan jumlah kuadrat `columns` per `by` (float64)."""
+        values = frame[columns].astype('float64')
+        grouped = values.groupby(frame[by])
+        table = pd.concat({'count': grouped.count(), 'sum': grouped.sum(), 'sumsq': (values ** 2).groupby(frame[by]).sum()}, axis=1)
+        return table.swaplevel(axis=1)[[(col, stat) for col in columns for stat in GROUP_STATS]]
+
+    def bin_counts(self, frame, value, by, resolution):
+        """Jumlah nilai `value` per (grup `by`, bin), lihat `boxstats.bin_counts`."""
+        return bin_counts(frame[by], frame[value], resolution)
+
+
+class DuckDBBackend(PandasBackend):
+    """Agregasi dengan DuckDB (multi-thread); frame pandas dibaca tanpa salinan."""
+
+    name = 'duckdb'
+
+    def __init__(self, threads):
+        import duckdb
+
+        self._db = duckdb.connect(config={'threads': threads})
+
+    def _query(self, sql, **frames):
+        # Satu cursor per kueri: koneksi DuckDB tidak boleh dipakai bersamaan oleh banyak thread
+        cursor = self._db.cursor()
+        try:
+            for name, frame in frames.items():
+                cursor.register(name, frame)
+            return cursor.execute(sql).df()
+        finally:
+            cursor.close()
+
+    def batches(self, file_path, chunk_rows):
+        cursor = self._db.cursor()
+        try:
+            reader = cursor.execute('SELECT * FROM read_csv(?, header = true)', [file_path]).fetch_record_batch(chunk_rows)
+            for batch in reader:
+                yield batch.to_pandas().astype(CSV_DTYPES)
+        finally:
+            cursor.close()
+
+    def counts(self, frame, by):
+        cols = ', '.join(f'"{col}"' for col in by)
+        result = self._query(f'SELECT {cols}, count(*) AS count FROM chunk GROUP BY ALL', chunk=frame[by])
+        return _restore_dtypes(result, frame, by)
+
+    def group_sums(self, frame, by, columns):
+        # NaN dari pandas tetap NaN di DuckDB (bukan NULL), jadi dikecualikan seperti pandas
+        valid = 'FILTER (WHERE NOT isnan("{col}"))'
+        aggs = ', '.join(
+            f'count("{col}") {valid.format(col=col)} AS "{col}|count", '
+            f'coalesce(sum(CAST("{col}" AS DOUBLE)) {valid.format(col=col)}, 0) AS "{col}|sum", '
+            f'coalesce(sum(CAST("{col}" AS DOUBLE) ^ 2) {valid.format(col=col)}, 0) AS "{col}|sumsq"'
+            for col in columns
+        )
+        result = self._query(f'SELECT "{by}", {aggs} FROM chunk GROUP BY ALL', chunk=frame[[by, *columns]])
+        return _sums_table(_restore_dtypes(result, frame, [by]), by, columns)
+
+    def bin_counts(self, frame, value, by, resolution):
+        result = self._query(
+            f'SELECT "{by}" AS "group", CAST(round(CAST("{value}" AS DOUBLE) / {resolution!r}) AS BIGINT) AS bin, '
+            f'count(*) AS count FROM chunk WHERE "{by}" IS NOT NULL AND "{value}" IS NOT NULL '
+            f'AND NOT isnan(CAST("{value}" AS DOUBLE)) GROUP BY ALL',
+            chunk=frame[[by, value]],
+        )
+        return result.astype({'group': object}).set_index(['group', 'bin'])['count']
+
+
+class PolarsBackend(PandasBackend):
+    """Agregasi dengan Polars (multi-thread)."""
+
+    name = 'polars'
+
+    def __init__(self, threads):
+        # Ukuran thread pool Polars hanya dibaca saat modul pertama kali diimpor
+        os.environ.setdefault('POLARS_MAX_THREADS', str(threads))
+        import polars as pl
+
+        self._pl = pl
+
+    def batches(self, file_path, chunk_rows):
+        lazy = self._pl.scan_csv(file_path)
+        if hasattr(lazy, 'collect_batches'):
+            batches = lazy.collect_batches(chunk_size=chunk_rows)
+        else:
+            # Polars lama (sebelum `collect_batches`); `read_csv_batched` sudah dihapus di Polars 2
+            reader = self._pl.read_csv_batched(file_path, batch_size=chunk_rows)
+            batches = iter(lambda: (reader.next_batches(1) or [None])[0], None)
+        for batch in batches:
+            yield batch.to_pandas().astype(CSV_DTYPES)
+
+    def counts(self, frame, by):
+        result = self._pl.from_pandas(frame[by]).group_by(by).len(name='count').to_pandas()
+        return _restore_dtypes(result, frame, by)
+
+    def group_sums(self, frame, by, columns):
+        pl = self._pl
+        aggs = []
+        for col in columns:
+            value = pl.col(col).cast(pl.Float64)
+            aggs += [value.count().alias(f'{col}|count'), value.sum().alias(f'{col}|sum'),
+                     (value ** 2).sum().alias(f'{col}|sumsq')]
+        result = pl.from_pandas(frame[[by, *columns]]).group_by(by).agg(aggs).to_pandas()
+        return _sums_table(_restore_dtypes(result, frame, [by]), by, columns)
+
+    def bin_counts(self, frame, value, by, resolution):
+        pl = self._pl
+        result = (
+            pl.from_pandas(frame[[by, value]])
+            .drop_nulls()
+            .select(pl.col(by).alias('group'), (pl.col(value).cast(pl.Float64) / resolution).round().cast(pl.Int64).alias('bin'))
+            .group_by(['group', 'bin']).len(name='count')
+            .to_pandas()
+        )
+        return result.astype({'group': object}).set_index(['group', 'bin'])['count']
+
+
+BACKENDS = {'pandas': PandasBackend, 'duckdb': DuckDBBackend, 'polars': PolarsBackend}
+
+
+@functools.cache
+def backend(name=None):
+    """Instance backend `name` (bawaan: `config.QUERY_BACKEND`), dibuat sekali per proses."""
+    name = name or config.QUERY_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"backend kueri tidak dikenal: {name!r} (pilihan: {', '.join(BACKENDS)})")
+    if name == 'pandas':
+        return PandasBackend()
+    return BACKENDS[name](config.QUERY_THREADS)
@@ -0,0 +1,167 @@
+"""Lapisan render chart: Figure -> PNG, dengan cache LRU berbatas ukuran.
+
+Setiap chart di-encode sekali menjadi byte PNG dengan kunci
+(fingerprint dataset, id chart, tema, DPI). Rerun berikutnya (misalnya karena
+klik widget di sidebar) langsung memakai byte dari cache tanpa menggambar
+ulang. Figure selalu ditutup setelah di-encode sehingga registry global pyplot
+tidak terus membesar.
+
+Ukuran gambar diatur dengan preset (`CHART_PRESETS`): DPI, lebar maksimum,
+dan jumlah warna palet PNG, atau SVG. Lebar dibatasi di sini, sekali per
+chart, karena st.image memperkecil dan meng-encode ulang setiap gambar yang
+lebih lebar dari batas lebar konten di setiap rerun.
+
+Matplotlib baru diimpor saat sebuah figure benar-benar di-encode, sehingga
+proses yang hanya melayani PNG dari cache tidak pernah memuatnya.
+"""
+import io
+import threading
+from collections import OrderedDict
+
+from diabviz import perf
+
+# Sama dengan bawaan st.pyplot agar tampilan tidak berubah
+SAVEFIG_KWARGS = dict(format='png', dpi=200, bbox_inches='tight')
+
+# Batas lebar gambar st.image (sama dengan `MAXIMUM_CONTENT_WIDTH` Streamlit)
+MAX_CONTENT_WIDTH = 2 * 730
+
+# Preset output chart statis; `colors` = jumlah warna palet PNG (None = RGBA penuh)
+CHART_PRESETS = {
+    'tajam': dict(format='png', dpi=SAVEFIG_KWARGS['dpi'], max_width=MAX_CONTENT_WIDTH, colors=None),
+    'standar': dict(format='png', dpi=120, max_width=MAX_CONTENT_WIDTH, colors=256),
+    'hemat': dict(format='png', dpi=80, max_width=960, colors=64),
+    'svg': dict(format='svg', dpi=72, max_width=None, colors=None),
+}
+
+# Tema seaborn global untuk semua chart (diterapkan oleh diabviz/charts.py).
+# Menggunakan tema 'darkgrid' atau 'whitegrid' dengan palet warna yang modern
+# Atau palette="deep", "pastel", "flare", "magma"
+THEME = dict(style="whitegrid", palette="viridis", font_scale=1.1)
+
+
+def theme_key():
+    """String pendek yang mewakili tema, dipakai sebagai bagian kunci cache."""
+    return ','.join(f'{k}={v}' for k, v in sorted(THEME.items()))
+
+
+class FigureCache:
+    """Cache LRU untuk byte PNG, dibatasi total ukuran dan jumlah entri."""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, max_entries=256):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def nbytes(self):
+        return self._nbytes
+
+    def get(self, key):
+        with self._lock:
+            png = self._entries.get(key)
+            if png is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return png
+
+    def put(self, key, png):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= len(old)
+            self._entries[key] = png
+            self._nbytes += len(png)
+            # Buang entri paling lama dipakai sampai kembali di bawah batas
+            while self._entries and (self._nbytes > self.max_bytes or len(self._entries) > self.max_entries):
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+
+def figure_to_png(fig, dpi=SAVEFIG_KWARGS['dpi']):
+    """Meng-encode Figure ke PNG lalu menutupnya, apa pun hasilnya."""
+    import matplotlib.pyplot as plt
+
+    try:
+        buf = io.BytesIO()
+        fig.savefig(buf, **{**SAVEFIG_KWARGS, 'dpi': dpi})
+        return buf.getvalue()
+    finally:
+        plt.close(fig)
+
+
+def shrink_png(png, max_width=None, colors=None):
+    """Memperkecil PNG ke lebar `max_width` dan/atau mengubahnya ke palet `colors` warna."""
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(png))
+    resize = bool(max_width) and image.width > max_width
+    if not resize and not colors:
+        return png
+    if resize:
+        # Resampling yang sama dengan st.image, jadi tampilan tidak berubah
+        image = image.resize((max_width, int(image.height * max_width / image.width)), Image.BILINEAR)
+    if colors:
+        image = image.quantize(colors, method=Image.Quantize.FASTOCTREE)
+    buf = io.BytesIO()
+    image.save(buf, format='PNG', optimize=True)
+    return buf.getvalue()
+
+
+def figure_to_svg(fig):
+    """Meng-encode Figure ke SVG lalu menutupnya."""
+    import matplotlib.pyplot as plt
+
+    try:
+        buf = io.BytesIO()
+        fig.savefig(buf, format='svg', bbox_inches='tight')
+        return buf.getvalue()
+    finally:
+        plt.close(fig)
+
+
+def encode_figure(fig, format='png', dpi=SAVEFIG_KWARGS['dpi'], max_width=None, colors=None):
+    """Meng-encode Figure sesuai preset (lihat `CHART_PRESETS`) lalu menutupnya."""
+    if format == 'svg':
+        return figure_to_svg(fig)
+    return shrink_png(figure_to_png(fig, dpi=dpi), max_width, colors)
+
+
+def table_nbytes(table):
+    """Perkiraan ukuran tabel yang dikirim ke browser (Arrow IPC, format yang dipakai Streamlit)."""
+    import pyarrow as pa
+
+    if hasattr(table, 'to_frame'):
+        table = table.to_frame()
+    sink = pa.BufferOutputStream()
+    batch = pa.Table.from_pandas(table)
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_table(batch)
+    return sink.getvalue().size
+
+
+def render_png(cache, key, draw, *args, output=None):
+    """Mengambil gambar dari cache, atau memanggil `draw(*args)` dan meng-encode hasilnya dengan preset `output`."""
+    png = cache.get(key)
+    perf.count_cache('figure_png', hit=png is not None)
+    if png is None:
+        png = encode_figure(draw(*args), **(output or {}))
+        cache.put(key, png)
+    return png
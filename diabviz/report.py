@@ -0,0 +1,274 @@
+"""Ekspor laporan HTML statis (EDA + semua studi kasus) dari baris perintah.
+
+    python -m diabviz.report --out laporan/diabetes.html
+
+Chart Matplotlib diambil dari daftar yang sama dengan app.py
+(diabviz/figures.py) dan digambar paralel di `ProcessPoolExecutor`, lalu
+disematkan sebagai PNG base64 bersama teks penjelasan (diabviz/texts.py),
+sehingga laporan berupa satu file HTML mandiri. Bubble chart Studi Kasus 11
+disematkan sebagai chart Plotly (plotly.js ikut di dalam file).
+
+Setiap PNG disimpan di direktori cache di samping laporan bersama sidik jari
+inputnya (nama fungsi chart, data chart, tema, DPI, dan isi diabviz/charts.py).
+Ekspor berikutnya hanya menggambar ulang chart yang inputnya berubah, jadi
+laporan bisa dibuat ulang secara terjadwal dengan murah.
+"""
+import argparse
+import base64
+import hashlib
+import html
+import importlib.util
+import json
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from diabviz import config, figures, texts
+from diabviz.cube import prevalence
+from diabviz.incremental import LiveDataset
+from diabviz.loader import file_stat
+from diabviz.render import SAVEFIG_KWARGS, theme_key
+from diabviz.scatter import POINT_BUDGET, binned_figure, webgl_figure, young_rows
+from diabviz.warmup import render_spec
+
+
+def _case_3_text(agg):
+    counts = figures.diabetic_location_counts(agg.cube)
+    return texts.case_3(counts) if not counts.empty else ''
+
+
+# (judul bagian, [(sub judul atau None, id chart), ...], teks penjelasan dari agregat)
+SECTIONS = [
+    ('Visualisasi Data Awal (EDA)', [
+        ('Distribusi Usia', 'eda_age'),
+        ('Korelasi BMI dan Tingkat Glukosa Darah', 'eda_corr'),
+        ('Distribusi Jenis Kelamin', 'eda_gender'),
+        ('Perbandingan Glukosa Darah berdasarkan Status Diabetes', 'eda_glucose_box'),
+    ], None),
+    ('Studi Kasus 1: Distribusi Kasus Diabetes di Berbagai Kelompok Usia',
+     [(None, 'case1_age')], lambda agg: texts.CASE_1),
+    ('Studi Kasus 2: Hubungan Jenis Kelamin dengan Prevalensi Hipertensi dan Penyakit Jantung',
+     [(None, 'case2_hypertension'), (None, 'case2_heart_disease')], lambda agg: texts.CASE_2),
+    ('Studi Kasus 3: Pola Geografis dalam Distribusi Kasus Diabetes',
+     [(None, 'case3_location')], _case_3_text),
+    ('Studi Kasus 4: Korelasi Ras dengan Prevalensi Diabetes',
+     [(None, 'case4_race')], lambda agg: texts.case_4(prevalence(agg.cube, 'race') * 100)),
+    ('Studi Kasus 5: Hubungan Riwayat Merokok dan Diabetes',
+     [(None, 'case5_smoking')], lambda agg: texts.CASE_5),
+    ('Studi Kasus 6: Bagaimana BMI mempengaruhi kemungkinan menderita diabetes',
+     [(None, 'case6_bmi_box')], lambda agg: texts.CASE_6),
+    ('Studi Kasus 7: Distribusi Tingkat HbA1c pada Individu dengan dan tanpa Diabetes',
+     [(None, 'case7_hba1c_box')], lambda agg: texts.CASE_7),
+    ('Studi Kasus 8: Variasi Tingkat Glukosa Darah berdasarkan Kelompok Usia',
+     [(None, 'case8_glucose_age_box')], lambda agg: texts.CASE_8),
+    ('Studi Kasus 9: Analisis Komorbiditas pada Penderita Diabetes',
+     [(None, 'case9_comorbidity')], lambda agg: texts.case_9(figures.comorbidity_shares(agg.cube))),
+    ('Studi Kasus 10: Tren Rata-rata BMI dan Kadar HbA1c dari Tahun ke Tahun',
+     [(None, 'case10_bmi_trend'), (None, 'case10_hba1c_trend')], lambda agg: texts.CASE_10),
+]
+
+SCATTER_TITLE = 'Studi Kasus 11: Hubungan BMI, Usia, dan Gula Darah'
+
+PAGE = """<!DOCTYPE html>
+<html lang="id">
+<head>
+<meta charset="utf-8">
+<title>Analisis Data Diabetes</title>
+<style>
+body {{ font-family: sans-serif; max-width: 1100px; margin: 2em auto; padding: 0 1em; color: #262730; }}
+section {{ margin-bottom: 3em; }}
+.charts {{ display: flex; flex-wrap: wrap; gap: 1em; }}
+.charts figure {{ flex: 1 1 45%; margin: 0; }}
+.charts img {{ width: 100%; }}
+</style>
+</head>
+<body>
+<h1>Visualisasi Data Diabetes</h1>
+<p>{summary}</p>
+{sections}
+</body>
+</html>
+"""
+
+
+def _fingerprint(obj, h):
+    """Menambahkan isi `obj` (data chart) ke hash `h` secara deterministik."""
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        h.update(repr(list(obj.columns) if isinstance(obj, pd.DataFrame) else obj.name).encode())
+        h.update(pd.util.hash_pandas_object(obj).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        h.update(f'{obj.dtype}{obj.shape}'.encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, dict):
+        for key, value in obj.items():
+            _fingerprint(key, h)
+            _fingerprint(value, h)
+    elif isinstance(obj, (list, tuple)):
+        h.update(f'{type(obj).__name__}{len(obj)}'.encode())
+        for value in obj:
+            _fingerprint(value, h)
+    else:
+        h.update(repr(obj).encode())
+
+
+def chart_digest(name, args, dpi):
+    """Sidik jari input sebuah chart: fungsi, data, tema, DPI, dan isi diabviz/charts.py."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(importlib.util.find_spec('diabviz.charts').origin, 'rb') as f:
+        h.update(f.read())
+    _fingerprint((name, args, theme_key(), dpi), h)
+    return h.hexdigest()
+
+
+def render_charts(aggregates, cache_dir, dpi, workers, force=False):
+    """PNG semua chart di `figures.FIGURES`; hanya chart yang inputnya berubah yang digambar ulang.
+
+    Mengembalikan ({id chart: PNG}, jumlah chart yang digambar ulang).
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    manifest_path = os.path.join(cache_dir, 'manifest.json')
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+
+    specs, stale = {}, []
+    for chart_id in figures.FIGURES:
+        name, args = figures.spec(chart_id, aggregates)
+        digest = chart_digest(name, args, dpi)
+        specs[chart_id] = (name, args, digest)
+        png_path = os.path.join(cache_dir, f'{chart_id}.png')
+        if force or manifest.get(chart_id) != digest or not os.path.exists(png_path):
+            stale.append(chart_id)
+
+    if stale and workers:
+        # Worker 'spawn' tidak mewarisi state proses ini; hanya (nama, argumen) yang dikirim
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            futures = {chart_id: pool.submit(render_spec, *specs[chart_id][:2], dpi) for chart_id in stale}
+            rendered = {chart_id: future.result() for chart_id, future in futures.items()}
+    else:
+        rendered = {chart_id: render_spec(*specs[chart_id][:2], dpi) for chart_id in stale}
+
+    for chart_id, png in rendered.items():
+        with open(os.path.join(cache_dir, f'{chart_id}.png'), 'wb') as f:
+            f.write(png)
+        manifest[chart_id] = specs[chart_id][2]
+    with open(manifest_path + '.tmp', 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(manifest_path + '.tmp', manifest_path)
+
+    pngs = {}
+    for chart_id in figures.FIGURES:
+        with open(os.path.join(cache_dir, f'{chart_id}.png'), 'rb') as f:
+            pngs[chart_id] = f.read()
+    return pngs, len(stale)
+
+
+def _inline(text):
+    text = html.escape(text, quote=False)
+    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
+    return re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
+
+
+def markdown_html(text):
+    """Konversi Markdown sederhana yang dipakai teks penjelasan (paragraf, daftar, tebal, miring)."""
+    out, paragraph, items, kind = [], [], [], None
+
+    def flush():
+        nonlocal paragraph, items, kind
+        if paragraph:
+            out.append('<p>' + ' '.join(_inline(line) for line in paragraph) + '</p>')
+        if items:
+            start = f' start="{items[0][0]}"' if kind == 'ol' and items[0][0] != '1' else ''
+            out.append(f'<{kind}{start}>' + ''.join(f'<li>{_inline(item)}</li>' for _, item in items) + f'</{kind}>')
+        paragraph, items, kind = [], [], None
+
+    for line in text.strip().splitlines():
+        line = line.strip()
+        bullet = re.match(r'^- (.*)$', line)
+        numbered = re.match(r'^(\d+)\. (.*)$', line)
+        if not line:
+            # Baris kosong di antara butir daftar tidak memutus daftar
+            if paragraph:
+                flush()
+        elif bullet or numbered:
+            new_kind = 'ul' if bullet else 'ol'
+            if paragraph or (kind and kind != new_kind):
+                flush()
+            kind = new_kind
+            items.append(('1', bullet.group(1)) if bullet else numbered.groups())
+        else:
+            if items:
+                flush()
+            paragraph.append(line)
+    flush()
+    return '\n'.join(out)
+
+
+def scatter_html(live):
+    """Bubble chart Studi Kasus 11 sebagai HTML Plotly (plotly.js disertakan) beserta interpretasinya."""
+    scatter = live.aggregates.scatter
+    if not scatter.n_rows:
+        return '<p>Tidak ada individu berusia 0–30 tahun.</p>'
+    binned = live.frame is None or scatter.n_rows > POINT_BUDGET
+    if binned:
+        fig = binned_figure(scatter.cells(), scatter.sample(),
+                            "Hubungan Usia (0–30), BMI, dan Rata-rata Gula Darah (Agregat + Sampel)")
+    else:
+        fig = webgl_figure(young_rows(live.frame), "Bubble Chart: Hubungan Usia (0–30), BMI, dan Kadar Gula Darah (WebGL)")
+    return fig.to_html(full_html=False, include_plotlyjs=True) + '\n' + markdown_html(texts.case_11(binned))
+
+
+def build_report(live, pngs):
+    aggregates = live.aggregates
+    sections = []
+    for title, charts, text in SECTIONS:
+        figures_html = []
+        for subtitle, chart_id in charts:
+            caption = f'<figcaption><h3>{html.escape(subtitle)}</h3></figcaption>' if subtitle else ''
+            data = base64.b64encode(pngs[chart_id]).decode()
+            figures_html.append(f'<figure>{caption}<img src="data:image/png;base64,{data}" alt="{chart_id}"></figure>')
+        body = markdown_html(text(aggregates)) if text else ''
+        sections.append(f'<section><h2>{html.escape(title)}</h2>\n<div class="charts">{"".join(figures_html)}</div>\n{body}</section>')
+    sections.append(f'<section><h2>{html.escape(SCATTER_TITLE)}</h2>\n{scatter_html(live)}</section>')
+    summary = f'Dibuat dari {html.escape(live.file_path)} ({aggregates.n_rows:,} baris).'
+    return PAGE.format(summary=summary, sections='\n'.join(sections))
+
+
+def export(out_path, data_path=config.FILE_PATH, dpi=SAVEFIG_KWARGS['dpi'], workers=None, cache_dir=None, force=False):
+    """Menulis laporan HTML ke `out_path`; mengembalikan jumlah chart yang digambar ulang."""
+    stat = file_stat(data_path)
+    if stat is None:
+        raise FileNotFoundError(data_path)
+    live = LiveDataset(data_path, config.BATCH_DIR, config.use_streaming(stat), config.CHUNK_ROWS)
+    cache_dir = cache_dir or os.path.splitext(out_path)[0] + '_cache'
+    workers = config.WARMUP_WORKERS if workers is None else workers
+    pngs, n_rendered = render_charts(live.aggregates, cache_dir, dpi, workers, force)
+
+    os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+    with open(out_path + '.tmp', 'w', encoding='utf-8') as f:
+        f.write(build_report(live, pngs))
+    os.replace(out_path + '.tmp', out_path)
+    return n_rendered
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--out', default='laporan_diabetes.html')
+    parser.add_argument('--data', default=config.FILE_PATH)
+    parser.add_argument('--dpi', type=int, default=SAVEFIG_KWARGS['dpi'])
+    parser.add_argument('--workers', type=int, default=None, help='jumlah proses render (0 = tanpa pool)')
+    parser.add_argument('--cache-dir', default=None, help='bawaan: <out>_cache di samping laporan')
+    parser.add_argument('--force', action='store_true', help='gambar ulang semua chart')
+    args = parser.parse_args()
+    n_rendered = export(args.out, args.data, args.dpi, args.workers, args.cache_dir, args.force)
+    print(f'{n_rendered} dari {len(figures.FIGURES)} chart digambar ulang; laporan disimpan di {args.out}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+"""Sampel berstrata untuk mode pratinjau (chart aproksimasi yang cepat).
+
+`StratifiedSample` menyimpan sampel acak per strata `STRATA` (status diabetes
+x lokasi x kelompok usia). Alokasinya proporsional terhadap ukuran strata
+dengan minimal `MIN_PER_STRATUM` baris, sehingga kelompok langka tetap
+terwakili. Sampel di-update per chunk dan bisa digabung: setiap baris diberi
+kunci acak dan setiap strata menyimpan baris dengan kunci terkecil (di bawah
+batas `tau` strata tersebut), sehingga hasilnya tetap sampel acak sederhana
+per strata walaupun data datang bertahap.
+
+`design()` menghasilkan `SampleDesign`: baris sampel, strata tiap baris, dan
+ukuran strata di populasi. Dari situ jumlah diskalakan dengan bobot
+N_h / n_h, dan interval kepercayaan dihitung dengan rumus variansi sampel
+berstrata (rasio dengan linearisasi Taylor).
+"""
+import numpy as np
+import pandas as pd
+
+STRATA = ['diabetes', 'location', 'age_group']
+MIN_PER_STRATUM = 30
+Z_95 = 1.959963984540054
+
+
+def _concat(frames):
+    """pd.concat yang mempertahankan kolom kategorikal (kategori digabung)."""
+    result = pd.concat(frames, ignore_index=True)
+    for col in frames[0].columns:
+        if isinstance(frames[0][col].dtype, pd.CategoricalDtype) and not isinstance(result[col].dtype, pd.CategoricalDtype):
+            result[col] = result[col].astype('category')
+    return result
+
+
+def _group(frame):
+    return frame.groupby(STRATA, observed=True, dropna=False, sort=False)
+
+
+class StratifiedSample:
+    """Sampel berstrata berukuran sekitar `size` baris yang bisa di-update per chunk dan digabung."""
+
+    def __init__(self, size, seed=0):
+        self.size = size
+        # Per strata: ukuran populasi N dan batas kunci tau (baris dengan kunci < tau ada di sampel)
+        self.strata = None
+        self.rows = None
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def n_rows(self):
+        """Jumlah baris populasi yang sudah dilihat."""
+        return 0 if self.strata is None else int(self.strata['N'].sum())
+
+    def update(self, chunk):
+        if not self.size or chunk.empty:
+            return self
+        part = StratifiedSample(self.size)
+        part.rows = chunk.assign(_key=self._rng.random(len(chunk)))
+        part.strata = _group(chunk).size().rename('N').reset_index().assign(tau=1.0)
+        merged = self.merge(part)
+        self.strata, self.rows = merged.strata, merged.rows
+        return self
+
+    def merge(self, other):
+        if other.strata is None:
+            return self
+        parts = [p for p in (self, other) if p.strata is not None]
+        merged = StratifiedSample(self.size)
+        strata = _concat([p.strata for p in parts])
+        merged.strata = _group(strata).agg(N=('N', 'sum'), tau=('tau', 'min')).reset_index()
+        merged.rows = _concat([p.rows for p in parts])
+        merged._trim()
+        return merged
+
+    def _trim(self):
+        """Menyisakan baris dengan kunci terkecil sebanyak kuota per strata dan memperbarui `tau`."""
+        strata = self.strata
+        quota = np.minimum(np.maximum(np.ceil(self.size * strata['N'] / strata['N'].sum()), MIN_PER_STRATUM), strata['N'])
+        info = strata[STRATA].assign(_tau=strata['tau'], _quota=quota)
+        rows = self.rows.sort_values('_key', ignore_index=True)
+        joined = rows[STRATA].merge(info, on=STRATA, how='left')
+        below = rows['_key'].to_numpy() < joined['_tau'].to_numpy()
+        rows, joined = rows[below], joined[below]
+        keep = _group(rows).cumcount().to_numpy() < joined['_quota'].to_numpy()
+        cut = _group(rows[~keep])['_key'].min().rename('_cut').reset_index()
+        strata = strata.merge(cut, on=STRATA, how='left')
+        strata['tau'] = np.fmin(strata['tau'], strata.pop('_cut'))
+        self.strata, self.rows = strata, rows[keep].reset_index(drop=True)
+
+    def design(self):
+        """`SampleDesign` untuk estimasi dari sampel saat ini (None jika sampel kosong)."""
+        if self.rows is None:
+            return None
+        codes = self.rows[STRATA].merge(self.strata[STRATA].assign(_code=np.arange(len(self.strata))), on=STRATA, how='left')
+        return SampleDesign(self.rows.drop(columns='_key'), codes['_code'].to_numpy(), self.strata['N'].to_numpy(float))
+
+
+class SampleDesign:
+    """Baris sampel + strata tiap baris (`codes`) + ukuran populasi per strata (`population`)."""
+
+    def __init__(self, rows, codes, population):
+        self.rows = rows
+        self.codes = codes
+        self.population = population
+        self.sampled = np.bincount(codes, minlength=len(population)).astype(float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.weights = (population / self.sampled)[codes]
+
+    @property
+    def n_population(self):
+        return int(self.population.sum())
+
+    def mask(self, filters):
+        """Mask baris sampel yang lolos `filters` ((kolom, nilai-nilai), ...), seperti `BitmapIndex.select`."""
+        mask = np.ones(len(self.rows), bool)
+        for col, values in filters:
+            mask &= self.rows[col].isin(values).to_numpy()
+        return mask
+
+    def total(self, y):
+        """(estimasi, variansi) total populasi dari nilai `y` per baris sampel."""
+        y = np.asarray(y, float)
+        n, N = self.sampled, self.population
+        sums = np.bincount(self.codes, weights=y, minlength=len(N))
+        sumsq = np.bincount(self.codes, weights=y * y, minlength=len(N))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(n > 0, sums / n, 0)
+            s2 = np.where(n > 1, (sumsq - n * mean ** 2) / (n - 1), 0)
+            variance = np.where(n > 0, N ** 2 * (1 - n / N) * np.maximum(s2, 0) / n, 0)
+        return float((N * mean).sum()), float(variance.sum())
+
+    def total_interval(self, y, z=Z_95):
+        """(estimasi, batas bawah, batas atas) total populasi; batas bawah tidak negatif."""
+        estimate, variance = self.total(y)
+        half = z * np.sqrt(variance)
+        return estimate, max(estimate - half, 0.0), estimate + half
+
+    def ratio_interval(self, y, x, z=Z_95):
+        """(estimasi, batas bawah, batas atas) rasio total y / total x, misalnya proporsi dalam subkelompok."""
+        y, x = np.asarray(y, float), np.asarray(x, float)
+        total_x, _ = self.total(x)
+        if not total_x:
+            return np.nan, np.nan, np.nan
+        ratio = self.total(y)[0] / total_x
+        _, variance = self.total(y - ratio * x)
+        half = z * np.sqrt(variance) / total_x
+        return ratio, max(ratio - half, 0.0), min(ratio + half, 1.0)
+
+
+def _interval_table(rows, labels):
+    return pd.DataFrame(rows, index=pd.Index(labels), columns=['Estimasi', 'Batas Bawah (95%)', 'Batas Atas (95%)'])
+
+
+# --- Interval kepercayaan untuk Studi Kasus 3, 4, dan 9 ---
+
+def location_count_intervals(design, mask):
+    """Perkiraan jumlah penderita diabetes per lokasi beserta interval 95%."""
+    rows = design.rows
+    diabetic = mask & (rows['diabetes'] == 1).to_numpy()
+    locations = sorted(rows.loc[diabetic, 'location'].dropna().unique())
+    values = [design.total_interval(diabetic & (rows['location'] == loc).to_numpy()) for loc in locations]
+    return _interval_table(values, locations).round(0)
+
+
+def race_prevalence_intervals(design, mask):
+    """Perkiraan prevalensi diabetes (%) per ras beserta interval 95%."""
+    rows = design.rows
+    diabetic = (rows['diabetes'] == 1).to_numpy()
+    races = sorted(rows.loc[mask, 'race'].dropna().unique())
+    values = []
+    for race in races:
+        in_race = mask & (rows['race'] == race).to_numpy()
+        values.append(design.ratio_interval(in_race & diabetic, in_race))
+    return (_interval_table(values, races) * 100).round(2)
+
+
+def comorbidity_intervals(design, mask, labels):
+    """Perkiraan persentase hipertensi, penyakit jantung, dan perokok aktif di antara penderita diabetes."""
+    rows = design.rows
+    diabetic = mask & (rows['diabetes'] == 1).to_numpy()
+    flags = [rows['hypertension'] == 1, rows['heart_disease'] == 1, rows['smoking_history'] == 'current']
+    values = [design.ratio_interval(diabetic & flag.to_numpy(), diabetic) for flag in flags]
+    return (_interval_table(values, labels) * 100).round(2)
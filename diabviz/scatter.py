@@ -0,0 +1,170 @@
+"""Level-of-detail untuk bubble chart Studi Kasus 11 (usia x BMI x glukosa).
+
+Mengirim puluhan ribu marker SVG ke browser membuat payload besar dan lambat.
+Di bawah `POINT_BUDGET` titik, semua data digambar dengan WebGL (`scattergl`).
+Di atasnya, data diringkas di server menjadi grid 2D usia x BMI (jumlah dan
+rata-rata glukosa per sel) ditambah sampel terstratifikasi. Setiap kelas punya
+kuota `SAMPLE_BUDGET` titik sendiri: semua penderita diabetes disimpan selama
+jumlahnya muat (di atasnya diambil sampel acak), dan non-diabetes diambil
+dengan fraksi yang sama per tahun usia, sehingga kedua kelas selalu tampil.
+"""
+import numpy as np
+import pandas as pd
+
+POINT_BUDGET = 20_000
+# Kuota sampel per kelas (diabetes dan non-diabetes masing-masing)
+SAMPLE_BUDGET = 5_000
+AGE_RANGE = (0, 30)
+COLORS = ["#5dade2", "#fd7e14"]
+DIABETES_LABELS = {0: 'Tidak', 1: 'Ya'}
+
+SCATTER_COLUMNS = ['age', 'bmi', 'blood_glucose_level', 'hbA1c_level', 'diabetes']
+
+
+def young_rows(df):
+    """Baris dengan usia dalam `AGE_RANGE`, hanya kolom yang dipakai chart."""
+    lo, hi = AGE_RANGE
+    return df.loc[(df['age'] >= lo) & (df['age'] <= hi), SCATTER_COLUMNS]
+
+
+def cell_sums(rows, age_step=1.0, bmi_step=2.0):
+    """Jumlah titik, total glukosa, dan total diabetes per sel grid usia x BMI (bisa dijumlahkan antar chunk)."""
+    cells = pd.DataFrame({
+        'age': (np.floor(rows['age'].to_numpy() / age_step) + 0.5) * age_step,
+        'bmi': (np.floor(rows['bmi'].to_numpy() / bmi_step) + 0.5) * bmi_step,
+        'blood_glucose_level': rows['blood_glucose_level'].to_numpy(),
+        'diabetes': rows['diabetes'].to_numpy(),
+    })
+    return cells.groupby(['age', 'bmi'], sort=False).agg(
+        count=('blood_glucose_level', 'size'),
+        glucose_sum=('blood_glucose_level', 'sum'),
+        diabetes_sum=('diabetes', 'sum'),
+    )
+
+
+def finish_cells(sums):
+    """Mengubah jumlah per sel menjadi rata-rata glukosa dan proporsi diabetes."""
+    return pd.DataFrame({
+        'count': sums['count'],
+        'glucose_mean': sums['glucose_sum'] / sums['count'],
+        'diabetes_share': sums['diabetes_sum'] / sums['count'],
+    }).reset_index()
+
+
+class ScatterAccumulator:
+    """Grid usia x BMI dan sampel berstrata untuk bubble chart, di-update per chunk.
+
+    Sampel memakai kunci acak per baris: setiap strata (tahun usia untuk
+    non-diabetes, satu strata untuk diabetes) menyimpan baris dengan kunci
+    terkecil. Karena kunci terkecil dari gabungan sama dengan kunci terkecil
+    dari masing-masing bagian, hasil akhirnya setara dengan sampel acak
+    berstrata atas seluruh data, dengan memori terbatas.
+    """
+
+    def __init__(self, budget=SAMPLE_BUDGET, seed=0):
+        self.budget = budget
+        self.n_rows = 0
+        self.sums = None
+        self.strata_counts = pd.Series(dtype='int64')
+        self.candidates = None
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, chunk):
+        rows = young_rows(chunk)
+        if rows.empty:
+            return self
+        self.n_rows += len(rows)
+        sums = cell_sums(rows)
+        self.sums = sums if self.sums is None else self.sums.add(sums, fill_value=0)
+
+        stratum = np.where(rows['diabetes'].to_numpy() == 1, -1, np.floor(rows['age'].to_numpy()))
+        rows = rows.assign(_stratum=stratum, _key=self._rng.random(len(rows)))
+        self.strata_counts = self.strata_counts.add(rows['_stratum'].value_counts(), fill_value=0)
+        self._keep([self.candidates, rows])
+        return self
+
+    def _keep(self, parts):
+        # Cukup simpan `budget` kunci terkecil per strata; alokasi akhir tidak pernah melebihinya
+        candidates = pd.concat([p for p in parts if p is not None], ignore_index=True).sort_values('_key')
+        self.candidates = candidates.groupby('_stratum', sort=False).head(self.budget)
+
+    def merge(self, other):
+        merged = ScatterAccumulator(self.budget)
+        merged.n_rows = self.n_rows + other.n_rows
+        parts = [s for s in (self.sums, other.sums) if s is not None]
+        merged.sums = parts[0].add(parts[1], fill_value=0) if len(parts) == 2 else (parts[0] if parts else None)
+        merged.strata_counts = self.strata_counts.add(other.strata_counts, fill_value=0)
+        if self.candidates is not None or other.candidates is not None:
+            merged._keep([self.candidates, other.candidates])
+        return merged
+
+    def cells(self):
+        return finish_cells(self.sums)
+
+    def sample(self):
+        """Penderita diabetes (semua, atau sampel acak `budget` baris) ditambah maksimal `budget` non-diabetes dengan fraksi sama per strata."""
+        diabetic = self.candidates[self.candidates['_stratum'] == -1]
+        others = self.candidates[self.candidates['_stratum'] != -1]
+        n_others = self.strata_counts.drop(-1, errors='ignore').sum()
+        if n_others > self.budget:
+            quota = np.floor(self.strata_counts * self.budget / n_others)
+            others = others[others.groupby('_stratum').cumcount() < others['_stratum'].map(quota)]
+        return pd.concat([others, diabetic])[SCATTER_COLUMNS]
+
+
+def _with_labels(rows):
+    return rows.assign(diabetes=rows['diabetes'].map(DIABETES_LABELS))
+
+
+def webgl_figure(rows, title):
+    """Bubble chart semua titik dengan renderer WebGL."""
+    import plotly.express as px
+
+    fig = px.scatter(
+        _with_labels(rows),
+        x="age",
+        y="bmi",
+        color="diabetes",
+        size="blood_glucose_level",
+        hover_data=["hbA1c_level"],
+        color_discrete_sequence=COLORS,
+        category_orders={'diabetes': list(DIABETES_LABELS.values())},
+        labels={'diabetes': 'Status Diabetes', 'age': 'Usia', 'bmi': 'BMI'},
+        render_mode='webgl',
+        title=title,
+    )
+    fig.update_traces(marker=dict(
+        sizeref=2. * rows['blood_glucose_level'].max() / (40. ** 2),
+        sizemode='area',
+        opacity=0.65,
+    ))
+    return fig
+
+
+def binned_figure(cells, sample, title):
+    """Grid agregat (ukuran = jumlah titik, warna = rata-rata glukosa) dengan sampel di atasnya."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=cells['age'], y=cells['bmi'], mode='markers', name='Agregat sel',
+        marker=dict(
+            size=cells['count'], sizemode='area', sizeref=2. * cells['count'].max() / (30. ** 2), sizemin=2,
+            color=cells['glucose_mean'], colorscale='Viridis', opacity=0.55,
+            colorbar=dict(title='Rata-rata<br>Glukosa'),
+        ),
+        customdata=np.column_stack([cells['count'], cells['glucose_mean'], cells['diabetes_share'] * 100]),
+        hovertemplate=('Usia %{x}, BMI %{y}<br>Jumlah: %{customdata[0]:.0f}'
+                       '<br>Rata-rata glukosa: %{customdata[1]:.1f}'
+                       '<br>Diabetes: %{customdata[2]:.1f}%<extra></extra>'),
+    ))
+    for value, label in DIABETES_LABELS.items():
+        points = sample[sample['diabetes'] == value]
+        fig.add_trace(go.Scattergl(
+            x=points['age'], y=points['bmi'], mode='markers', name=f'Sampel - Diabetes: {label}',
+            marker=dict(size=4, color=COLORS[value], opacity=0.6),
+            customdata=points[['blood_glucose_level', 'hbA1c_level']].to_numpy(),
+            hovertemplate='Usia %{x}, BMI %{y}<br>Glukosa: %{customdata[0]}<br>HbA1c: %{customdata[1]}<extra></extra>',
+        ))
+    fig.update_layout(title=title, xaxis_title='Usia', yaxis_title='BMI')
+    return fig
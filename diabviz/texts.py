@@ -0,0 +1,144 @@
+"""Teks penjelasan studi kasus (Markdown), dipakai oleh app.py dan laporan statis (diabviz/report.py).
+
+Teks yang memuat angka dari data berupa fungsi yang menerima hasil agregasi.
+Interval kepercayaan (tabel dari diabviz/bootstrap.py) opsional; jika ada,
+ditampilkan di samping angkanya.
+"""
+
+
+def _interval(intervals, label, digits):
+    """'IK 95%: a–b%' untuk baris `label` di `intervals`, atau '' jika tidak ada."""
+    if intervals is None or label not in intervals.index:
+        return ''
+    lower, upper = intervals.loc[label, ['Batas Bawah (95%)', 'Batas Atas (95%)']]
+    if lower != lower:  # NaN: tidak ada baris di kelompok ini
+        return ''
+    return f"IK 95%: {lower:.{digits}f}–{upper:.{digits}f}%"
+
+CASE_1 = """
+Visualisasi menunjukkan konsentrasi tertinggi kasus diabetes berada pada kelompok usia yang lebih tua, mengonfirmasi kembali bahwa **usia lanjut adalah faktor risiko yang dominan** dalam dataset ini. Kurva kepadatan (KDE) yang tumpang tindih memberikan estimasi bentuk distribusi probabilitas usia untuk populasi penderita diabetes.
+"""
+
+
+CASE_2 = """
+Visualisasi untuk Studi Kasus 2 yang menampilkan prevalensi hipertensi dan penyakit jantung berdasarkan gender menunjukkan bahwa dalam dataset ini, individu pria memiliki jumlah kasus hipertensi yang secara signifikan lebih tinggi dan juga jumlah kasus penyakit jantung yang lebih banyak dibandingkan dengan individu wanita; ini mengindikasikan adanya korelasi yang jelas antara gender pria dan peningkatan prevalensi kedua kondisi kesehatan ini dalam data yang diamati.
+"""
+
+
+def case_3(location_counts):
+    """Penjelasan Studi Kasus 3; `location_counts` = jumlah penderita diabetes per lokasi, urut naik."""
+    max_location = location_counts.index[-1]
+    max_count = location_counts.values[-1]
+    min_location = location_counts.index[0]
+    min_count = location_counts.values[0]
+    return f"""
+Visualisasi ini menunjukkan distribusi kasus diabetes di berbagai lokasi (negara bagian). Dari plot ini, jelas terlihat bahwa jumlah kasus diabetes sangat bervariasi di setiap lokasi, menunjukkan adanya pola geografis dalam prevalensi diabetes. Berdasarkan analisis data yang telah dilakukan, Delaware adalah lokasi dengan jumlah kasus diabetes terbanyak, yaitu sebanyak 200 kasus. Ini mengindikasikan bahwa prevalensi diabetes paling tinggi dalam dataset ini ditemukan di Delaware.
+
+Visualisasi ini menampilkan **hanya pasien yang menderita diabetes** di berbagai lokasi (negara bagian) dengan sistem gradasi warna:
+
+- 🟡 **Warna Kuning Muda**: Lokasi dengan kasus diabetes lebih sedikit
+- 🟠 **Warna Oranye**: Lokasi dengan kasus diabetes sedang
+- 🔴 **Warna Merah**: Lokasi dengan kasus diabetes paling banyak
+
+**Temuan Utama:**
+- **{max_location}** memiliki kasus diabetes tertinggi dengan **{max_count} kasus** (bar paling merah)
+- **{min_location}** memiliki kasus diabetes terendah dengan **{min_count} kasus** (bar paling kuning muda)
+"""
+
+
+def case_4(race_prev, intervals=None):
+    """Penjelasan Studi Kasus 4; `race_prev` = prevalensi diabetes (%) per ras, `intervals` = interval per ras."""
+    top_race, low_race = race_prev.idxmax(), race_prev.idxmin()
+    top, low = (
+        f"{race_prev[race]:.2f}%" + (f"; {note}" if (note := _interval(intervals, race, 2)) else '')
+        for race in (top_race, low_race)
+    )
+    return f"""
+Visualisasi ini menampilkan diagram lingkaran (pie chart) untuk masing-masing ras,
+membandingkan proporsi individu dengan diabetes dan tanpa diabetes.
+Setiap lingkaran merepresentasikan satu kelompok ras:
+- Warna biru mewakili individu tanpa diabetes  
+- Warna hijau menunjukkan individu dengan diabetes  
+
+Dari grafik terlihat bahwa proporsi penderita diabetes relatif kecil (<10%) di semua ras,
+dengan prevalensi tertinggi pada {top_race} ({top}) dan terendah pada {low_race} ({low}).
+Hal ini menunjukkan bahwa meskipun ada perbedaan antar ras, tingkat prevalensinya tetap cukup seragam.
+"""
+
+
+CASE_5 = """
+Visualisasi menunjukkan distribusi riwayat merokok berdasarkan status diabetes. Mayoritas individu, baik penderita maupun non-penderita diabetes, berada pada kategori never dan No Info. Sementara itu, kategori current dan former memiliki jumlah jauh lebih sedikit. Secara keseluruhan, perbedaan antar kategori kecil, sehingga riwayat merokok tidak tampak berpengaruh signifikan terhadap kejadian diabetes.
+"""
+
+
+CASE_6 = """
+Visualisasi box plot terlihat bahwa individu dengan diabetes cenderung memiliki BMI lebih tinggi dibandingkan dengan individu yang tidak menderita diabetes. Median BMI pada kelompok penderita diabetes juga lebih besar, menunjukkan bahwa berat badan berlebih atau obesitas mungkin berhubungan dengan meningkatnya risiko diabetes. Selain itu, kedua kelompok memiliki beberapa outlier dengan nilai BMI sangat tinggi, namun pola umumnya tetap menunjukkan bahwa semakin tinggi BMI, semakin besar kemungkinan seseorang memiliki diabetes.
+"""
+
+
+CASE_7 = """
+Visualisasi box plot tingkat HbA1c menunjukkan individu dengan diabetes memiliki nilai HbA1c yang secara signifikan lebih tinggi dibandingkan individu tanpa diabetes. Median HbA1c pada kelompok penderita diabetes berada di sekitar 6.5–7, sedangkan pada kelompok tanpa diabetes berada di bawah 6. Hal ini menunjukkan adanya perbedaan yang jelas antara kedua kelompok, di mana kenaikan kadar HbA1c berhubungan kuat dengan adanya diabetes.
+"""
+
+
+CASE_8 = """
+Visualisasi box plot tingkat glukosa darah berdasarkan kelompok usia menunjukkan bahwa rata-rata kadar glukosa darah cenderung meningkat seiring bertambahnya usia, terutama mulai pada kelompok umur 60–74 tahun. Meskipun median kadar glukosa antar kelompok tidak berbeda terlalu jauh, kelompok usia yang lebih tua menunjukkan peningkatan nilai minimum dan median serta lebih banyak outlier dengan kadar glukosa tinggi. Hal ini mengindikasikan bahwa risiko kadar gula darah tinggi (hiperglikemia) lebih umum terjadi pada usia lanjut dibandingkan usia muda.
+"""
+
+
+def case_9(sizes, intervals=None):
+    """Penjelasan Studi Kasus 9; `sizes` = persentase hipertensi, penyakit jantung, dan perokok aktif.
+
+    `intervals` berindeks label komorbiditas (Hipertensi, Penyakit Jantung, Perokok Aktif).
+    """
+    labels = ['Hipertensi', 'Penyakit Jantung', 'Perokok Aktif']
+    sizes = [
+        f"{size:.1f}%" + (f" ({note})" if (note := _interval(intervals, label, 1)) else '')
+        for size, label in zip(sizes, labels)
+    ]
+    return """
+Visualisasi ini menggunakan *radial bar chart* untuk menggambarkan tiga komorbiditas utama pada individu penderita diabetes:
+
+- *Hipertensi:* ~{} dari penderita diabetes juga memiliki hipertensi  
+- *Penyakit Jantung:* ~{} memiliki penyakit jantung  
+- *Perokok Aktif:* ~{} memiliki riwayat merokok aktif  
+
+Grafik ini menyoroti bagaimana ketiga faktor tersebut saling beririsan dengan kondisi diabetes. Terlihat bahwa hipertensi menjadi komorbiditas paling umum, diikuti oleh penyakit jantung, sedangkan proporsi perokok aktif relatif lebih kecil.
+""".format(sizes[0], sizes[1], sizes[2])
+
+
+CASE_10 = """
+Visualisasi line plot rata-rata BMI dan HbA1c dari tahun ke tahun menunjukkan tren rata-rata BMI dan HbA1c level dari tahun 2015 hingga 2022. Grafik pertama memperlihatkan bahwa rata-rata BMI cenderung fluktuatif, mengalami sedikit peningkatan hingga 2021 sebelum menurun tajam pada 2022. Sementara itu, grafik kedua menunjukkan bahwa rata-rata HbA1c level relatif stabil dari 2015 sampai 2019, kemudian menurun pada 2020–2021, dan meningkat cukup signifikan pada 2022. Secara keseluruhan, kedua grafik memberikan gambaran mengenai perubahan pola kesehatan (berdasarkan BMI dan kadar gula darah) dari waktu ke waktu.
+"""
+
+
+def case_11(binned):
+    """Interpretasi Studi Kasus 11; `binned` True jika chart berupa grid agregat + sampel, bukan semua titik."""
+    if binned:
+        source = (
+            "Karena jumlah titiknya besar, data dalam rentang usia tersebut diringkas menjadi grid usia x BMI, "
+            "ditambah sampel titik individu berstrata menurut status diabetes."
+        )
+        encoding = """1. Sumbu X menunjukkan usia dan sumbu Y menunjukkan BMI.
+
+2. Setiap lingkaran besar adalah satu sel grid: ukurannya mewakili jumlah individu di sel tersebut dan warnanya rata-rata kadar gula darah.
+
+3. Titik kecil adalah sampel individu, diwarnai menurut status diabetes. Penderita diabetes disimpan semua selama jumlahnya muat dalam kuota sampel, dan non-diabetes diambil dengan fraksi yang sama di setiap tahun usia."""
+    else:
+        source = "Semua individu dalam rentang usia tersebut digambar sebagai titik."
+        encoding = """1. Sumbu X menunjukkan usia.
+
+2. Sumbu Y menunjukkan BMI.
+
+3. Ukuran lingkaran mewakili kadar gula darah (semakin besar, semakin tinggi kadar gula).
+
+4. Warna menunjukkan status diabetes, memisahkan individu yang diabetes dan non-diabetes."""
+    return f"""
+*Interpretasi:*
+
+Visualisasi ini menampilkan hubungan antara usia, BMI, dan kadar gula darah pada individu berusia 0 hingga 30 tahun. {source}
+
+{encoding}
+
+Dari grafik ini, kita dapat mengamati pola kesehatan pada kelompok usia muda, termasuk kecenderungan bahwa individu dengan BMI lebih tinggi sering memiliki kadar gula darah yang lebih besar, yang bisa mengarah pada risiko diabetes lebih awal.
+"""
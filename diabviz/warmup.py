@@ -0,0 +1,110 @@
+"""Pre-render paralel semua chart statis di `ProcessPoolExecutor`.
+
+Matplotlib tidak thread-safe, jadi tanpa warm-up halaman menggambar chart satu
+per satu di jalur request. `Warmup` mengirim setiap chart (nama fungsi chart +
+data kecilnya, lihat diabviz/figures.py) ke proses worker, yang menggambar dan
+meng-encode satu figure lalu mengirim balik byte gambarnya. Gambar dimasukkan ke
+`FigureCache` bersama, dan chart yang masih dirender bisa ditunggu dengan
+`wait()` sehingga tidak digambar dua kali.
+
+Worker dibuat dengan metode 'spawn' karena server Streamlit sudah
+menjalankan banyak thread (fork dari proses multi-thread tidak aman).
+Streamlit memasang modul app.py sebagai `__main__`, dan proses 'spawn'
+mengimpor ulang `__main__`; agar worker tidak ikut menjalankan seluruh app,
+`__main__` disembunyikan sebentar saat worker dibuat (lihat `_bare_main`).
+Penggantian ini dijaga satu lock tingkat modul, karena dipakai juga oleh pool
+lain (diabviz/bootstrap.py) dari thread sesi yang berbeda.
+"""
+import atexit
+import multiprocessing
+import sys
+import threading
+import types
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+
+from diabviz import perf
+from diabviz.render import encode_figure
+
+# Batas waktu default (detik) menunggu chart yang sedang dirender di worker
+WAIT_SECONDS = 30
+
+_main_lock = threading.Lock()
+
+
+@contextmanager
+def _bare_main():
+    with _main_lock:
+        main = sys.modules['__main__']
+        sys.modules['__main__'] = types.ModuleType('__main__')
+        try:
+            yield
+        finally:
+            sys.modules['__main__'] = main
+
+
+def _init_worker():
+    # Memuat Matplotlib/seaborn (dan tema) sebelum tugas pertama
+    import diabviz.charts  # noqa: F401
+
+
+def render_spec(name, args, dpi, **output):
+    """Menggambar `charts.<name>(*args)` dan mengembalikan byte gambarnya (dijalankan di worker).
+
+    `output` adalah sisa preset output (format, max_width, colors; lihat `render.CHART_PRESETS`).
+    """
+    from diabviz import charts
+
+    return encode_figure(getattr(charts, name)(*args), dpi=dpi, **output)
+
+
+class Warmup:
+    """Antrean render PNG di proses worker yang hasilnya masuk ke `cache`; pool ditutup saat proses keluar."""
+
+    def __init__(self, cache, max_workers=None):
+        self.cache = cache
+        self._pool = ProcessPoolExecutor(
+            max_workers, mp_context=multiprocessing.get_context('spawn'), initializer=_init_worker,
+        )
+        self._pending = {}
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown)
+
+    def submit(self, key, build, output):
+        """Menjadwalkan render untuk `key` jika belum ada di cache; `build()` -> (nama fungsi chart, argumen).
+
+        `output` adalah preset output chart (lihat `render.CHART_PRESETS`).
+        """
+        with self._lock:
+            if key in self._pending or key in self.cache:
+                return
+            name, args = build()
+            # Worker baru dibuat saat submit jika belum ada worker yang menganggur
+            with _bare_main():
+                future = self._pool.submit(render_spec, name, args, **output)
+            self._pending[key] = future
+        future.add_done_callback(lambda f: self._done(key, f))
+
+    def _done(self, key, future):
+        with self._lock:
+            self._pending.pop(key, None)
+        if not future.cancelled() and future.exception() is None:
+            self.cache.put(key, future.result())
+
+    def wait(self, key, timeout=WAIT_SECONDS):
+        """PNG untuk `key` jika sedang dirender di worker (menunggu paling lama `timeout` detik), selain itu None."""
+        with self._lock:
+            future = self._pending.get(key)
+        if future is None:
+            return None
+        try:
+            png = future.result(timeout)
+        except Exception:
+            # Worker gagal atau terlalu lama: biarkan pemanggil menggambar sendiri
+            return None
+        perf.count_cache('figure_warmup', hit=True)
+        return png
+
+    def shutdown(self):
+        atexit.unregister(self.shutdown)
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,8 @@
+from bench.generate import generate
+from diabviz.loader import MEMORY_TARGET_BYTES_PER_ROW, load_frame
+
+
+def test_loaded_frame_meets_memory_target(tmp_path):
+    df = load_frame(generate(20_000, str(tmp_path / 'diabetes.csv')))
+    assert len(df) == 20_000
+    assert df.memory_usage(deep=True).sum() / len(df) <= MEMORY_TARGET_BYTES_PER_ROW
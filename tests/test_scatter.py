@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from diabviz.scatter import SAMPLE_BUDGET, ScatterAccumulator
+
+
+def _young_rows(n, diabetes, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'age': rng.uniform(0, 30, n),
+        'bmi': rng.uniform(15, 40, n),
+        'blood_glucose_level': rng.integers(80, 300, n),
+        'hbA1c_level': rng.uniform(4, 9, n).round(1),
+        'diabetes': np.full(n, diabetes, dtype='int8'),
+    })
+
+
+def test_sample_keeps_both_classes_when_diabetics_exceed_budget():
+    diabetic = _young_rows(SAMPLE_BUDGET * 3, 1, seed=0)
+    others = _young_rows(SAMPLE_BUDGET * 10, 0, seed=1)
+    rows = pd.concat([diabetic, others]).sample(frac=1, random_state=2)
+    scatter = ScatterAccumulator()
+    for start in range(0, len(rows), 20_000):
+        scatter.update(rows.iloc[start:start + 20_000])
+
+    counts = scatter.sample()['diabetes'].value_counts()
+    assert counts[1] == SAMPLE_BUDGET
+    assert 0 < counts[0] <= SAMPLE_BUDGET
+
+
+def test_sample_keeps_all_diabetics_within_budget():
+    scatter = ScatterAccumulator().update(pd.concat([_young_rows(300, 1, seed=0), _young_rows(20_000, 0, seed=1)]))
+    counts = scatter.sample()['diabetes'].value_counts()
+    assert counts[1] == 300
+    assert counts[0] <= SAMPLE_BUDGET